@@ -0,0 +1,83 @@
+"""
+Feed parser benchmark
+
+Parses the feed fixtures in benchmarks/fixtures/ with feedparser ("before")
+and with the streaming parse_feed_fast path ("after"), both unlimited and with
+the per-feed limits the endpoints use, and reports the median time per parse.
+It also checks that both parsers agree on the fields the endpoints read.
+
+The fixtures reproduce the markup of a Reddit subreddit Atom feed, a Substack
+RSS feed and a Medium tag RSS feed; drop real captures alongside them
+(*.xml) to benchmark those too.
+
+Usage (from management-hub/):
+    python benchmarks/bench_feed_parsers.py --repeat 50
+"""
+
+import argparse
+import glob
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+logging.disable(logging.INFO)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIELDS = ["title", "link", "author", "published", "id"]
+
+
+def time_parse(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def check_fields(name, content):
+    slow = main.parse_feed_entries(content)
+    fast = main.parse_feed_fast(content)
+    if fast is None or len(fast) != len(slow):
+        print(f"  ! {name}: entry count differs (feedparser {len(slow)}, fast {len(fast or [])})")
+        return
+    for index, (a, b) in enumerate(zip(slow, fast)):
+        for field in FIELDS:
+            if a.get(field, "") != b.get(field, ""):
+                print(f"  ! {name}[{index}].{field}: {a.get(field)!r} != {b.get(field)!r}")
+                return
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=5, help="per-feed entry limit (newsletters use 5)")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(FIXTURES, "*.xml")))
+    if not paths:
+        sys.exit(f"no fixtures found in {FIXTURES}")
+
+    print(f"{'fixture':<22}{'KB':>7}{'feedparser':>12}{'fast':>9}{'fast@' + str(args.limit):>10}{'speedup':>9}")
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        with open(path, "rb") as handle:
+            content = handle.read()
+        check_fields(name, content)
+        before = time_parse(lambda: main.parse_feed_entries(content), args.repeat)
+        after = time_parse(lambda: main.parse_feed_fast(content), args.repeat)
+        limited = time_parse(lambda: main.parse_feed_fast(content, args.limit), args.repeat)
+        print(
+            f"{name:<22}{len(content) / 1024:>7.0f}{before:>10.2f}ms{after:>7.2f}ms"
+            f"{limited:>8.2f}ms{before / limited:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,102 @@
+"""
+Keyword extraction benchmark
+
+Tags a few thousand synthetic titles with every taxonomy group, comparing the
+old per-endpoint loop (substring test for each term, "before") against the
+KeywordMatcher tally ("after"), and reports the best of N runs. The substring
+scan costs one pass per term, the matcher one pass per title, so the last rows
+use all groups combined, plus extra terms, as a larger configured taxonomy
+would. Also reports how many term hits the substring scan produced that the
+whole-word matcher rejects (e.g. "gut" in "gutter", "hair" in "chair").
+
+Usage (from management-hub/):
+    python benchmarks/bench_keywords.py --items 5000 --repeat 5 --extra-terms 200
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+logging.disable(logging.INFO)
+
+FILLER = (
+    "new study finds why your doctor says the best routine for women over 40 what happened when "
+    "i tried this daily habit and it changed my life here is how to start today experts reveal "
+    "simple ways you can feel better at home this week chair gutter repair therapist sweater "
+    "dietitian heartfelt vitamins supplements hormones anti-aging mental health"
+).split()
+
+# Share of title words drawn from the taxonomy (real headlines mention one or two terms)
+TERM_RATE = 0.15
+
+
+def make_titles(count, seed=42):
+    rng = random.Random(seed)
+    terms = [term for terms in main.KEYWORD_TAXONOMY.values() for term in terms]
+    return [
+        " ".join(rng.choice(terms) if rng.random() < TERM_RATE else rng.choice(FILLER)
+                 for _ in range(rng.randint(6, 16))).capitalize()
+        for _ in range(count)
+    ]
+
+
+def substring_tally(items, terms):
+    """The loop each endpoint used to run"""
+    keywords = {}
+    for title in items:
+        title_lower = title.lower()
+        for term in terms:
+            if term in title_lower:
+                if term not in keywords:
+                    keywords[term] = {"count": 0, "examples": []}
+                keywords[term]["count"] += 1
+                if len(keywords[term]["examples"]) < 3:
+                    keywords[term]["examples"].append(title[:80])
+    return keywords
+
+
+def best_of(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return min(samples)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--extra-terms", type=int, default=200, help="synthetic terms added to the combined taxonomy")
+    args = parser.parse_args()
+
+    titles = make_titles(args.items)
+    print(f"{args.items} titles, best of {args.repeat} runs")
+    print(f"{'group':<18}{'terms':>6}{'substring':>12}{'matcher':>10}{'speedup':>9}{'hits before':>13}{'after':>7}")
+    groups = dict(main.KEYWORD_TAXONOMY)
+    # Every term of every group at once, as a larger configured taxonomy would be
+    groups["combined"] = list(dict.fromkeys(term for terms in main.KEYWORD_TAXONOMY.values() for term in terms))
+    if args.extra_terms:
+        groups[f"combined+{args.extra_terms}"] = groups["combined"] + [f"compound{i}" for i in range(args.extra_terms)]
+    for group, terms in groups.items():
+        matcher = main.KEYWORD_MATCHERS.get(group) or main.KeywordMatcher(terms)
+        before = best_of(lambda: substring_tally(titles, terms), args.repeat)
+        after = best_of(lambda: matcher.tally(titles, lambda t: t, lambda t: t[:80], max_examples=3), args.repeat)
+        hits_before = sum(v["count"] for v in substring_tally(titles, terms).values())
+        hits_after = sum(count for _, count, _ in matcher.tally(titles, lambda t: t, lambda t: t, max_examples=0))
+        print(
+            f"{group:<18}{len(terms):>6}{before:>10.1f}ms{after:>8.1f}ms{before / after:>8.1f}x"
+            f"{hits_before:>13}{hits_after:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main_cli()
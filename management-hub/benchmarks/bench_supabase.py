@@ -0,0 +1,133 @@
+"""
+Supabase data layer benchmark
+
+Drives the API in-process with concurrent clients against a fake Supabase
+client whose queries block for a fixed latency, and reports request latency
+percentiles with queries run inline on the event loop ("before") versus on
+the DB thread pool via db_execute ("after").
+
+Usage (from management-hub/):
+    python benchmarks/bench_supabase.py --clients 20 --requests 10 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+import main
+
+# Keep per-request log lines out of the report
+logging.disable(logging.INFO)
+
+ENDPOINTS = [
+    "/api/health/detailed",
+    "/api/metrics/performance",
+    "/api/recommendations",
+    "/",
+]
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.count = len(data)
+
+
+class FakeQuery:
+    """Chainable stand-in for a postgrest query builder with blocking execute()"""
+
+    def __init__(self, table: str, latency: float):
+        self.table = table
+        self.latency = latency
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        time.sleep(self.latency)
+        if self.table == "system_health":
+            return FakeResponse([{
+                "system_name": "story_grid_pro",
+                "status": "healthy",
+                "response_time_ms": 120.0,
+                "last_check": "2025-01-01T00:00:00+00:00",
+                "created_at": "2025-01-01T00:00:00+00:00",
+            }])
+        return FakeResponse([])
+
+
+class FakeSupabase:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def table(self, name: str):
+        return FakeQuery(name, self.latency)
+
+
+async def blocking_execute(query):
+    """Pre-change behaviour: the synchronous round trip runs on the event loop"""
+    return query.execute()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_load(clients: int, requests_per_client: int):
+    latencies = {path: [] for path in ENDPOINTS}
+    transport = httpx.ASGITransport(app=main.app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(worker_id: int):
+            for i in range(requests_per_client):
+                path = ENDPOINTS[(worker_id + i) % len(ENDPOINTS)]
+                started = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies[path].append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(clients)))
+        wall = time.perf_counter() - started
+
+    return latencies, wall
+
+
+def report(label: str, latencies, wall: float):
+    every = [v for values in latencies.values() for v in values]
+    print(f"\n{label}: {len(every)} requests in {wall:.2f}s ({len(every) / wall:.1f} req/s)")
+    print(f"  {'endpoint':<28}{'p50 ms':>10}{'p99 ms':>10}")
+    for path, values in latencies.items():
+        print(f"  {path:<28}{statistics.median(values):>10.1f}{percentile(values, 99):>10.1f}")
+    print(f"  {'all':<28}{statistics.median(every):>10.1f}{percentile(every, 99):>10.1f}")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=10, help="requests per client")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="simulated Supabase round trip")
+    args = parser.parse_args()
+
+    main.supabase = FakeSupabase(args.latency_ms / 1000)
+    pooled_execute = main.db_execute
+
+    main.db_execute = blocking_execute
+    report("before (inline execute)", *asyncio.run(run_load(args.clients, args.requests)))
+
+    main.db_execute = pooled_execute
+    report(f"after (db_execute, {main.DB_MAX_WORKERS} workers)", *asyncio.run(run_load(args.clients, args.requests)))
+
+
+if __name__ == "__main__":
+    main_cli()
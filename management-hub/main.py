@@ -5,6 +5,7 @@ Production-ready backend service with smart caching, retry logic, and AI insight
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from contextlib import asynccontextmanager
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -15,10 +16,21 @@ import uvicorn
 import httpx
 import os
 import logging
+import threading
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from anthropic import Anthropic
 import asyncio
+import base64
+import importlib.util
+import inspect
+import heapq
+import math
+import json
+import string
+import numpy as np
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 import time
 
@@ -111,31 +123,181 @@ SYSTEMS = {
     }
 }
 
-# Cache configuration
-CACHE = {
-    "health_overview": {"data": None, "timestamp": None, "ttl": 60},  # 1 minute
-    "recommendations": {"data": None, "timestamp": None, "ttl": 300},  # 5 minutes
-}
-
 # Scheduler instance
 scheduler = AsyncIOScheduler()
 
-# Simple cache decorator
-def cached(cache_key: str, ttl: int):
+# Cache engine
+class CacheEntry:
+    __slots__ = ("value", "stored_at", "ttl", "stale_ttl", "size")
+    
+    def __init__(self, value: Any, ttl: float, stale_ttl: float, size: int):
+        self.value = value
+        self.stored_at = time.time()
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.size = size
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory cost of a cached value by its JSON size"""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 1024
+
+def cacheable_result(result: Any) -> bool:
+    """Trend endpoints report failures in the payload - don't cache those"""
+    return not (isinstance(result, dict) and result.get("error"))
+
+class TTLCache:
+    """
+    In-process cache for expensive async loads.
+    - Concurrent misses for the same key share one load (single-flight)
+    - Entries past ttl but within stale_ttl are served while a background
+      refresh runs (stale-while-revalidate)
+    - Least recently used entries are evicted to stay under max_bytes
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._refresh_tasks: set = set()
+        self.counters = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0,
+            "evictions": 0, "refreshes": 0, "refresh_errors": 0
+        }
+    
+    def get(self, key: tuple, allow_stale: bool = False) -> Optional[CacheEntry]:
+        """Return the entry if fresh (or within its stale window when allowed)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        age = time.time() - entry.stored_at
+        if age < entry.ttl or (allow_stale and age < entry.ttl + entry.stale_ttl):
+            self._entries.move_to_end(key)
+            return entry
+        if age >= entry.ttl + entry.stale_ttl:
+            self._remove(key)
+        return None
+    
+    def set(self, key: tuple, value: Any, ttl: float, stale_ttl: float = 0):
+        self._remove(key)
+        entry = CacheEntry(value, ttl, stale_ttl, estimate_size(value))
+        self._entries[key] = entry
+        self.bytes += entry.size
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.counters["evictions"] += 1
+    
+    def _remove(self, key: tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+    
+    def invalidate(self, namespace: str):
+        for key in [k for k in self._entries if k[0] == namespace]:
+            self._remove(key)
+    
+    def newest_age(self, namespace: str) -> Optional[float]:
+        """Age in seconds of the most recently stored entry in a namespace"""
+        stored = [e.stored_at for k, e in self._entries.items() if k[0] == namespace]
+        return time.time() - max(stored) if stored else None
+    
+    async def _load(self, key: tuple, loader, ttl: float, stale_ttl: float, cache_if) -> Any:
+        """
+        Run loader once per key no matter how many callers are waiting. The load
+        runs as its own task, so a caller being cancelled never cancels it for the others.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = self._inflight[key] = asyncio.ensure_future(self._store(key, loader, ttl, stale_ttl, cache_if))
+            # Nobody may be waiting on a failed load - mark the exception retrieved
+            inflight.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return await asyncio.shield(inflight)
+    
+    async def _store(self, key: tuple, loader, ttl: float, stale_ttl: float, cache_if) -> Any:
+        try:
+            value = await loader()
+            if cache_if(value):
+                self.set(key, value, ttl, stale_ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+    
+    async def _refresh(self, key: tuple, loader, ttl: float, stale_ttl: float, cache_if):
+        self.counters["refreshes"] += 1
+        try:
+            await self._load(key, loader, ttl, stale_ttl, cache_if)
+        except Exception as e:
+            self.counters["refresh_errors"] += 1
+            logger.warning(f"Background refresh failed for {key[0]}: {str(e)}")
+    
+    async def get_or_load(self, key: tuple, loader, ttl: float, stale_ttl: float = 0,
+                          cache_if=cacheable_result, force: bool = False):
+        """Returns (value, age_seconds) - age is None when the value was just loaded"""
+        if not force:
+            entry = self.get(key, allow_stale=True)
+            if entry is not None:
+                age = time.time() - entry.stored_at
+                if age < entry.ttl:
+                    self.counters["hits"] += 1
+                else:
+                    self.counters["stale_hits"] += 1
+                    if key not in self._inflight:
+                        task = asyncio.create_task(self._refresh(key, loader, ttl, stale_ttl, cache_if))
+                        self._refresh_tasks.add(task)
+                        task.add_done_callback(self._refresh_tasks.discard)
+                return entry.value, age
+        
+        # Joining a load already in flight is not a miss: it triggers no load of its own
+        self.counters["coalesced" if key in self._inflight else "misses"] += 1
+        return await self._load(key, loader, ttl, stale_ttl, cache_if), None
+    
+    def stats(self) -> Dict[str, Any]:
+        served = self.counters["hits"] + self.counters["stale_hits"] + self.counters["coalesced"]
+        lookups = served + self.counters["misses"]
+        return {
+            **self.counters,
+            # Share of lookups answered without starting a load
+            "hit_ratio": round(served / lookups, 3) if lookups else None,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "inflight": len(self._inflight)
+        }
+
+response_cache = TTLCache(max_bytes=int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024))))
+
+def cache_key(namespace: str, params: Dict[str, Any]) -> tuple:
+    return (namespace, json.dumps(params, sort_keys=True, default=str))
+
+def cached(ttl: int, stale_ttl: int = 0, namespace: Optional[str] = None,
+           annotate: bool = False, cache_if=cacheable_result):
+    """
+    Cache an async function's result keyed by its bound arguments.
+    A force_refresh argument bypasses the lookup and is not part of the key.
+    With annotate=True, dict results served from cache get cached/cache_age_seconds.
+    """
     def decorator(func):
+        signature = inspect.signature(func)
+        cache_namespace = namespace or func.__name__
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            now = time.time()
-            cache_entry = CACHE.get(cache_key)
-            
-            if cache_entry and cache_entry["data"] is not None:
-                if cache_entry["timestamp"] and (now - cache_entry["timestamp"]) < ttl:
-                    logger.info(f"Cache hit for {cache_key}")
-                    return cache_entry["data"]
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            force = bool(params.pop("force_refresh", False))
+            key = cache_key(cache_namespace, params)
             
-            result = await func(*args, **kwargs)
-            CACHE[cache_key] = {"data": result, "timestamp": now, "ttl": ttl}
-            return result
+            value, age = await response_cache.get_or_load(
+                key, lambda: func(*args, **kwargs), ttl, stale_ttl, cache_if, force=force
+            )
+            if annotate and age is not None and isinstance(value, dict):
+                return {**value, "cached": True, "cache_age_seconds": int(age)}
+            return value
         return wrapper
     return decorator
 
@@ -152,6 +314,654 @@ async def retry_with_backoff(func, max_retries=3, base_delay=1):
             logger.warning(f"Retry attempt {attempt + 1} after {delay}s: {str(e)}")
             await asyncio.sleep(delay)
 
+# Supabase data layer - supabase-py is synchronous, so queries run on a bounded
+# thread pool instead of stalling the event loop for every HTTP round trip
+DB_MAX_WORKERS = int(os.getenv("DB_MAX_WORKERS", "8"))
+db_executor = ThreadPoolExecutor(max_workers=DB_MAX_WORKERS, thread_name_prefix="supabase")
+
+async def db_execute(query):
+    """Execute a Supabase query builder on the DB thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor, query.execute)
+
+# Write-behind batch writer for high-volume inserts
+class BatchWriter:
+    """
+    Buffers rows per table and flushes them as bulk inserts once a batch fills
+    up or the flush interval elapses. The queue is bounded: producers wait up to
+    put_timeout for space (backpressure) and the row is dropped after that.
+    """
+    
+    def __init__(self, max_batch: int = 50, flush_interval: float = 5.0,
+                 max_queue: int = 1000, put_timeout: float = 2.0):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.counters = {"queued": 0, "flushed": 0, "dropped": 0, "failed": 0, "batches": 0}
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def put(self, table: str, row: Dict[str, Any]) -> bool:
+        """Queue a row for insertion, returns False if it had to be dropped"""
+        try:
+            await asyncio.wait_for(self.queue.put((table, row)), timeout=self.put_timeout)
+        except asyncio.TimeoutError:
+            self.counters["dropped"] += 1
+            logger.warning(f"⚠️ Write queue full - dropped row for {table}")
+            return False
+        self.counters["queued"] += 1
+        return True
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            stop = False
+            
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            
+            await self._flush(batch)
+            if stop:
+                return
+    
+    async def _flush(self, batch: List[tuple]):
+        rows_by_table: Dict[str, List[Dict[str, Any]]] = {}
+        for table, row in batch:
+            rows_by_table.setdefault(table, []).append(row)
+        
+        for table, rows in rows_by_table.items():
+            try:
+                await db_execute(supabase.table(table).insert(rows))
+                self.counters["flushed"] += len(rows)
+                self.counters["batches"] += 1
+            except Exception as e:
+                self.counters["failed"] += len(rows)
+                logger.error(f"Error flushing {len(rows)} rows to {table}: {str(e)}")
+    
+    async def close(self, timeout: float = 10.0):
+        """Flush everything still queued and stop the writer"""
+        if self._task is None or self._task.done():
+            return
+        await self.queue.put(None)
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Write queue not drained after {timeout}s ({self.queue.qsize()} rows lost)")
+            self._task.cancel()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "pending": self.queue.qsize(), "capacity": self.queue.maxsize}
+
+db_writer = BatchWriter(
+    max_batch=int(os.getenv("DB_WRITE_BATCH_SIZE", "50")),
+    flush_interval=float(os.getenv("DB_WRITE_FLUSH_SECONDS", "5")),
+    max_queue=int(os.getenv("DB_WRITE_QUEUE_SIZE", "1000"))
+)
+
+# In-memory health history - the hub produces every health row itself, so the
+# read endpoints are served from a per-system ring buffer instead of Supabase
+def parse_timestamp(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+class HealthRecord:
+    """One health check result, compact enough to keep hundreds per system"""
+    __slots__ = ("status", "response_time_ms", "last_check", "checked_at", "error_message", "metadata")
+    
+    def __init__(self, status: str, response_time_ms: Optional[float], last_check: str,
+                 checked_at: float, error_message: Optional[str], metadata: Optional[Dict[str, Any]]):
+        self.status = status
+        self.response_time_ms = response_time_ms
+        self.last_check = last_check
+        self.checked_at = checked_at
+        self.error_message = error_message
+        self.metadata = metadata
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "HealthRecord":
+        """Build from a check result or a system_health row"""
+        return cls(
+            status=row["status"],
+            response_time_ms=row.get("response_time_ms"),
+            last_check=row["last_check"],
+            checked_at=parse_timestamp(row.get("created_at") or row["last_check"]),
+            error_message=row.get("error_message"),
+            metadata=row.get("metadata")
+        )
+    
+    def to_dict(self, system_key: str) -> Dict[str, Any]:
+        return {
+            "system_name": system_key,
+            "status": self.status,
+            "response_time_ms": self.response_time_ms,
+            "last_check": self.last_check,
+            "error_message": self.error_message,
+            "metadata": self.metadata,
+            "created_at": datetime.fromtimestamp(self.checked_at, timezone.utc).isoformat()
+        }
+
+class HealthHistory:
+    """
+    Fixed-capacity ring buffer of recent checks for one system.
+    complete is True while the buffer holds every check the DB knows about,
+    i.e. it was seeded with less than a full buffer and has not wrapped since.
+    """
+    __slots__ = ("capacity", "complete", "_records", "_head", "_size")
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.complete = False
+        self._records: List[Optional[HealthRecord]] = [None] * capacity
+        self._head = 0  # next write position
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, record: HealthRecord):
+        if self._size == self.capacity:
+            self.complete = False
+        else:
+            self._size += 1
+        self._records[self._head] = record
+        self._head = (self._head + 1) % self.capacity
+    
+    def latest(self, count: int = 1) -> List[HealthRecord]:
+        """Most recent records, newest first"""
+        count = min(count, self._size)
+        return [self._records[(self._head - 1 - i) % self.capacity] for i in range(count)]
+    
+    def since(self, cutoff: float) -> List[HealthRecord]:
+        """Records checked at or after cutoff (epoch seconds), newest first"""
+        results = []
+        for i in range(self._size):
+            record = self._records[(self._head - 1 - i) % self.capacity]
+            if record.checked_at < cutoff:
+                break
+            results.append(record)
+        return results
+    
+    def oldest_timestamp(self) -> Optional[float]:
+        if not self._size:
+            return None
+        return self._records[(self._head - self._size) % self.capacity].checked_at
+    
+    def covers(self, cutoff: float) -> bool:
+        """True if every check since cutoff is in memory"""
+        oldest = self.oldest_timestamp()
+        return self.complete or (oldest is not None and oldest <= cutoff)
+
+HEALTH_HISTORY_SIZE = int(os.getenv("HEALTH_HISTORY_SIZE", "512"))
+HEALTH_HISTORY: Dict[str, HealthHistory] = {key: HealthHistory(HEALTH_HISTORY_SIZE) for key in SYSTEMS}
+
+async def seed_health_history():
+    """Load the most recent checks per system from Supabase into memory"""
+    if supabase is None:
+        # Nothing persisted to fall back on - memory is the whole history
+        for history in HEALTH_HISTORY.values():
+            history.complete = True
+        return
+    
+    responses = await asyncio.gather(*(
+        db_execute(
+            supabase.table("system_health")
+            .select("*")
+            .eq("system_name", system_key)
+            .order("created_at", desc=True)
+            .limit(HEALTH_HISTORY_SIZE)
+        )
+        for system_key in SYSTEMS.keys()
+    ), return_exceptions=True)
+    
+    for system_key, response in zip(SYSTEMS.keys(), responses):
+        if isinstance(response, Exception):
+            logger.error(f"Error seeding health history for {system_key}: {str(response)}")
+            continue
+        history = HEALTH_HISTORY[system_key]
+        for row in reversed(response.data):
+            history.append(HealthRecord.from_row(row))
+        history.complete = len(response.data) < HEALTH_HISTORY_SIZE
+    
+    seeded = sum(len(history) for history in HEALTH_HISTORY.values())
+    logger.info(f"💾 Seeded {seeded} health records into memory")
+
+# Shared HTTP clients - one keep-alive pool per destination for the app lifetime,
+# instead of paying DNS/TCP/TLS setup on every probe and upstream call
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+HTTP_DESTINATIONS = {
+    "health_probe": {"timeout": 10.0, "max_connections": 20, "max_keepalive": 10},
+    "pubmed": {"timeout": 30.0, "max_connections": 5, "max_keepalive": 5},
+    "newsapi": {"timeout": 30.0, "max_connections": 5, "max_keepalive": 5},
+    "itunes": {"timeout": 30.0, "max_connections": 10, "max_keepalive": 5},
+    "openai": {"timeout": 30.0, "max_connections": 5, "max_keepalive": 2},
+    "feeds": {
+        "timeout": 20.0, "max_connections": 20, "max_keepalive": 10, "follow_redirects": True,
+        # Reddit throttles generic client user agents hard
+        "headers": {"User-Agent": "IAJ-Management-Hub/2.0 (health trend monitoring)"}
+    },
+}
+
+class HttpClientRegistry:
+    """Named httpx.AsyncClient pools with per-destination limits and usage counters"""
+    
+    def __init__(self, destinations: Dict[str, Dict[str, Any]]):
+        self.destinations = destinations
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+    
+    def _create(self, name: str) -> httpx.AsyncClient:
+        config = self.destinations[name]
+        counters = self._counters.setdefault(name, {"requests": 0, "new_connections": 0})
+        
+        # httpcore reports connection setup through the trace extension, so a
+        # request that never opens a TCP connection was served by a pooled one
+        async def trace(event_name: str, info: Dict[str, Any]):
+            if event_name == "connection.connect_tcp.complete":
+                counters["new_connections"] += 1
+        
+        async def on_request(request: httpx.Request):
+            counters["requests"] += 1
+            request.extensions["trace"] = trace
+        
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE and config.get("http2", True),
+            timeout=httpx.Timeout(config["timeout"], connect=min(config["timeout"], 5.0)),
+            limits=httpx.Limits(
+                max_connections=config["max_connections"],
+                max_keepalive_connections=config["max_keepalive"],
+                keepalive_expiry=config.get("keepalive_expiry", 60.0)
+            ),
+            headers=config.get("headers"),
+            follow_redirects=config.get("follow_redirects", False),
+            event_hooks={"request": [on_request]}
+        )
+    
+    def start(self):
+        for name in self.destinations:
+            self.get(name)
+        logger.info(f"🌐 HTTP client pools ready: {', '.join(self.destinations)} (HTTP/2: {HTTP2_AVAILABLE})")
+    
+    def get(self, name: str) -> httpx.AsyncClient:
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._clients[name] = self._create(name)
+        return client
+    
+    async def aclose(self):
+        clients, self._clients = self._clients, {}
+        await asyncio.gather(*(client.aclose() for client in clients.values()), return_exceptions=True)
+    
+    @staticmethod
+    def pool_state(client: httpx.AsyncClient) -> Dict[str, Optional[int]]:
+        """
+        Open/idle connections and queued requests. httpx doesn't expose its pool
+        publicly, so this reads httpcore internals (versions pinned in
+        requirements.txt) and reports None if they ever change shape.
+        """
+        try:
+            pool = client._transport._pool
+            connections = list(pool.connections)
+            return {
+                "open": len(connections),
+                "idle": sum(1 for c in connections if c.is_idle()),
+                "waiting": sum(1 for r in pool._requests if r.is_queued())
+            }
+        except (AttributeError, TypeError):
+            return {"open": None, "idle": None, "waiting": None}
+    
+    def stats(self) -> Dict[str, Any]:
+        results = {}
+        for name, client in self._clients.items():
+            counters = self._counters[name]
+            results[name] = {
+                "requests": counters["requests"],
+                "new_connections": counters["new_connections"],
+                "reused": max(0, counters["requests"] - counters["new_connections"]),
+                **self.pool_state(client),
+                "max_connections": self.destinations[name]["max_connections"]
+            }
+        return results
+
+http_clients = HttpClientRegistry(HTTP_DESTINATIONS)
+
+# RSS/Atom feed fetching
+FEED_MAX_CONCURRENCY = int(os.getenv("FEED_MAX_CONCURRENCY", "8"))
+
+FEED_CHUNK_SIZE = 16 * 1024
+
+# Entry fields we read, by element local name, in order of preference
+FEED_ENTRY_FIELDS = {
+    "title": ("title",),
+    "published": ("published", "pubDate", "updated", "date"),
+    "summary": ("description", "summary", "encoded", "content"),
+    "id": ("guid", "id")
+}
+
+def parse_feed_entries(content: bytes) -> List[Dict[str, Any]]:
+    """Parse a downloaded feed body (CPU-bound, runs in a worker thread)"""
+    try:
+        import feedparser
+    except ImportError:
+        logger.warning("⚠️ feedparser library not installed - skipping feed the fast parser could not read")
+        return []
+    return feedparser.parse(content).entries
+
+def local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+def feed_entry_fields(element) -> Dict[str, str]:
+    """Extract title/link/author/published/summary/id from an RSS item or Atom entry"""
+    values: Dict[str, str] = {}
+    for child in element:
+        name = local_name(child.tag)
+        if name == "link":
+            # RSS carries the URL as text, Atom as href on the alternate link
+            href = child.get("href")
+            if href is None:
+                values.setdefault("link", (child.text or "").strip())
+            elif child.get("rel", "alternate") == "alternate":
+                values.setdefault("link", href)
+        elif name in ("author", "creator"):
+            author = child.findtext("{*}name") if len(child) else child.text
+            if author and author.strip():
+                values.setdefault("author", author.strip())
+        elif child.text and child.text.strip():
+            values.setdefault(name, child.text.strip())
+    
+    entry = {}
+    for field, names in FEED_ENTRY_FIELDS.items():
+        for name in names:
+            if name in values:
+                entry[field] = values[name]
+                break
+    for field in ("link", "author"):
+        if field in values:
+            entry[field] = values[field]
+    return entry
+
+def parse_feed_fast(content: bytes, limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Incrementally parse an RSS/Atom body, extracting only the fields the trend
+    endpoints read and stopping once `limit` entries have been seen. Returns
+    None when the body is not well-formed or holds no entries, so the caller
+    can fall back to feedparser.
+    """
+    from xml.etree.ElementTree import XMLPullParser, ParseError
+    
+    parser = XMLPullParser(events=("end",))
+    entries: List[Dict[str, Any]] = []
+    try:
+        for offset in range(0, len(content), FEED_CHUNK_SIZE):
+            parser.feed(content[offset:offset + FEED_CHUNK_SIZE])
+            for _, element in parser.read_events():
+                if local_name(element.tag) not in ("item", "entry"):
+                    continue
+                entries.append(feed_entry_fields(element))
+                element.clear()
+                if limit is not None and len(entries) >= limit:
+                    return entries
+        parser.close()
+    except ParseError:
+        return None
+    return entries or None
+
+def parse_feed(content: bytes, limit: Optional[int] = None) -> tuple:
+    """Fast path first, feedparser for anything it cannot handle; returns (entries, parser)"""
+    entries = parse_feed_fast(content, limit)
+    if entries is not None:
+        return entries, "fast"
+    entries = parse_feed_entries(content)
+    return (entries if limit is None else entries[:limit]), "feedparser"
+
+class FeedFetcher:
+    """
+    Downloads feeds concurrently with bounded parallelism using conditional
+    GETs: the ETag/Last-Modified of each URL is remembered, and a 304 reuses
+    the entries parsed from the previous download (re-parsing the stored body
+    if a larger limit is asked for than was parsed last time).
+    """
+    
+    def __init__(self, max_concurrency: int):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._validators: Dict[str, Dict[str, Any]] = {}
+        self.counters = {
+            "downloads": 0, "not_modified": 0, "errors": 0,
+            "fast_parsed": 0, "fallback_parsed": 0
+        }
+    
+    async def _parse(self, content: bytes, limit: Optional[int]) -> List[Dict[str, Any]]:
+        entries, parser = await asyncio.to_thread(parse_feed, content, limit)
+        self.counters["fast_parsed" if parser == "fast" else "fallback_parsed"] += 1
+        return entries
+    
+    async def fetch(self, url: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        previous = self._validators.get(url)
+        headers = {}
+        if previous:
+            if previous["etag"]:
+                headers["If-None-Match"] = previous["etag"]
+            if previous["last_modified"]:
+                headers["If-Modified-Since"] = previous["last_modified"]
+        
+        async with self._semaphore:
+            try:
+                response = await http_clients.get("feeds").get(url, headers=headers)
+                if response.status_code == 304 and previous:
+                    self.counters["not_modified"] += 1
+                    covered = previous["limit"] is None or (limit is not None and limit <= previous["limit"])
+                    if covered:
+                        return previous["entries"][:limit]
+                    previous["entries"] = await self._parse(previous["content"], limit)
+                    previous["limit"] = limit
+                    return previous["entries"]
+                response.raise_for_status()
+            except Exception:
+                self.counters["errors"] += 1
+                raise
+        
+        self.counters["downloads"] += 1
+        entries = await self._parse(response.content, limit)
+        self._validators[url] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "content": response.content,
+            "limit": limit,
+            "entries": entries
+        }
+        return entries
+    
+    async def fetch_many(self, urls: List[str], limit: Optional[int] = None) -> List[Any]:
+        """Entries per URL, in order; a failed feed yields its exception"""
+        return await asyncio.gather(*(self.fetch(url, limit) for url in urls), return_exceptions=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "feeds_tracked": len(self._validators)}
+
+feed_fetcher = FeedFetcher(FEED_MAX_CONCURRENCY)
+
+# TikTokApi browser sessions - each pooled session is a TikTokApi instance
+# with one Playwright context, kept warm between requests
+TIKTOK_POOL_SIZE = int(os.getenv("TIKTOK_POOL_SIZE", "2"))
+TIKTOK_SESSION_MAX_USES = int(os.getenv("TIKTOK_SESSION_MAX_USES", "50"))
+TIKTOK_SESSION_MAX_AGE = int(os.getenv("TIKTOK_SESSION_MAX_AGE", "1800"))
+TIKTOK_CHECKOUT_TIMEOUT = float(os.getenv("TIKTOK_CHECKOUT_TIMEOUT", "30"))
+TIKTOK_MS_TOKEN = os.getenv("TIKTOK_MS_TOKEN")
+TIKTOK_BROWSER = os.getenv("TIKTOK_BROWSER", "chromium")
+
+class TikTokSession:
+    __slots__ = ("api", "uses", "created_at")
+    
+    def __init__(self, api):
+        self.api = api
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+class TikTokSessionPool:
+    """
+    Long-lived pool of TikTokApi sessions. Requests check a session out with
+    `async with tiktok_sessions.session() as api:`; at most `size` browser
+    contexts exist at once and callers wait up to checkout_timeout for one.
+    A session is replaced when its page has closed, after max_uses checkouts,
+    after max_age seconds, or when a request using it raises.
+    """
+    
+    def __init__(self, size: int, max_uses: int, max_age: float, checkout_timeout: float):
+        self.size = size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.checkout_timeout = checkout_timeout
+        self._idle: List[TikTokSession] = []
+        self._semaphore = asyncio.Semaphore(size)
+        self._in_use = 0
+        self._closing: set = set()
+        self._warm_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.counters = {"checkouts": 0, "created": 0, "recycled": 0, "errors": 0, "timeouts": 0}
+    
+    def start(self):
+        """Warm the pool in the background so startup never waits on a browser launch"""
+        self._closed = False
+        if self.size > 0 and importlib.util.find_spec("TikTokApi") is not None:
+            self._replenish()
+    
+    def _replenish(self):
+        if not self._closed and (self._warm_task is None or self._warm_task.done()):
+            self._warm_task = asyncio.create_task(self._warm())
+    
+    async def _warm(self):
+        for _ in range(self.size):
+            async with self._semaphore:
+                if self._closed or len(self._idle) + self._in_use >= self.size:
+                    return
+                try:
+                    self._idle.append(await self._create())
+                except Exception as e:
+                    logger.warning(f"⚠️ TikTok session warm-up failed: {str(e)}")
+                    return
+        logger.info(f"🎵 TikTok session pool warm ({len(self._idle)} idle sessions)")
+    
+    async def _create(self) -> TikTokSession:
+        from TikTokApi import TikTokApi
+        
+        api = TikTokApi()
+        try:
+            await api.create_sessions(
+                num_sessions=1,
+                ms_tokens=[TIKTOK_MS_TOKEN] if TIKTOK_MS_TOKEN else None,
+                sleep_after=3,
+                browser=TIKTOK_BROWSER,
+                suppress_resource_load_types=["image", "media", "font", "stylesheet"]
+            )
+        except BaseException:
+            await self._close_api(api)
+            raise
+        self.counters["created"] += 1
+        return TikTokSession(api)
+    
+    async def _close_api(self, api):
+        try:
+            await api.close_sessions()
+            if getattr(api, "browser", None) is not None:
+                await api.stop_playwright()
+        except Exception as e:
+            logger.warning(f"⚠️ TikTok session close failed: {str(e)}")
+    
+    def _discard(self, session: TikTokSession):
+        """Close a session in the background; the caller never waits on browser teardown"""
+        task = asyncio.create_task(self._close_api(session.api))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+    
+    def _healthy(self, session: TikTokSession) -> bool:
+        if time.monotonic() - session.created_at > self.max_age:
+            return False
+        sessions = getattr(session.api, "sessions", None)
+        return bool(sessions) and not sessions[0].page.is_closed()
+    
+    @asynccontextmanager
+    async def session(self):
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.checkout_timeout)
+        except asyncio.TimeoutError:
+            self.counters["timeouts"] += 1
+            raise RuntimeError(f"No TikTok session available within {self.checkout_timeout:g}s")
+        
+        self._in_use += 1
+        session = None
+        try:
+            while self._idle and session is None:
+                candidate = self._idle.pop()
+                if self._healthy(candidate):
+                    session = candidate
+                else:
+                    self.counters["recycled"] += 1
+                    self._discard(candidate)
+            if session is None:
+                session = await self._create()
+            
+            session.uses += 1
+            self.counters["checkouts"] += 1
+            yield session.api
+        except BaseException:
+            self.counters["errors"] += 1
+            if session is not None:
+                self._discard(session)
+                self._replenish()
+                session = None
+            raise
+        finally:
+            if session is not None:
+                if self._closed or session.uses >= self.max_uses:
+                    self.counters["recycled"] += 1
+                    self._discard(session)
+                    self._replenish()
+                else:
+                    self._idle.append(session)
+            self._in_use -= 1
+            self._semaphore.release()
+    
+    async def close(self):
+        self._closed = True
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+        idle, self._idle = self._idle, []
+        for session in idle:
+            await self._close_api(session.api)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "size": self.size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "max_uses": self.max_uses
+        }
+
+tiktok_sessions = TikTokSessionPool(
+    TIKTOK_POOL_SIZE, TIKTOK_SESSION_MAX_USES, TIKTOK_SESSION_MAX_AGE, TIKTOK_CHECKOUT_TIMEOUT
+)
+
 # Lifespan context manager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -168,26 +978,22 @@ async def lifespan(app: FastAPI):
     
     logger.info("=" * 80)
     
+    # Start the write-behind writer before anything can produce rows
+    db_writer.start()
+    http_clients.start()
+    tiktok_sessions.start()
+    
+    # Load recent health history so read endpoints are served from memory
+    try:
+        await seed_health_history()
+    except Exception as e:
+        logger.error(f"❌ Health history seed failed: {str(e)}")
+    
     # Start the scheduler
     scheduler.start()
     
-    # Schedule health checks for high-priority systems (every 5 min)
-    scheduler.add_job(
-        check_high_priority_systems,
-        trigger=IntervalTrigger(seconds=300),
-        id="health_check_high_priority",
-        name="High Priority Health Checks (5min)",
-        replace_existing=True
-    )
-    
-    # Schedule health checks for medium-priority systems (every 10 min)
-    scheduler.add_job(
-        check_medium_priority_systems,
-        trigger=IntervalTrigger(seconds=600),
-        id="health_check_medium_priority",
-        name="Medium Priority Health Checks (10min)",
-        replace_existing=True
-    )
+    # Schedule one health check job per system, staggered across its interval
+    schedule_system_checks()
     
     # Schedule AI recommendations (twice daily at 8am and 8pm)
     scheduler.add_job(
@@ -206,6 +1012,56 @@ async def lifespan(app: FastAPI):
         replace_existing=True
     )
     
+    # Keep the TikTok search watchlist warm (first pass once the session pool has warmed)
+    if TIKTOK_SEARCH_WATCHLIST:
+        scheduler.add_job(
+            refresh_tiktok_watchlist,
+            trigger=IntervalTrigger(
+                seconds=TIKTOK_WATCHLIST_REFRESH_SECONDS,
+                start_date=datetime.now(timezone.utc) + timedelta(seconds=60)
+            ),
+            id="tiktok_search_watchlist",
+            name="TikTok Search Watchlist Refresh",
+            replace_existing=True
+        )
+    
+    # Local search index over ingested items (pruned daily at 3am)
+    await trend_search.start()
+    scheduler.add_job(
+        trend_search.prune,
+        trigger=CronTrigger(hour=3, minute=0),
+        id="trend_search_prune",
+        name="Prune Trend Search Index (3am)",
+        replace_existing=True
+    )
+    
+    # Refresh each trend source into its snapshots on its own cadence
+    if TREND_INGESTION_ENABLED:
+        loaded = await asyncio.to_thread(trend_snapshots.load)
+        schedule_ingestion()
+        logger.info(f"✅ Trend ingestion scheduled for {len(trend_snapshots.sources)} sources ({loaded} snapshots restored)")
+    
+    # Topic history: reload, then compact and persist periodically
+    loaded = await asyncio.to_thread(topic_series.load)
+    spike_detector.seed(topic_series)
+    trend_watchlist.load()
+    # Also covers points recorded outside ingestion (disabled, or non-primary parameters)
+    scheduler.add_job(
+        evaluate_spikes,
+        trigger=IntervalTrigger(seconds=SPIKE_EVALUATE_SECONDS),
+        id="evaluate_spikes",
+        name="Trend Spike Evaluation",
+        replace_existing=True
+    )
+    scheduler.add_job(
+        topic_series.save,
+        trigger=IntervalTrigger(seconds=TOPIC_SERIES_SAVE_SECONDS),
+        id="topic_series_save",
+        name="Topic Series Compaction & Save",
+        replace_existing=True
+    )
+    logger.info(f"✅ Topic series loaded ({loaded} series), saved every {TOPIC_SERIES_SAVE_SECONDS}s")
+    
     # Schedule cleanup of old data (daily at 2am)
     scheduler.add_job(
         cleanup_old_data,
@@ -215,7 +1071,7 @@ async def lifespan(app: FastAPI):
         replace_existing=True
     )
     
-    logger.info("✅ Scheduler started with optimized intervals")
+    logger.info("✅ Scheduler started with staggered per-system intervals")
     logger.info("✅ AI recommendations scheduled twice daily at 8:00 AM and 8:00 PM")
     logger.info("✅ Auto-cleanup scheduled daily at 2:00 AM")
     logger.info("=" * 80)
@@ -236,6 +1092,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("🛑 Shutting down IAJ Management Hub")
     scheduler.shutdown()
+    await db_writer.close()
+    logger.info(f"💾 Write queue flushed: {db_writer.stats()}")
+    await http_clients.aclose()
+    await tiktok_sessions.close()
+    await topic_series.save()
+    trend_search.close()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -262,13 +1124,13 @@ async def check_system_health(system_key: str, system_info: Dict[str, str]) -> D
     start_time = datetime.now(timezone.utc)
     
     async def attempt_check():
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Use custom endpoint if specified, otherwise default to /api/status
-            base_url = system_info['url'].rstrip('/')
-            endpoint = system_info.get('endpoint', '/api/status')
-            url = f"{base_url}{endpoint}"
-            response = await client.get(url)
-            return response
+        client = http_clients.get("health_probe")
+        # Use custom endpoint if specified, otherwise default to /api/status
+        base_url = system_info['url'].rstrip('/')
+        endpoint = system_info.get('endpoint', '/api/status')
+        url = f"{base_url}{endpoint}"
+        response = await client.get(url)
+        return response
     
     try:
         response = await retry_with_backoff(attempt_check, max_retries=2, base_delay=1)
@@ -314,19 +1176,100 @@ async def check_system_health(system_key: str, system_info: Dict[str, str]) -> D
             "metadata": {}
         }
 
-# Check high-priority systems
-async def check_high_priority_systems():
-    """Check systems with 5-minute intervals"""
-    high_priority = {k: v for k, v in SYSTEMS.items() if v["priority"] == "high"}
-    logger.info(f"🔴 Checking {len(high_priority)} high-priority systems")
-    await run_health_checks(high_priority)
+# Adaptive per-system scheduling
+CHECK_JITTER_SECONDS = int(os.getenv("CHECK_JITTER_SECONDS", "15"))
+MIN_CHECK_INTERVAL = int(os.getenv("MIN_CHECK_INTERVAL", "60"))
+UNHEALTHY_INTERVAL_DIVISOR = 4          # check 4x as often while a system is down
+STABLE_CHECKS_BEFORE_BACKOFF = int(os.getenv("STABLE_CHECKS_BEFORE_BACKOFF", "6"))
+MAX_BACKOFF_FACTOR = int(os.getenv("MAX_BACKOFF_FACTOR", "2"))
+
+# Every interval a system can run at (base, backed off, unhealthy) is a multiple
+# of this period, so probes pinned to distinct phases within it never coincide
+CHECK_PHASE_PERIOD = math.gcd(*(
+    interval
+    for info in SYSTEMS.values()
+    for interval in (info["check_interval"], max(MIN_CHECK_INTERVAL, info["check_interval"] // UNHEALTHY_INTERVAL_DIVISOR))
+))
+CHECK_SLOT_SECONDS = CHECK_PHASE_PERIOD / len(SYSTEMS)
+# Jitter stays inside half a slot so it cannot close the gap between neighbours
+CHECK_JITTER = min(CHECK_JITTER_SECONDS, CHECK_SLOT_SECONDS / 2)
+
+# Current effective interval, consecutive healthy checks and fixed phase per system
+CHECK_STATE: Dict[str, Dict[str, Any]] = {
+    key: {"interval": info["check_interval"], "healthy_streak": 0, "phase": round(i * CHECK_SLOT_SECONDS, 1)}
+    for i, (key, info) in enumerate(SYSTEMS.items())
+}
+
+def check_job_id(system_key: str) -> str:
+    return f"health_check_{system_key}"
+
+def check_start(system_key: str, earliest: datetime) -> datetime:
+    """First time at or after earliest on the system's phase (epoch seconds modulo CHECK_PHASE_PERIOD)"""
+    ts = earliest.timestamp()
+    ts += (CHECK_STATE[system_key]["phase"] - ts) % CHECK_PHASE_PERIOD
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+def next_check_interval(system_key: str, status: str) -> int:
+    """Shorten the interval while unhealthy, back off after a stable run"""
+    base = SYSTEMS[system_key]["check_interval"]
+    state = CHECK_STATE[system_key]
+    
+    if status != "healthy":
+        state["healthy_streak"] = 0
+        return max(MIN_CHECK_INTERVAL, base // UNHEALTHY_INTERVAL_DIVISOR)
+    
+    state["healthy_streak"] += 1
+    factor = min(MAX_BACKOFF_FACTOR, 2 ** (state["healthy_streak"] // STABLE_CHECKS_BEFORE_BACKOFF))
+    return base * factor
+
+def adapt_check_interval(system_key: str, status: str):
+    """Reschedule a system's job when its effective interval changes"""
+    interval = next_check_interval(system_key, status)
+    state = CHECK_STATE[system_key]
+    if interval == state["interval"]:
+        return
+    
+    logger.info(f"⏱️ {SYSTEMS[system_key]['name']}: check interval {state['interval']}s -> {interval}s")
+    state["interval"] = interval
+    if scheduler.get_job(check_job_id(system_key)):
+        scheduler.reschedule_job(
+            check_job_id(system_key),
+            trigger=IntervalTrigger(
+                seconds=interval,
+                jitter=CHECK_JITTER,
+                start_date=check_start(system_key, datetime.now(timezone.utc) + timedelta(seconds=interval))
+            )
+        )
+
+def schedule_system_checks():
+    """
+    Register one job per system at its own check_interval. Each system is
+    pinned to a phase (an offset within CHECK_PHASE_PERIOD, evenly spaced), and
+    every start date - here and when adapt_check_interval reschedules - lands
+    on it, so two systems' probes stay a slot apart whatever their intervals.
+    """
+    now = datetime.now(timezone.utc)
+    
+    for system_key, state in CHECK_STATE.items():
+        scheduler.add_job(
+            check_system,
+            trigger=IntervalTrigger(
+                seconds=state["interval"],
+                jitter=CHECK_JITTER,
+                start_date=check_start(system_key, now)
+            ),
+            args=[system_key],
+            id=check_job_id(system_key),
+            name=f"Health Check: {SYSTEMS[system_key]['name']}",
+            replace_existing=True
+        )
+    phases = ", ".join(f"{key} +{state['phase']:g}s" for key, state in CHECK_STATE.items())
+    logger.info(f"⏱️ Health check phases (mod {CHECK_PHASE_PERIOD}s, jitter {CHECK_JITTER:g}s): {phases}")
 
-# Check medium-priority systems
-async def check_medium_priority_systems():
-    """Check systems with 10-minute intervals"""
-    medium_priority = {k: v for k, v in SYSTEMS.items() if v["priority"] == "medium"}
-    logger.info(f"🟡 Checking {len(medium_priority)} medium-priority systems")
-    await run_health_checks(medium_priority)
+# Check a single system (scheduled per system)
+async def check_system(system_key: str):
+    """Check one system on its own schedule"""
+    await run_health_checks({system_key: SYSTEMS[system_key]})
 
 # Check all systems
 async def check_all_systems():
@@ -349,15 +1292,16 @@ async def run_health_checks(systems: Dict[str, Dict[str, Any]]):
             continue
         
         try:
-            # Store in Supabase
-            supabase.table("system_health").insert(health_data).execute()
+            HEALTH_HISTORY[health_data["system_name"]].append(HealthRecord.from_row(health_data))
+            
+            # Queue for bulk insert into Supabase
+            await db_writer.put("system_health", health_data)
             
             status_emoji = "✅" if health_data["status"] == "healthy" else "❌"
             system_name = SYSTEMS.get(health_data["system_name"], {}).get("name", health_data["system_name"])
             logger.info(f"{status_emoji} {system_name}: {health_data['status']}")
             
-            # Clear cache on new data
-            CACHE["health_overview"]["data"] = None
+            adapt_check_interval(health_data["system_name"], health_data["status"])
             
             # Log alert for unhealthy systems
             if health_data["status"] != "healthy":
@@ -369,7 +1313,7 @@ async def run_health_checks(systems: Dict[str, Dict[str, Any]]):
                     "payload": health_data,
                     "created_at": datetime.now(timezone.utc).isoformat()
                 }
-                supabase.table("workflow_events").insert(workflow_event).execute()
+                await db_writer.put("workflow_events", workflow_event)
         
         except Exception as e:
             logger.error(f"Error storing health data for {health_data.get('system_name')}: {str(e)}")
@@ -379,37 +1323,43 @@ async def cleanup_old_data():
     """Keep only last 1000 checks per system"""
     logger.info("🧹 Starting cleanup of old data")
     
-    try:
-        for system_key in SYSTEMS.keys():
-            # Get count of records for this system
-            response = supabase.table("system_health")\
-                .select("id", count="exact")\
-                .eq("system_name", system_key)\
-                .execute()
-            
-            total_count = response.count if hasattr(response, 'count') else 0
+    async def cleanup_system(system_key: str):
+        # Get count of records for this system
+        response = await db_execute(
+            supabase.table("system_health")
+            .select("id", count="exact")
+            .eq("system_name", system_key)
+        )
+        
+        total_count = response.count if hasattr(response, 'count') else 0
+        
+        if total_count > 1000:
+            # Get the ID of the 1000th most recent record
+            records = await db_execute(
+                supabase.table("system_health")
+                .select("id")
+                .eq("system_name", system_key)
+                .order("created_at", desc=True)
+                .limit(1)
+                .range(999, 999)
+            )
             
-            if total_count > 1000:
-                # Get the ID of the 1000th most recent record
-                records = supabase.table("system_health")\
-                    .select("id")\
-                    .eq("system_name", system_key)\
-                    .order("created_at", desc=True)\
-                    .limit(1)\
-                    .range(999, 999)\
-                    .execute()
+            if records.data:
+                cutoff_id = records.data[0]["id"]
+                # Delete records older than this
+                await db_execute(
+                    supabase.table("system_health")
+                    .delete()
+                    .eq("system_name", system_key)
+                    .lt("id", cutoff_id)
+                )
                 
-                if records.data:
-                    cutoff_id = records.data[0]["id"]
-                    # Delete records older than this
-                    supabase.table("system_health")\
-                        .delete()\
-                        .eq("system_name", system_key)\
-                        .lt("id", cutoff_id)\
-                        .execute()
-                    
-                    deleted = total_count - 1000
-                    logger.info(f"🧹 Cleaned {deleted} old records for {system_key}")
+                deleted = total_count - 1000
+                logger.info(f"🧹 Cleaned {deleted} old records for {system_key}")
+    
+    try:
+        # Systems are independent, so clean them concurrently
+        await asyncio.gather(*(cleanup_system(system_key) for system_key in SYSTEMS.keys()))
         
         logger.info("✅ Cleanup complete")
     
@@ -422,18 +1372,21 @@ async def generate_recommendations() -> List[Dict[str, Any]]:
     try:
         logger.info("🧠 Generating AI recommendations with Claude Sonnet 4")
         
-        # Fetch comprehensive data
-        health_data = supabase.table("system_health")\
-            .select("*")\
-            .order("created_at", desc=True)\
-            .limit(200)\
-            .execute()
-        
-        workflow_data = supabase.table("workflow_events")\
-            .select("*")\
-            .order("created_at", desc=True)\
-            .limit(100)\
-            .execute()
+        # Fetch comprehensive data (independent queries, run concurrently)
+        health_data, workflow_data = await asyncio.gather(
+            db_execute(
+                supabase.table("system_health")
+                .select("*")
+                .order("created_at", desc=True)
+                .limit(200)
+            ),
+            db_execute(
+                supabase.table("workflow_events")
+                .select("*")
+                .order("created_at", desc=True)
+                .limit(100)
+            )
+        )
         
         # Build context
         context = "# IAJ Systems Performance Analysis\n\n"
@@ -548,12 +1501,9 @@ async def generate_daily_recommendations():
     
     for rec in recommendations:
         try:
-            supabase.table("ai_recommendations").insert(rec).execute()
+            await db_execute(supabase.table("ai_recommendations").insert(rec))
         except Exception as e:
             logger.error(f"Error storing recommendation: {str(e)}")
-    
-    # Clear recommendations cache
-    CACHE["recommendations"]["data"] = None
 
 # API Endpoints
 
@@ -565,7 +1515,7 @@ async def root():
         "version": "2.0.0",
         "description": "Intelligent monitoring with optimized intervals and AI insights",
         "features": [
-            "Smart health monitoring (5min/10min intervals)",
+            "Adaptive per-system health monitoring (staggered intervals)",
             "AI-powered recommendations (Claude Sonnet 4)",
             "Performance metrics with caching",
             "Auto-cleanup (keep last 1000 checks)",
@@ -577,33 +1527,26 @@ async def root():
             "recommendations": "/api/recommendations",
             "generate_recommendations": "/api/recommendations/generate",
             "performance_metrics": "/api/metrics/performance",
+            "runtime_metrics": "/api/metrics/runtime",
             "trigger_check": "/api/health/check"
         },
         "docs": "/docs"
     }
 
 @app.get("/api/health/overview")
-@cached("health_overview", 60)
 async def get_health_overview():
-    """Quick status overview (cached 1min)"""
+    """Quick status overview (served from in-memory history)"""
     try:
         results = {}
         
         for system_key, system_info in SYSTEMS.items():
-            response = supabase.table("system_health")\
-                .select("*")\
-                .eq("system_name", system_key)\
-                .order("created_at", desc=True)\
-                .limit(1)\
-                .execute()
-            
-            if response.data:
-                latest = response.data[0]
+            latest = HEALTH_HISTORY[system_key].latest(1)
+            if latest:
                 results[system_key] = {
                     "name": system_info["name"],
-                    "status": latest["status"],
-                    "response_time_ms": latest.get("response_time_ms"),
-                    "last_check": latest["last_check"],
+                    "status": latest[0].status,
+                    "response_time_ms": latest[0].response_time_ms,
+                    "last_check": latest[0].last_check,
                     "priority": system_info["priority"]
                 }
             else:
@@ -632,25 +1575,22 @@ async def get_health_detailed():
         results = {}
         
         for system_key, system_info in SYSTEMS.items():
-            response = supabase.table("system_health")\
-                .select("*")\
-                .eq("system_name", system_key)\
-                .order("created_at", desc=True)\
-                .limit(10)\
-                .execute()
+            recent = [r.to_dict(system_key) for r in HEALTH_HISTORY[system_key].latest(10)]
             
-            if response.data:
+            if recent:
                 # Calculate uptime from last 10 checks
-                healthy_count = sum(1 for r in response.data if r["status"] == "healthy")
-                uptime = (healthy_count / len(response.data)) * 100
+                healthy_count = sum(1 for r in recent if r["status"] == "healthy")
+                uptime = (healthy_count / len(recent)) * 100
                 
                 results[system_key] = {
                     "name": system_info["name"],
                     "description": system_info["description"],
                     "priority": system_info["priority"],
                     "check_interval": system_info["check_interval"],
-                    "current_status": response.data[0],
-                    "recent_history": response.data,
+                    "effective_interval": CHECK_STATE[system_key]["interval"],
+                    "check_phase_seconds": CHECK_STATE[system_key]["phase"],
+                    "current_status": recent[0],
+                    "recent_history": recent,
                     "uptime_percentage": round(uptime, 1)
                 }
         
@@ -675,7 +1615,7 @@ async def get_recommendations(status: str = "pending", limit: int = 10):
         else:
             query = query.eq("status", status)
         
-        response = query.order("created_at", desc=True).limit(limit).execute()
+        response = await db_execute(query.order("created_at", desc=True).limit(limit))
         
         logger.info(f"📋 Fetched {len(response.data)} recommendations with status: {status}")
         
@@ -696,10 +1636,7 @@ async def trigger_recommendations():
         recommendations = await generate_recommendations()
         
         for rec in recommendations:
-            supabase.table("ai_recommendations").insert(rec).execute()
-        
-        # Clear cache
-        CACHE["recommendations"]["data"] = None
+            await db_execute(supabase.table("ai_recommendations").insert(rec))
         
         return {
             "message": "Recommendations generated",
@@ -717,10 +1654,11 @@ async def apply_recommendation(recommendation_id: str):
         logger.info(f"🔄 Attempting to apply recommendation ID: {recommendation_id}")
         
         # First check if the recommendation exists
-        check_response = supabase.table("ai_recommendations")\
-            .select("*")\
-            .eq("id", recommendation_id)\
-            .execute()
+        check_response = await db_execute(
+            supabase.table("ai_recommendations")
+            .select("*")
+            .eq("id", recommendation_id)
+        )
         
         if not check_response.data:
             logger.warning(f"❌ Recommendation {recommendation_id} not found in database")
@@ -729,20 +1667,18 @@ async def apply_recommendation(recommendation_id: str):
         logger.info(f"✓ Found recommendation: {check_response.data[0].get('title', 'Unknown')}")
         
         # Update the recommendation status
-        response = supabase.table("ai_recommendations")\
+        response = await db_execute(
+            supabase.table("ai_recommendations")
             .update({
                 "status": "applied",
                 "updated_at": datetime.now(timezone.utc).isoformat()
-            })\
-            .eq("id", recommendation_id)\
-            .execute()
+            })
+            .eq("id", recommendation_id)
+        )
         
         if not response.data:
             raise HTTPException(status_code=404, detail="Failed to update recommendation")
         
-        # Clear cache
-        CACHE["recommendations"]["data"] = None
-        
         # Log the action
         workflow_event = {
             "event_type": "recommendation_applied",
@@ -752,7 +1688,7 @@ async def apply_recommendation(recommendation_id: str):
             "payload": {"recommendation_id": recommendation_id},
             "created_at": datetime.now(timezone.utc).isoformat()
         }
-        supabase.table("workflow_events").insert(workflow_event).execute()
+        await db_execute(supabase.table("workflow_events").insert(workflow_event))
         
         logger.info(f"✅ Recommendation {recommendation_id} applied successfully")
         
@@ -773,20 +1709,18 @@ async def dismiss_recommendation(recommendation_id: str):
     """Mark a recommendation as dismissed"""
     try:
         # Update the recommendation status
-        response = supabase.table("ai_recommendations")\
+        response = await db_execute(
+            supabase.table("ai_recommendations")
             .update({
                 "status": "dismissed",
                 "updated_at": datetime.now(timezone.utc).isoformat()
-            })\
-            .eq("id", recommendation_id)\
-            .execute()
+            })
+            .eq("id", recommendation_id)
+        )
         
         if not response.data:
             raise HTTPException(status_code=404, detail="Recommendation not found")
         
-        # Clear cache
-        CACHE["recommendations"]["data"] = None
-        
         # Log the action
         workflow_event = {
             "event_type": "recommendation_dismissed",
@@ -796,7 +1730,7 @@ async def dismiss_recommendation(recommendation_id: str):
             "payload": {"recommendation_id": recommendation_id},
             "created_at": datetime.now(timezone.utc).isoformat()
         }
-        supabase.table("workflow_events").insert(workflow_event).execute()
+        await db_execute(supabase.table("workflow_events").insert(workflow_event))
         
         logger.info(f"🚫 Recommendation {recommendation_id} dismissed")
         
@@ -821,23 +1755,37 @@ async def get_performance_metrics():
         
         metrics = {}
         
-        for system_key, system_info in SYSTEMS.items():
-            response = supabase.table("system_health")\
-                .select("*")\
+        # Memory holds the recent part of the window; only the older part
+        # (if the buffer doesn't reach back 24h) comes from Supabase
+        async def older_rows(system_key: str) -> List[Dict[str, Any]]:
+            history = HEALTH_HISTORY[system_key]
+            if history.covers(cutoff.timestamp()):
+                return []
+            query = supabase.table("system_health")\
+                .select("status,response_time_ms")\
                 .eq("system_name", system_key)\
-                .gte("created_at", cutoff.isoformat())\
-                .order("created_at", desc=True)\
-                .execute()
+                .gte("created_at", cutoff.isoformat())
+            oldest = history.oldest_timestamp()
+            if oldest is not None:
+                query = query.lt("created_at", datetime.fromtimestamp(oldest, timezone.utc).isoformat())
+            response = await db_execute(query)
+            return response.data
+        
+        older = await asyncio.gather(*(older_rows(system_key) for system_key in SYSTEMS.keys()))
+        
+        for (system_key, system_info), older_data in zip(SYSTEMS.items(), older):
+            checks = [(r.status, r.response_time_ms) for r in HEALTH_HISTORY[system_key].since(cutoff.timestamp())]
+            checks.extend((r["status"], r.get("response_time_ms")) for r in older_data)
             
-            if response.data:
-                response_times = [r["response_time_ms"] for r in response.data if r.get("response_time_ms")]
-                healthy_count = sum(1 for r in response.data if r["status"] == "healthy")
+            if checks:
+                response_times = [rt for _, rt in checks if rt]
+                healthy_count = sum(1 for status, _ in checks if status == "healthy")
                 
                 metrics[system_key] = {
                     "name": system_info["name"],
-                    "total_checks": len(response.data),
+                    "total_checks": len(checks),
                     "healthy_checks": healthy_count,
-                    "uptime_24h": round((healthy_count / len(response.data)) * 100, 2),
+                    "uptime_24h": round((healthy_count / len(checks)) * 100, 2),
                     "avg_response_time": round(sum(response_times) / len(response_times), 2) if response_times else None,
                     "min_response_time": round(min(response_times), 2) if response_times else None,
                     "max_response_time": round(max(response_times), 2) if response_times else None
@@ -852,6 +1800,27 @@ async def get_performance_metrics():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/metrics/runtime")
+async def get_runtime_metrics():
+    """Internal counters for the hub's own data pipeline"""
+    return {
+        "db_writer": db_writer.stats(),
+        "http_pools": http_clients.stats(),
+        "cache": response_cache.stats(),
+        "feeds": feed_fetcher.stats(),
+        "tiktok_sessions": tiktok_sessions.stats(),
+        "scholar": scholar_worker.stats(),
+        "pubmed": pubmed_pipeline.stats(),
+        "trend_baselines": trend_scorer.stats(),
+        "snapshots": trend_snapshots.stats(),
+        "topic_series": topic_series.stats(),
+        "spikes": spike_detector.stats(),
+        "emerging_terms": emerging_terms.stats(),
+        "near_duplicates": near_duplicates.stats(),
+        "trend_search": await trend_search.stats(),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
 @app.post("/api/health/check")
 async def trigger_health_check():
     """Manually trigger health check for all systems"""
@@ -885,14 +1854,1638 @@ YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
 # News API key
 NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")
 
-@app.get("/api/trends/google")
-async def get_google_trends(
-    topic: str = None,
-    timeframe: str = "today"
-):
+# NCBI E-utilities key (optional) - raises the PubMed rate limit from 3 to 10 requests/second
+NCBI_API_KEY = os.getenv("NCBI_API_KEY", "")
+NCBI_EMAIL = os.getenv("NCBI_EMAIL", "")
+
+# Keyword taxonomy used to tag trend items per source. Groups can be replaced
+# or added with a JSON file ({"group": ["term", ...]}) named by KEYWORD_TAXONOMY_FILE.
+KEYWORD_TAXONOMY: Dict[str, List[str]] = {
+    "reddit": [
+        "gut", "sleep", "hormone", "weight", "diet", "supplement", "vitamin",
+        "protein", "longevity", "aging", "skin", "hair", "mental", "anxiety",
+        "stress", "fitness", "workout", "fasting", "keto", "menopause",
+        "thyroid", "collagen", "magnesium", "zinc", "omega", "probiotic"
+    ],
+    "pubmed": [
+        "microbiome", "gut", "longevity", "aging", "hormone", "menopause",
+        "fasting", "ketogenic", "sleep", "circadian", "stress", "anxiety",
+        "depression", "inflammation", "immune", "cancer", "cardiovascular",
+        "diabetes", "obesity", "weight", "exercise", "nutrition", "vitamin",
+        "supplement", "probiotic", "antioxidant", "collagen", "peptide"
+    ],
+    "news": [
+        "weight", "diet", "exercise", "sleep", "stress", "anxiety", "depression",
+        "heart", "cancer", "diabetes", "alzheimer", "longevity", "aging",
+        "vitamin", "supplement", "probiotic", "gut", "microbiome", "hormone",
+        "menopause", "fertility", "pregnancy", "skin", "hair", "mental health",
+        "wellness", "fitness", "nutrition", "protein", "fasting", "keto", "vegan"
+    ],
+    "podcasts": [
+        "health", "wellness", "longevity", "biohacking", "fitness", "nutrition",
+        "mental", "sleep", "gut", "hormone", "menopause", "meditation", "mindful",
+        "diet", "weight", "aging", "brain", "stress", "anxiety", "energy"
+    ],
+    "scholar": [
+        "longevity", "aging", "health", "wellness", "nutrition", "exercise",
+        "sleep", "stress", "mental", "cognitive", "gut", "microbiome",
+        "inflammation", "immune", "hormone", "metabolism", "diet", "fasting"
+    ],
+    "newsletters": [
+        "health", "wellness", "longevity", "sleep", "stress", "anxiety",
+        "nutrition", "diet", "fasting", "exercise", "fitness", "weight",
+        "mental", "brain", "gut", "hormone", "aging", "energy", "meditation"
+    ],
+    "tiktok_health": [
+        "health", "wellness", "fitness", "nutrition", "gut", "sleep",
+        "hormone", "menopause", "weight", "diet", "mental", "anxiety",
+        "stress", "longevity", "aging", "beauty", "skin", "hair",
+        # Common compound hashtags
+        "skincare", "haircare", "guthealth", "mentalhealth", "weightloss",
+        "healthtok", "wellnesstok", "fittok", "guttok", "sleeptok"
+    ]
+}
+
+def load_keyword_taxonomy() -> Dict[str, List[str]]:
+    taxonomy = dict(KEYWORD_TAXONOMY)
+    path = os.getenv("KEYWORD_TAXONOMY_FILE")
+    if path:
+        try:
+            with open(path) as f:
+                taxonomy.update(json.load(f))
+        except Exception as e:
+            logger.error(f"❌ Could not load keyword taxonomy from {path}: {str(e)}")
+    return taxonomy
+
+# Punctuation becomes a word break ("anti-aging" -> "anti aging", "#gut" -> "gut")
+WORD_BREAKS = str.maketrans({c: " " for c in string.punctuation + "\u2018\u2019\u201c\u201d\u2013\u2014\u2026\u2022"})
+
+def tokenize_texts(texts: List[str]) -> List[List[str]]:
     """
-    Get Google Trends data for health & wellness topics (US-focused)
-    
+    Lowercased words of each text. The texts are joined and translated as one
+    string so lowercasing and punctuation stripping run once, in C, per batch.
+    """
+    lines = "\n".join(text.replace("\n", " ") for text in texts).lower().translate(WORD_BREAKS).split("\n")
+    return [line.split() for line in lines]
+
+class KeywordMatcher:
+    """
+    Whole-word matcher for a taxonomy group, built once: each text's words
+    (and word pairs/triples when the group has multi-word terms) are
+    intersected with the set of term variants, so "gut" no longer matches
+    "gutter" nor "hair" "chair", and plurals (-s/-es) count towards the
+    singular term. For the built-in groups it runs about as fast as a
+    substring scan per term; its cost does not grow with the number of terms.
+    """
+    
+    def __init__(self, terms: List[str]):
+        self.terms = list(dict.fromkeys(
+            " ".join(words) for words in tokenize_texts(terms) if words
+        ))
+        self._variants: Dict[str, str] = {}
+        for term in self.terms:
+            for suffix in ("es", "s", ""):
+                self._variants[term + suffix] = term
+        self._variant_set = frozenset(self._variants)
+        self._max_words = max((term.count(" ") + 1 for term in self.terms), default=1)
+        self._phrase_starts = frozenset(term.split()[0] for term in self.terms if " " in term)
+    
+    def _match(self, words: List[str]) -> List[str]:
+        hits = self._variant_set.intersection(words)
+        if self._phrase_starts and not self._phrase_starts.isdisjoint(words):
+            starts = [i for i, word in enumerate(words) if word in self._phrase_starts]
+            for n in range(2, self._max_words + 1):
+                hits = hits.union(self._variant_set.intersection(" ".join(words[i:i + n]) for i in starts))
+        if not hits:
+            return []
+        return list({self._variants[hit] for hit in hits})
+    
+    def find(self, text: str) -> List[str]:
+        """Distinct terms found in text"""
+        return self._match(tokenize_texts([text])[0]) if text else []
+    
+    def matches(self, text: str) -> bool:
+        return bool(self.find(text))
+    
+    def tally(self, items, text, example, max_examples: int) -> List[tuple]:
+        """
+        One pass over items: (term, count, examples) sorted by count (ties by
+        term), where count is the number of items mentioning the term and
+        examples come from the first max_examples of them.
+        """
+        items = list(items)
+        counts: Dict[str, List[Any]] = {}
+        for item, words in zip(items, tokenize_texts([text(item) or "" for item in items])):
+            for term in self._match(words):
+                entry = counts.get(term)
+                if entry is None:
+                    entry = counts[term] = [0, []]
+                entry[0] += 1
+                if len(entry[1]) < max_examples:
+                    entry[1].append(example(item))
+        return sorted(((term, c, examples) for term, (c, examples) in counts.items()),
+                      key=lambda x: (-x[1], x[0]))
+
+KEYWORD_MATCHERS = {group: KeywordMatcher(terms) for group, terms in load_keyword_taxonomy().items()}
+
+# Trend ingestion - each source declares (via @snapshot_served) how often it is
+# refreshed and which parameter sets are ingested. A scheduler job per source
+# refreshes them into versioned snapshots, persisted under HUB_DATA_DIR, and
+# requests for an ingested parameter set are answered from the latest snapshot.
+HUB_DATA_DIR = os.getenv("HUB_DATA_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+TREND_INGESTION_ENABLED = os.getenv("TREND_INGESTION_ENABLED", "true").lower() == "true"
+
+# Consumers of freshly ingested payloads: hook(source, params, payload), sync or async
+INGEST_HOOKS: List[Any] = []
+
+class TrendSnapshot:
+    __slots__ = ("version", "fetched_at", "elapsed_ms", "payload")
+    
+    def __init__(self, version: int, fetched_at: float, elapsed_ms: float, payload: Dict[str, Any]):
+        self.version = version
+        self.fetched_at = fetched_at
+        self.elapsed_ms = elapsed_ms
+        self.payload = payload
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"version": self.version, "fetched_at": self.fetched_at,
+                "elapsed_ms": self.elapsed_ms, "payload": self.payload}
+
+class TrendSnapshotStore:
+    """
+    Latest snapshot per (source, parameter set). A refresh that fails (raises
+    or returns an error payload) keeps the previous snapshot and records the
+    error. Each source's snapshots are written to <data_dir>/snapshots/<source>.json
+    after every refresh and loaded back on startup.
+    """
+    
+    def __init__(self, data_dir: str):
+        self.directory = os.path.join(data_dir, "snapshots")
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self._snapshots: Dict[str, Dict[str, TrendSnapshot]] = {}
+        self._errors: Dict[tuple, Dict[str, Any]] = {}
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.counters = {"served": 0, "refreshes": 0, "failures": 0}
+    
+    def register(self, source: str, fetch, signature: inspect.Signature, interval: int, calls: List[Dict[str, Any]]):
+        keys = {}
+        for call in calls:
+            bound = signature.bind(**call)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            params.pop("force_refresh", None)
+            keys[self.key(params)] = params
+        # The first parameter set is the source's main one (the endpoint's defaults)
+        self.sources[source] = {"fetch": fetch, "interval": interval, "keys": keys, "primary": next(iter(keys))}
+        self._snapshots.setdefault(source, {})
+    
+    @staticmethod
+    def key(params: Dict[str, Any]) -> str:
+        return json.dumps(params, sort_keys=True, default=str)
+    
+    def tracks(self, source: str, key: str) -> bool:
+        return source in self.sources and key in self.sources[source]["keys"]
+    
+    def get(self, source: str, key: str) -> Optional[TrendSnapshot]:
+        return self._snapshots.get(source, {}).get(key)
+    
+    def serve(self, snapshot: TrendSnapshot) -> Dict[str, Any]:
+        self.counters["served"] += 1
+        return {
+            **snapshot.payload,
+            "snapshot_version": snapshot.version,
+            "snapshot_age_seconds": int(time.time() - snapshot.fetched_at)
+        }
+    
+    async def refresh(self, source: str, key: str, force: bool = True) -> Dict[str, Any]:
+        """Run the source's live fetch for one parameter set; concurrent callers share it"""
+        inflight = self._inflight.get((source, key))
+        if inflight is None:
+            inflight = self._inflight[(source, key)] = asyncio.ensure_future(self._refresh(source, key, force))
+            inflight.add_done_callback(lambda _: self._inflight.pop((source, key), None))
+        return await asyncio.shield(inflight)
+    
+    async def _refresh(self, source: str, key: str, force: bool) -> Dict[str, Any]:
+        config = self.sources[source]
+        params = config["keys"][key]
+        started = time.perf_counter()
+        try:
+            payload = await config["fetch"](**params, force_refresh=force)
+        except Exception as e:
+            payload = {"error": str(e), "timestamp": datetime.now(timezone.utc).isoformat()}
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        
+        if not cacheable_result(payload):
+            self.counters["failures"] += 1
+            self._errors[(source, key)] = {"error": payload.get("error"), "at": time.time()}
+            logger.warning(f"⚠️ Ingestion failed for {source} {key}: {payload.get('error')}")
+            return payload
+        
+        previous = self.get(source, key)
+        snapshot = TrendSnapshot((previous.version + 1) if previous else 1, time.time(), elapsed_ms, payload)
+        self._snapshots[source][key] = snapshot
+        self._errors.pop((source, key), None)
+        self.counters["refreshes"] += 1
+        await self.save(source)
+        
+        for hook in INGEST_HOOKS:
+            try:
+                result = hook(source, params, payload)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"❌ Ingest hook {getattr(hook, '__name__', hook)} failed for {source}: {str(e)}")
+        return self.serve(snapshot)
+    
+    async def ingest(self, source: str):
+        """Scheduler job: refresh every ingested parameter set of a source, one at a time"""
+        for key in list(self.sources[source]["keys"]):
+            await self.refresh(source, key)
+    
+    def _write(self, source: str, data: Dict[str, Any]):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{source}.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump(data, f, default=str)
+        os.replace(path + ".tmp", path)
+    
+    async def save(self, source: str):
+        data = {key: snapshot.to_dict() for key, snapshot in self._snapshots[source].items()}
+        try:
+            await asyncio.to_thread(self._write, source, data)
+        except Exception as e:
+            logger.error(f"❌ Could not persist {source} snapshots: {str(e)}")
+    
+    def load(self):
+        """Restore persisted snapshots for registered parameter sets"""
+        loaded = 0
+        for source, config in self.sources.items():
+            path = os.path.join(self.directory, f"{source}.json")
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.error(f"❌ Could not load {source} snapshots: {str(e)}")
+                continue
+            for key, item in data.items():
+                if key in config["keys"]:
+                    self._snapshots[source][key] = TrendSnapshot(
+                        item["version"], item["fetched_at"], item["elapsed_ms"], item["payload"]
+                    )
+                    loaded += 1
+        return loaded
+    
+    def newest(self, source: str) -> Optional[float]:
+        fetched = [snapshot.fetched_at for snapshot in self._snapshots.get(source, {}).values()]
+        return max(fetched) if fetched else None
+    
+    def status(self) -> Dict[str, Any]:
+        now = time.time()
+        sources = {}
+        for source, config in self.sources.items():
+            entries = []
+            for key, params in config["keys"].items():
+                snapshot = self.get(source, key)
+                entry = {"params": params}
+                if snapshot is not None:
+                    entry.update({
+                        "version": snapshot.version,
+                        "age_seconds": int(now - snapshot.fetched_at),
+                        "elapsed_ms": snapshot.elapsed_ms
+                    })
+                if (source, key) in self._errors:
+                    entry["last_error"] = self._errors[(source, key)]["error"]
+                entries.append(entry)
+            sources[source] = {"interval_seconds": config["interval"], "snapshots": entries}
+        return sources
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "snapshots": sum(len(snapshots) for snapshots in self._snapshots.values()),
+            "inflight": len(self._inflight)
+        }
+
+trend_snapshots = TrendSnapshotStore(HUB_DATA_DIR)
+
+def snapshot_served(source: str, interval: int, calls: List[Dict[str, Any]]):
+    """
+    Ingest `source` every `interval` seconds (INGEST_<SOURCE>_SECONDS overrides)
+    for each parameter set in `calls`, and answer requests for those parameter
+    sets from the latest snapshot. force_refresh=true fetches live and updates
+    the snapshot; other parameter sets go straight to the live function.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        trend_snapshots.register(
+            source, func, signature, int(os.getenv(f"INGEST_{source.upper()}_SECONDS", str(interval))), calls
+        )
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not TREND_INGESTION_ENABLED:
+                return await func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            force = bool(params.pop("force_refresh", False))
+            key = trend_snapshots.key(params)
+            if not trend_snapshots.tracks(source, key):
+                return await func(*args, **kwargs)
+            
+            snapshot = trend_snapshots.get(source, key)
+            if snapshot is not None and not force:
+                return trend_snapshots.serve(snapshot)
+            return await trend_snapshots.refresh(source, key, force=force)
+        return wrapper
+    return decorator
+
+def schedule_ingestion():
+    """One job per source; sources whose snapshots are missing or due run shortly after startup"""
+    now = datetime.now(timezone.utc)
+    for i, (source, config) in enumerate(trend_snapshots.sources.items()):
+        newest = trend_snapshots.newest(source)
+        due = now + timedelta(seconds=10 * (i + 1))
+        if newest is not None and len(trend_snapshots._snapshots[source]) == len(config["keys"]):
+            due = max(due, datetime.fromtimestamp(newest + config["interval"], tz=timezone.utc))
+        scheduler.add_job(
+            trend_snapshots.ingest,
+            trigger=IntervalTrigger(seconds=config["interval"], start_date=due),
+            args=[source],
+            id=f"ingest_{source}",
+            name=f"Trend Ingestion: {source}",
+            replace_existing=True
+        )
+
+# Topic time series - every ingested data point per (topic, source, geo) in
+# growable numpy arrays. Points older than TOPIC_SERIES_RAW_DAYS are folded
+# into hourly means, older than TOPIC_SERIES_HOURLY_DAYS into daily means, and
+# dropped after TOPIC_SERIES_RETENTION_DAYS. Persisted column-wise to one .npz.
+TOPIC_SERIES_RAW_DAYS = int(os.getenv("TOPIC_SERIES_RAW_DAYS", "7"))
+TOPIC_SERIES_HOURLY_DAYS = int(os.getenv("TOPIC_SERIES_HOURLY_DAYS", "90"))
+TOPIC_SERIES_RETENTION_DAYS = int(os.getenv("TOPIC_SERIES_RETENTION_DAYS", "730"))
+TOPIC_SERIES_SAVE_SECONDS = int(os.getenv("TOPIC_SERIES_SAVE_SECONDS", "300"))
+TOPIC_SERIES_RESOLUTIONS = {"raw": 0, "hour": 3600, "day": 86400, "week": 7 * 86400}
+
+# Ingested payloads that carry per-topic mention counts: source -> (list key, topic field)
+TOPIC_COUNT_FIELDS = {
+    "reddit": ("trending_keywords", "keyword"),
+    "pubmed": ("trending_research", "topic"),
+    "news": ("trending_topics", "topic"),
+    "podcasts": ("trending_topics", "topic"),
+    "newsletters": ("trending_topics", "topic"),
+    "tiktok": ("trending_hashtags", "hashtag"),
+}
+
+def series_geo(source: str) -> str:
+    """Geo a source's series are stored under: Google Trends is queried for the US, the rest are unscoped"""
+    return "US" if source == "google" else "global"
+
+def bucket_means(timestamps: np.ndarray, values: np.ndarray, width: int) -> tuple:
+    """Mean value per width-second bucket, stamped with the bucket start"""
+    if not width or not len(timestamps):
+        return timestamps, values
+    starts, inverse = np.unique((timestamps // width) * width, return_inverse=True)
+    means = np.bincount(inverse, weights=values) / np.bincount(inverse)
+    return starts, means.astype(values.dtype)
+
+def series_change(timestamps: np.ndarray, values: np.ndarray, period: float) -> Optional[float]:
+    """Percent change of the mean over the last `period` seconds against the period before it"""
+    if not len(timestamps):
+        return None
+    end = timestamps[-1]
+    recent = values[timestamps > end - period]
+    previous = values[(timestamps > end - 2 * period) & (timestamps <= end - period)]
+    if not len(recent) or not len(previous):
+        return None
+    baseline = previous.mean()
+    return round(float((recent.mean() - baseline) / max(baseline, 1) * 100), 1)
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over `window` points (shorter at the start of the series)"""
+    if not len(values):
+        return values
+    sums = np.cumsum(values, dtype=np.float64)
+    sums[window:] = sums[window:] - sums[:-window]
+    return (sums / np.minimum(np.arange(1, len(values) + 1), window)).astype(values.dtype)
+
+def series_summary(timestamps: np.ndarray, values: np.ndarray) -> Dict[str, Any]:
+    if not len(timestamps):
+        return {"points": 0}
+    peak = int(np.argmax(values))
+    return {
+        "points": int(len(timestamps)),
+        "latest": round(float(values[-1]), 2),
+        "peak": round(float(values[peak]), 2),
+        "peak_at": datetime.fromtimestamp(timestamps[peak], tz=timezone.utc).isoformat(),
+        "change_1d": series_change(timestamps, values, 86400),
+        "change_7d": series_change(timestamps, values, 7 * 86400),
+        "change_30d": series_change(timestamps, values, 30 * 86400)
+    }
+
+class TopicSeries:
+    """Sorted (timestamp, value) points in arrays with spare capacity for cheap appends"""
+    __slots__ = ("timestamps", "values", "size")
+    
+    def __init__(self, timestamps: Optional[np.ndarray] = None, values: Optional[np.ndarray] = None):
+        self.timestamps = np.empty(16, dtype=np.float64) if timestamps is None else timestamps.astype(np.float64)
+        self.values = np.empty(16, dtype=np.float32) if values is None else values.astype(np.float32)
+        self.size = 0 if timestamps is None else len(timestamps)
+    
+    def view(self) -> tuple:
+        return self.timestamps[:self.size], self.values[:self.size]
+    
+    def upsert(self, timestamps: np.ndarray, values: np.ndarray):
+        """Add points; a timestamp that already exists takes the new value"""
+        order = np.argsort(timestamps, kind="stable")
+        timestamps, values = timestamps[order], values[order]
+        if (self.size and timestamps[0] <= self.timestamps[self.size - 1]) or np.any(np.diff(timestamps) == 0):
+            # Overlaps what we have (e.g. a re-fetched window) - merge keeping the newest value per timestamp
+            merged_ts = np.concatenate([self.view()[0], timestamps])[::-1]
+            merged_values = np.concatenate([self.view()[1], values])[::-1]
+            unique_ts, first = np.unique(merged_ts, return_index=True)
+            self._replace(unique_ts, merged_values[first])
+            return
+        needed = self.size + len(timestamps)
+        if needed > len(self.timestamps):
+            capacity = max(needed, 2 * len(self.timestamps))
+            self.timestamps = np.resize(self.timestamps, capacity)
+            self.values = np.resize(self.values, capacity)
+        self.timestamps[self.size:needed] = timestamps
+        self.values[self.size:needed] = values
+        self.size = needed
+    
+    def _replace(self, timestamps: np.ndarray, values: np.ndarray):
+        self.timestamps = timestamps.astype(np.float64)
+        self.values = values.astype(np.float32)
+        self.size = len(timestamps)
+    
+    def range(self, start: Optional[float] = None, end: Optional[float] = None) -> tuple:
+        timestamps, values = self.view()
+        lo = 0 if start is None else np.searchsorted(timestamps, start, side="left")
+        hi = self.size if end is None else np.searchsorted(timestamps, end, side="right")
+        return timestamps[lo:hi], values[lo:hi]
+    
+    def compact(self, now: float):
+        """Downsample by age tier and drop points past retention"""
+        timestamps, values = self.view()
+        raw_from = np.searchsorted(timestamps, now - TOPIC_SERIES_RAW_DAYS * 86400)
+        hourly_from = np.searchsorted(timestamps, now - TOPIC_SERIES_HOURLY_DAYS * 86400)
+        keep_from = np.searchsorted(timestamps, now - TOPIC_SERIES_RETENTION_DAYS * 86400)
+        if raw_from == keep_from:
+            return
+        daily = bucket_means(timestamps[keep_from:hourly_from], values[keep_from:hourly_from], 86400)
+        hourly = bucket_means(timestamps[hourly_from:raw_from], values[hourly_from:raw_from], 3600)
+        self._replace(
+            np.concatenate([daily[0], hourly[0], timestamps[raw_from:]]),
+            np.concatenate([daily[1], hourly[1], values[raw_from:]])
+        )
+
+class TopicSeriesStore:
+    def __init__(self, path: str):
+        self.path = path
+        self.series: Dict[tuple, TopicSeries] = {}
+        self.last_saved: Optional[float] = None
+        self.counters = {"points_recorded": 0, "saves": 0}
+    
+    @staticmethod
+    def key(topic: str, source: str, geo: str) -> tuple:
+        return (" ".join(topic.lower().split()), source, geo)
+    
+    def record(self, topic: str, source: str, geo: str, timestamps, values):
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if not len(timestamps):
+            return
+        key = self.key(topic, source, geo)
+        if key not in self.series:
+            self.series[key] = TopicSeries()
+        self.series[key].upsert(timestamps, np.asarray(values, dtype=np.float32))
+        self.counters["points_recorded"] += len(timestamps)
+        spike_detector.observe(key, timestamps, values)
+    
+    def get(self, topic: str, source: str, geo: str) -> Optional[TopicSeries]:
+        return self.series.get(self.key(topic, source, geo))
+    
+    def summary(self, topic: str, source: str, geo: str) -> Optional[Dict[str, Any]]:
+        series = self.get(topic, source, geo)
+        return series_summary(*series.view()) if series is not None else None
+    
+    def compact(self):
+        now = time.time()
+        for series in self.series.values():
+            series.compact(now)
+    
+    def _columns(self) -> Dict[str, np.ndarray]:
+        keys = list(self.series)
+        views = [self.series[key].view() for key in keys]
+        sizes = np.array([len(ts) for ts, _ in views], dtype=np.int64)
+        return {
+            "topic": np.array([key[0] for key in keys], dtype=str),
+            "source": np.array([key[1] for key in keys], dtype=str),
+            "geo": np.array([key[2] for key in keys], dtype=str),
+            "offsets": np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64),
+            "timestamps": np.concatenate([ts for ts, _ in views]) if views else np.empty(0, dtype=np.float64),
+            "values": np.concatenate([v for _, v in views]) if views else np.empty(0, dtype=np.float32)
+        }
+    
+    def _write(self, columns: Dict[str, np.ndarray]):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".tmp", "wb") as f:
+            np.savez_compressed(f, **columns)
+        os.replace(self.path + ".tmp", self.path)
+    
+    async def save(self):
+        """Compact, then write every series as one set of columns (off the event loop)"""
+        self.compact()
+        columns = self._columns()
+        try:
+            await asyncio.to_thread(self._write, columns)
+            self.last_saved = time.time()
+            self.counters["saves"] += 1
+        except Exception as e:
+            logger.error(f"❌ Could not persist topic series: {str(e)}")
+    
+    def load(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                offsets, timestamps, values = data["offsets"], data["timestamps"], data["values"]
+                for i, (topic, source, _) in enumerate(zip(data["topic"].tolist(), data["source"].tolist(), data["geo"].tolist())):
+                    lo, hi = offsets[i], offsets[i + 1]
+                    # Older files keyed series by the payload's display region
+                    key = (topic, source, series_geo(source))
+                    self.series[key] = TopicSeries(timestamps[lo:hi].copy(), values[lo:hi].copy())
+        except Exception as e:
+            logger.error(f"❌ Could not load topic series: {str(e)}")
+        return len(self.series)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "series": len(self.series),
+            "points": sum(series.size for series in self.series.values()),
+            "bytes": sum(series.timestamps.nbytes + series.values.nbytes for series in self.series.values()),
+            "last_saved": self.last_saved
+        }
+
+topic_series = TopicSeriesStore(os.path.join(HUB_DATA_DIR, "topic_series.npz"))
+
+def record_topic_counts(source: str, params: Dict[str, Any], payload: Dict[str, Any]):
+    """Ingest hook: one point per topic with its mention count, for each source's main parameter set"""
+    if source not in TOPIC_COUNT_FIELDS or trend_snapshots.key(params) != trend_snapshots.sources[source]["primary"]:
+        return
+    list_key, field = TOPIC_COUNT_FIELDS[source]
+    now = time.time()
+    geo = series_geo(source)
+    for item in payload.get(list_key, []):
+        topic = f"#{item[field]}" if source == "tiktok" else item[field]
+        topic_series.record(topic, source, geo, [now], [item.get("count", 0)])
+
+INGEST_HOOKS.append(record_topic_counts)
+
+# Spike detection - an EWMA mean/variance per topic series, held in flat
+# numpy arrays (one slot per series) and advanced for every series at once
+# as new points arrive. A point SPIKE_Z_THRESHOLD deviations above its
+# series' baseline is flagged; flags on watched topics go to workflow_events.
+# Queued points are evaluated after every ingestion and every
+# SPIKE_EVALUATE_SECONDS; past SPIKE_MAX_PENDING batches the oldest are dropped.
+SPIKE_EWMA_ALPHA = float(os.getenv("SPIKE_EWMA_ALPHA", "0.1"))
+SPIKE_Z_THRESHOLD = float(os.getenv("SPIKE_Z_THRESHOLD", "3.5"))
+SPIKE_MIN_POINTS = int(os.getenv("SPIKE_MIN_POINTS", "12"))
+SPIKE_MIN_STD = float(os.getenv("SPIKE_MIN_STD", "1.0"))
+SPIKE_COOLDOWN_HOURS = float(os.getenv("SPIKE_COOLDOWN_HOURS", "6"))
+SPIKE_EVALUATE_SECONDS = int(os.getenv("SPIKE_EVALUATE_SECONDS", "300"))
+SPIKE_MAX_PENDING = int(os.getenv("SPIKE_MAX_PENDING", "5000"))
+
+class SpikeDetector:
+    def __init__(self, capacity: int = 256, max_pending: int = SPIKE_MAX_PENDING):
+        self.keys: List[tuple] = []
+        self.slots: Dict[tuple, int] = {}
+        self.mean = np.zeros(capacity)
+        self.var = np.zeros(capacity)
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.last_ts = np.full(capacity, -np.inf)
+        self.last_z = np.zeros(capacity)
+        self.last_spike = np.full(capacity, -np.inf)
+        self.pending: deque = deque(maxlen=max_pending)
+        self.recent = deque(maxlen=1000)
+        self.counters = {"points_evaluated": 0, "spikes": 0, "batches_dropped": 0}
+    
+    def _slot(self, key: tuple) -> int:
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = len(self.keys)
+            self.keys.append(key)
+            if slot >= len(self.mean):
+                grow = len(self.mean)
+                self.mean = np.concatenate([self.mean, np.zeros(grow)])
+                self.var = np.concatenate([self.var, np.zeros(grow)])
+                self.count = np.concatenate([self.count, np.zeros(grow, dtype=np.int64)])
+                self.last_ts = np.concatenate([self.last_ts, np.full(grow, -np.inf)])
+                self.last_z = np.concatenate([self.last_z, np.zeros(grow)])
+                self.last_spike = np.concatenate([self.last_spike, np.full(grow, -np.inf)])
+        return slot
+    
+    def observe(self, key: tuple, timestamps: np.ndarray, values: np.ndarray):
+        """Queue points for the next evaluate(); when the queue is full the oldest batch is dropped"""
+        if len(self.pending) == self.pending.maxlen:
+            self.counters["batches_dropped"] += 1
+        self.pending.append((self._slot(key), np.asarray(timestamps, dtype=np.float64), np.asarray(values, dtype=np.float64)))
+    
+    def evaluate(self, flag: bool = True) -> List[Dict[str, Any]]:
+        """
+        Advance every series past its queued points. Points at or before a
+        series' last evaluated timestamp are ignored (re-fetched windows).
+        The k-th new point of every series is processed in the same vectorized
+        step, so the Python loop runs once per point depth, not per series.
+        """
+        if not self.pending:
+            return []
+        slots = np.concatenate([np.full(len(ts), slot) for slot, ts, _ in self.pending])
+        timestamps = np.concatenate([ts for _, ts, _ in self.pending])
+        values = np.concatenate([v for _, _, v in self.pending])
+        self.pending.clear()
+        
+        fresh = timestamps > self.last_ts[slots]
+        slots, timestamps, values = slots[fresh], timestamps[fresh], values[fresh]
+        if not len(slots):
+            return []
+        order = np.lexsort((timestamps, slots))
+        slots, timestamps, values = slots[order], timestamps[order], values[order]
+        # Drop repeated timestamps within a series, keeping the last value
+        last_of_run = np.r_[(slots[1:] != slots[:-1]) | (timestamps[1:] != timestamps[:-1]), True]
+        slots, timestamps, values = slots[last_of_run], timestamps[last_of_run], values[last_of_run]
+        starts = np.flatnonzero(np.r_[True, slots[1:] != slots[:-1]])
+        depth = np.arange(len(slots)) - np.repeat(starts, np.diff(np.r_[starts, len(slots)]))
+        
+        flagged = []
+        alpha = SPIKE_EWMA_ALPHA
+        cooldown = SPIKE_COOLDOWN_HOURS * 3600
+        for d in range(int(depth.max()) + 1):
+            step = depth == d
+            s, t, x = slots[step], timestamps[step], values[step]
+            mean = self.mean[s]
+            std = np.maximum(np.sqrt(self.var[s]), SPIKE_MIN_STD)
+            z = np.where(self.count[s] > 0, (x - mean) / std, 0.0)
+            
+            spiking = (self.count[s] >= SPIKE_MIN_POINTS) & (z >= SPIKE_Z_THRESHOLD) & (t - self.last_spike[s] >= cooldown)
+            if flag and spiking.any():
+                for i in np.flatnonzero(spiking).tolist():
+                    flagged.append(self._spike(int(s[i]), float(t[i]), float(x[i]), float(mean[i]), float(z[i])))
+            self.last_spike[s[spiking]] = t[spiking]
+            
+            # Baseline update (first point seeds the mean)
+            delta = x - mean
+            first = self.count[s] == 0
+            self.mean[s] = np.where(first, x, mean + alpha * delta)
+            self.var[s] = np.where(first, 0.0, (1 - alpha) * (self.var[s] + alpha * delta * delta))
+            self.count[s] += 1
+            self.last_ts[s] = t
+            self.last_z[s] = z
+        
+        self.counters["points_evaluated"] += len(slots)
+        self.counters["spikes"] += len(flagged)
+        self.recent.extend(flagged)
+        return flagged
+    
+    def _spike(self, slot: int, at: float, value: float, baseline: float, z: float) -> Dict[str, Any]:
+        topic, source, geo = self.keys[slot]
+        return {
+            "topic": topic,
+            "source": source,
+            "geo": geo,
+            "value": round(value, 2),
+            "baseline": round(baseline, 2),
+            "z_score": round(z, 2),
+            "at": datetime.fromtimestamp(at, tz=timezone.utc).isoformat(),
+            "detected_at": datetime.now(timezone.utc).isoformat()
+        }
+    
+    def seed(self, store: "TopicSeriesStore"):
+        """Rebuild baselines from stored history without flagging old points"""
+        for key, series in store.series.items():
+            if len(self.pending) == self.pending.maxlen:
+                self.evaluate(flag=False)
+            self.observe(key, *series.view())
+        self.evaluate(flag=False)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "series": len(self.keys), "pending": len(self.pending), "recent": len(self.recent)}
+
+spike_detector = SpikeDetector()
+
+class TrendWatchlist:
+    """Topics each producer wants spike alerts for, persisted to <data_dir>/watchlist.json"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.producers: Dict[str, List[str]] = {}
+        self._keys: Dict[str, set] = {}
+    
+    def _index(self, producer: str):
+        self._keys[producer] = {trend_topic_key(topic) for topic in self.producers[producer]}
+    
+    def set(self, producer: str, topics: List[str]):
+        self.producers[producer] = list(dict.fromkeys(" ".join(t.split()) for t in topics if t.strip()))
+        self._index(producer)
+    
+    def remove(self, producer: str) -> bool:
+        self._keys.pop(producer, None)
+        return self.producers.pop(producer, None) is not None
+    
+    def watchers(self, topic: str) -> List[str]:
+        key = trend_topic_key(topic)
+        return [producer for producer, keys in self._keys.items() if key in keys]
+    
+    def _write(self, data: Dict[str, List[str]]):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".tmp", "w") as f:
+            json.dump(data, f)
+        os.replace(self.path + ".tmp", self.path)
+    
+    async def save(self):
+        await asyncio.to_thread(self._write, dict(self.producers))
+    
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                for producer, topics in json.load(f).items():
+                    self.set(producer, topics)
+        except Exception as e:
+            logger.error(f"❌ Could not load trend watchlist: {str(e)}")
+
+trend_watchlist = TrendWatchlist(os.path.join(HUB_DATA_DIR, "watchlist.json"))
+
+async def evaluate_spikes(source: str = None, params: Dict[str, Any] = None, payload: Dict[str, Any] = None):
+    """Ingest hook: run the detector over newly recorded points and alert watchers"""
+    for spike in spike_detector.evaluate():
+        watchers = trend_watchlist.watchers(spike["topic"])
+        spike["watchers"] = watchers
+        logger.info(f"📈 Spike: {spike['topic']} on {spike['source']} (z={spike['z_score']}, watched by {len(watchers)})")
+        for producer in watchers:
+            await db_writer.put("workflow_events", {
+                "event_type": "trend_spike",
+                "source_system": "management_hub",
+                "target_system": producer,
+                "status": "completed",
+                "payload": spike,
+                "created_at": datetime.now(timezone.utc).isoformat()
+            })
+
+INGEST_HOOKS.append(evaluate_spikes)
+
+# Individual items (posts, articles, papers, videos) in an ingested payload:
+# source -> (list key, id field, title, extra text)
+INGESTED_ITEM_FIELDS = {
+    "reddit": ("posts", "link", lambda p: p.get("title", ""), lambda p: p.get("summary", "")),
+    "news": ("articles", "url", lambda a: a.get("title", ""), lambda a: a.get("description") or ""),
+    "pubmed": ("articles", "pmid", lambda a: a.get("title", ""), lambda a: a.get("abstract", "")),
+    "newsletters": ("articles", "link", lambda a: a.get("title", ""), lambda a: a.get("summary", "")),
+    "tiktok": ("videos", "id", lambda v: v.get("description", ""), lambda v: " ".join(v.get("hashtags", []))),
+    "youtube": ("videos", "id", lambda v: v.get("title", ""), lambda v: v.get("description", "")),
+    "podcasts": ("podcasts", "id", lambda p: p.get("name", ""), lambda p: f"{p.get('artist', '')} {p.get('genre', '')}"),
+}
+
+# Per-item publication date and engagement (views, ratings) where a source has them
+INGESTED_ITEM_METADATA = {
+    "reddit": (lambda p: p.get("published"), lambda p: 0),
+    "news": (lambda a: a.get("published"), lambda a: 0),
+    "pubmed": (lambda a: a.get("pub_date"), lambda a: 0),
+    "newsletters": (lambda a: a.get("published"), lambda a: 0),
+    "tiktok": (lambda v: v.get("created_at"), lambda v: (v.get("stats") or {}).get("views", 0)),
+    "youtube": (lambda v: v.get("published"), lambda v: v.get("views", 0)),
+    "podcasts": (lambda p: None, lambda p: p.get("rating_count", 0)),
+}
+
+def ingested_items(source: str, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    if source not in INGESTED_ITEM_FIELDS:
+        return []
+    list_key, id_field, title, text = INGESTED_ITEM_FIELDS[source]
+    items = []
+    for raw in payload.get(list_key) or []:
+        item_title = title(raw)
+        if not item_title:
+            continue
+        items.append({
+            "source": source,
+            "id": str(raw.get(id_field) or item_title),
+            "title": item_title,
+            "text": text(raw),
+            "url": raw.get("url") or raw.get("link"),
+            "raw": raw
+        })
+    return items
+
+# Emerging terms - n-grams of every ingested title, counted per hour in a
+# Count-Min sketch (all buckets in one numpy array) with a Space-Saving
+# summary per bucket supplying the candidate heavy hitters. Memory is fixed
+# by the window length, sketch size, summary capacity and EMERGING_MAX_ITEMS
+# (item ids remembered to skip re-ingested items).
+EMERGING_BUCKET_SECONDS = 3600
+EMERGING_WINDOW_HOURS = int(os.getenv("EMERGING_WINDOW_HOURS", "24"))
+EMERGING_RECENT_HOURS = int(os.getenv("EMERGING_RECENT_HOURS", "3"))
+EMERGING_CAPACITY = int(os.getenv("EMERGING_CAPACITY", "500"))
+EMERGING_MIN_VELOCITY = float(os.getenv("EMERGING_MIN_VELOCITY", "1.5"))
+EMERGING_MAX_ITEMS = int(os.getenv("EMERGING_MAX_ITEMS", "50000"))
+EMERGING_SKETCH_WIDTH = 4096
+EMERGING_SKETCH_DEPTH = 4
+EMERGING_MAX_NGRAM = 3
+
+STOPWORDS = frozenset("""
+a about after all also am an and any are as at be been before being but by can could did do does doing
+don down during each few for from get gets got had has have having he her here hers him his how i if in
+into is it its just me more most my new no nor not now of off on once only or other our out over own
+said same says she should so some such than that the their them then there these they this those
+through to too under until up very via vs was we were what when where which while who whom why will
+with would you your yours yourself s t re ve ll d m one two three first last best top study studies
+according things thing way ways make makes made day days week year years people time really like
+""".split())
+
+class SpaceSaving:
+    """Top-`capacity` counter: a new term evicts the current minimum and inherits its count as error"""
+    __slots__ = ("capacity", "counts", "errors", "sources", "examples", "_heap")
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.sources: Dict[str, set] = {}
+        self.examples: Dict[str, str] = {}
+        self._heap: List[tuple] = []
+    
+    def add(self, term: str, count: int, sources: set, example: str):
+        if term in self.counts:
+            self.counts[term] += count
+            self.sources[term] |= sources
+        else:
+            floor = 0
+            if len(self.counts) >= self.capacity:
+                while self._heap[0][0] != self.counts.get(self._heap[0][1]):
+                    heapq.heappop(self._heap)
+                floor, evicted = heapq.heappop(self._heap)
+                for table in (self.counts, self.errors, self.sources, self.examples):
+                    del table[evicted]
+            self.counts[term] = floor + count
+            self.errors[term] = floor
+            self.sources[term] = set(sources)
+            self.examples[term] = example
+        heapq.heappush(self._heap, (self.counts[term], term))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, term) for term, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+class EmergingTerms:
+    def __init__(self):
+        buckets = EMERGING_WINDOW_HOURS
+        self.sketch = np.zeros((buckets, EMERGING_SKETCH_DEPTH, EMERGING_SKETCH_WIDTH), dtype=np.int32)
+        self.bucket_starts = np.full(buckets, -1, dtype=np.int64)
+        self.summaries: List[Optional[SpaceSaving]] = [None] * buckets
+        rng = np.random.default_rng(20240601)
+        self._hash_a = rng.integers(1, 2 ** 61, EMERGING_SKETCH_DEPTH, dtype=np.uint64) | np.uint64(1)
+        self._hash_b = rng.integers(0, 2 ** 61, EMERGING_SKETCH_DEPTH, dtype=np.uint64)
+        self._seen: "OrderedDict[tuple, int]" = OrderedDict()
+        self.counters = {"items": 0, "duplicates": 0, "ngrams": 0, "seen_evicted": 0}
+    
+    def _columns(self, terms: List[str]) -> np.ndarray:
+        """Sketch column of each term in each row, shape (depth, len(terms))"""
+        hashes = np.array([hash(term) for term in terms], dtype=np.int64).view(np.uint64)
+        with np.errstate(over="ignore"):
+            mixed = self._hash_a[:, None] * hashes[None, :] + self._hash_b[:, None]
+        return ((mixed >> np.uint64(32)) % np.uint64(EMERGING_SKETCH_WIDTH)).astype(np.intp)
+    
+    def _bucket(self, now: float) -> int:
+        start = int(now // EMERGING_BUCKET_SECONDS)
+        index = start % len(self.bucket_starts)
+        if self.bucket_starts[index] != start:
+            # Slot last used a full window ago - recycle it
+            self.bucket_starts[index] = start
+            self.sketch[index] = 0
+            self.summaries[index] = SpaceSaving(EMERGING_CAPACITY)
+        return index
+    
+    @staticmethod
+    def overlapping(a: List[str], b: List[str]) -> bool:
+        """True when the phrases share words at a seam ("magnesium glycinate changed" / "changed my sleep")"""
+        for first, second in ((a, b), (b, a)):
+            for k in range(1, min(len(first), len(second)) + 1):
+                if first[-k:] == second[:k]:
+                    return True
+        return False
+    
+    @staticmethod
+    def ngrams(words: List[str]) -> set:
+        grams = set()
+        for n in range(1, EMERGING_MAX_NGRAM + 1):
+            for i in range(len(words) - n + 1):
+                first, last = words[i], words[i + n - 1]
+                if first in STOPWORDS or last in STOPWORDS or len(first) < 3 or len(last) < 3:
+                    continue
+                if first.isdigit() or last.isdigit():
+                    continue
+                grams.add(" ".join(words[i:i + n]))
+        return grams
+    
+    def ingest(self, items: List[Dict[str, Any]], now: Optional[float] = None):
+        """Count each item's n-grams once (items already seen inside the window are skipped)"""
+        now = time.time() if now is None else now
+        index = self._bucket(now)
+        window_start = now - EMERGING_WINDOW_HOURS * EMERGING_BUCKET_SECONDS
+        while self._seen and next(iter(self._seen.values())) < window_start:
+            self._seen.popitem(last=False)
+        
+        fresh = []
+        for item in items:
+            key = (item["source"], item["id"])
+            if key in self._seen:
+                self.counters["duplicates"] += 1
+                continue
+            self._seen[key] = now
+            if len(self._seen) > EMERGING_MAX_ITEMS:
+                self._seen.popitem(last=False)
+                self.counters["seen_evicted"] += 1
+            fresh.append(item)
+        if not fresh:
+            return
+        
+        counts: Dict[str, int] = {}
+        sources: Dict[str, set] = {}
+        examples: Dict[str, str] = {}
+        for item, words in zip(fresh, tokenize_texts([item["title"] for item in fresh])):
+            for gram in self.ngrams(words):
+                counts[gram] = counts.get(gram, 0) + 1
+                sources.setdefault(gram, set()).add(item["source"])
+                examples.setdefault(gram, item["title"][:100])
+        if not counts:
+            return
+        terms = list(counts)
+        columns = self._columns(terms)
+        increments = np.array([counts[term] for term in terms], dtype=np.int32)
+        for row in range(EMERGING_SKETCH_DEPTH):
+            np.add.at(self.sketch[index, row], columns[row], increments)
+        summary = self.summaries[index]
+        for term in terms:
+            summary.add(term, counts[term], sources[term], examples[term])
+        self.counters["items"] += len(fresh)
+        self.counters["ngrams"] += len(terms)
+    
+    def top(self, limit: int = 20, min_count: int = 3, include_known: bool = False,
+            now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Candidates from the window's Space-Saving summaries, counted with the
+        sketch: velocity compares the hourly rate over the last
+        EMERGING_RECENT_HOURS with the rate over the rest of the window.
+        """
+        now = time.time() if now is None else now
+        current = int(now // EMERGING_BUCKET_SECONDS)
+        age = current - self.bucket_starts
+        live = (self.bucket_starts >= 0) & (age >= 0) & (age < EMERGING_WINDOW_HOURS)
+        recent = live & (age < EMERGING_RECENT_HOURS)
+        if not recent.any():
+            return []
+        
+        sources: Dict[str, set] = {}
+        examples: Dict[str, str] = {}
+        for index in np.flatnonzero(live).tolist():
+            summary = self.summaries[index]
+            for term in summary.counts:
+                sources.setdefault(term, set()).update(summary.sources[term])
+                examples.setdefault(term, summary.examples[term])
+        if not include_known:
+            known = known_keyword_variants()
+            sources = {term: s for term, s in sources.items() if term not in known}
+        if not sources:
+            return []
+        
+        terms = list(sources)
+        columns = self._columns(terms)
+        rows = np.arange(EMERGING_SKETCH_DEPTH)[:, None]
+        # (buckets, depth, terms) -> per-bucket estimate = min over rows
+        estimates = self.sketch[:, rows, columns].min(axis=1)
+        recent_counts = estimates[recent].sum(axis=0)
+        older_counts = estimates[live & ~recent].sum(axis=0)
+        older_hours = max(int((live & ~recent).sum()), 1)
+        # The current hour is partial: rate over the time actually elapsed
+        recent_hours = int(recent.sum()) - 1 + (now % EMERGING_BUCKET_SECONDS) / EMERGING_BUCKET_SECONDS
+        velocity = (recent_counts / max(recent_hours, 0.25) + 1) / (older_counts / older_hours + 1)
+        score = recent_counts * np.log2(np.maximum(velocity, 1.0))
+        
+        keep = np.flatnonzero((recent_counts >= min_count) & (velocity >= EMERGING_MIN_VELOCITY))
+        ranked = keep[np.argsort(-score[keep], kind="stable")][:limit * 5].tolist()
+        # Drop fragments of a longer candidate phrase that carries most of their count
+        # ("magnesium" / "glycinate" under "magnesium glycinate"), and extensions of
+        # a listed phrase that only occur in a small share of it ("fasting magnesium glycinate").
+        # A phrase overlapping a higher-ranked one with the same count comes from the
+        # same headlines ("changed my sleep" under "magnesium glycinate changed")
+        phrases = [(f" {terms[i]} ", recent_counts[i]) for i in ranked if " " in terms[i]]
+        results = []
+        listed = []
+        for i in ranked:
+            padded = f" {terms[i]} "
+            words = terms[i].split()
+            if any(padded in phrase and padded != phrase and count >= 0.8 * recent_counts[i] for phrase, count in phrases):
+                continue
+            if any(term in padded and count >= 2 * recent_counts[i] for term, _, count in listed):
+                continue
+            if any(count == recent_counts[i] and self.overlapping(words, other) for _, other, count in listed):
+                continue
+            listed.append((padded, words, recent_counts[i]))
+            term = terms[i]
+            results.append({
+                "term": term,
+                "recent_count": int(recent_counts[i]),
+                "window_count": int(recent_counts[i] + older_counts[i]),
+                "velocity": round(float(velocity[i]), 2),
+                "score": round(float(score[i]), 2),
+                "sources": sorted(sources[term]),
+                "example": examples.get(term)
+            })
+            if len(results) >= limit:
+                break
+        return results
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "tracked_items": len(self._seen),
+            "sketch_bytes": self.sketch.nbytes,
+            "candidates": sum(len(s.counts) for s in self.summaries if s is not None)
+        }
+
+emerging_terms = EmergingTerms()
+
+def known_keyword_variants() -> frozenset:
+    """Every term (and plural) of every keyword taxonomy group"""
+    return frozenset(variant for matcher in KEYWORD_MATCHERS.values() for variant in matcher._variants)
+
+EMERGING_SOURCES = ["reddit", "news", "pubmed", "newsletters", "tiktok"]
+
+def count_emerging_terms(source: str, params: Dict[str, Any], payload: Dict[str, Any]):
+    """Ingest hook: feed every ingested title to the emerging-terms stage"""
+    if source in EMERGING_SOURCES:
+        emerging_terms.ingest(ingested_items(source, payload))
+
+INGEST_HOOKS.append(count_emerging_terms)
+
+# Near-duplicate stories - MinHash signatures over each item's title and lead
+# words, indexed by LSH bands: an insert only compares against clusters that
+# share a band, so cost follows the bucket sizes rather than the corpus size.
+# The same story from news, Reddit and a newsletter lands in one cluster.
+DEDUP_PERMUTATIONS = 64
+DEDUP_BANDS = 16  # 4 rows each: pairs around Jaccard 0.5 and above become candidates
+DEDUP_SIMILARITY = float(os.getenv("DEDUP_SIMILARITY", "0.5"))
+DEDUP_WINDOW_HOURS = int(os.getenv("DEDUP_WINDOW_HOURS", "72"))
+DEDUP_MAX_CLUSTERS = int(os.getenv("DEDUP_MAX_CLUSTERS", "20000"))
+DEDUP_LEAD_WORDS = 30
+# When a story appears in several payloads, the copy kept is the one from the earliest source here
+DEDUP_SOURCE_ORDER = ["news", "pubmed", "newsletters", "reddit", "tiktok"]
+MINHASH_PRIME = np.uint64(4294967291)  # largest prime below 2^32
+
+class StoryCluster:
+    __slots__ = ("id", "signature", "members", "sources", "band_keys", "first_seen", "last_seen")
+    
+    def __init__(self, cluster_id: int, signature: Optional[np.ndarray], now: float):
+        self.id = cluster_id
+        self.signature = signature
+        self.members: List[Dict[str, Any]] = []
+        self.sources: Dict[str, int] = {}
+        self.band_keys: List[tuple] = []
+        self.first_seen = now
+        self.last_seen = now
+    
+    def signal(self) -> float:
+        """Cross-source strength: each distinct source counts fully, repeats within a source a quarter"""
+        weight = len(self.sources) + 0.25 * (len(self.members) - len(self.sources))
+        return round(100 * (1 - 0.6 ** weight), 1)
+    
+    def summary(self) -> Dict[str, Any]:
+        lead = self.members[0]
+        return {
+            "cluster_id": self.id,
+            "title": lead["title"],
+            "url": lead.get("url"),
+            "sources": sorted(self.sources),
+            "size": len(self.members),
+            "signal": self.signal(),
+            "members": [{"source": m["source"], "title": m["title"][:120], "url": m.get("url")} for m in self.members[:10]],
+            "first_seen": datetime.fromtimestamp(self.first_seen, tz=timezone.utc).isoformat(),
+            "last_seen": datetime.fromtimestamp(self.last_seen, tz=timezone.utc).isoformat()
+        }
+
+class NearDuplicateIndex:
+    def __init__(self):
+        rng = np.random.default_rng(20240602)
+        self._a = rng.integers(1, int(MINHASH_PRIME), DEDUP_PERMUTATIONS, dtype=np.uint64)
+        self._b = rng.integers(0, int(MINHASH_PRIME), DEDUP_PERMUTATIONS, dtype=np.uint64)
+        self.clusters: "OrderedDict[int, StoryCluster]" = OrderedDict()
+        self.items: Dict[tuple, int] = {}
+        self.bands: Dict[tuple, List[int]] = {}
+        self._next_id = 1
+        self.counters = {"inserted": 0, "joined": 0, "comparisons": 0, "evicted": 0}
+    
+    @staticmethod
+    def shingles(words: List[str]) -> set:
+        return {word[:-1] if len(word) > 4 and word.endswith("s") else word
+                for word in words if len(word) > 2 and word not in STOPWORDS}
+    
+    def signature(self, shingles: set) -> np.ndarray:
+        hashes = np.array([hash(shingle) & 0xFFFFFFFF for shingle in shingles], dtype=np.uint64)
+        return ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % MINHASH_PRIME).min(axis=1).astype(np.uint32)
+    
+    @staticmethod
+    def words(items: List[Dict[str, Any]]) -> List[List[str]]:
+        return tokenize_texts([item["title"] + " " + " ".join(item.get("text", "").split()[:DEDUP_LEAD_WORDS]) for item in items])
+    
+    @staticmethod
+    def band_keys(signature: np.ndarray) -> List[tuple]:
+        return [(band, rows.tobytes()) for band, rows in enumerate(signature.reshape(DEDUP_BANDS, -1))]
+    
+    @staticmethod
+    def closest(signature: np.ndarray, band_keys: List[tuple], bands: Dict[tuple, List[int]], signatures) -> tuple:
+        """(most similar cluster id at or above DEDUP_SIMILARITY or None, candidates compared)"""
+        candidates = list({cid for band_key in band_keys for cid in bands.get(band_key, ())})
+        if not candidates:
+            return None, 0
+        similarity = (np.stack([signatures(cid) for cid in candidates]) == signature).mean(axis=1)
+        best = int(np.argmax(similarity))
+        return (candidates[best] if similarity[best] >= DEDUP_SIMILARITY else None), len(candidates)
+    
+    def add(self, items: List[Dict[str, Any]], now: Optional[float] = None) -> List[int]:
+        """Cluster id for each item, inserting the ones not indexed yet"""
+        now = time.time() if now is None else now
+        self._evict(now)
+        cluster_ids = []
+        for item, words in zip(items, self.words(items)):
+            key = (item["source"], item["id"])
+            cluster_id = self.items.get(key)
+            if cluster_id is not None:
+                cluster = self.clusters[cluster_id]
+                cluster.last_seen = now
+                self.clusters.move_to_end(cluster_id)
+                cluster_ids.append(cluster_id)
+                continue
+            cluster_ids.append(self._insert(key, item, self.shingles(words), now))
+        return cluster_ids
+    
+    def match(self, items: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Cluster id for each item without changing the index: its own cluster
+        when indexed, else the most similar indexed cluster. Items matching
+        neither share a negative id with similar items in the same call, and
+        items with too little text get None.
+        """
+        local_bands: Dict[tuple, List[int]] = {}
+        local_signatures: Dict[int, np.ndarray] = {}
+        cluster_ids = []
+        for item, words in zip(items, self.words(items)):
+            cluster_id = self.items.get((item["source"], item["id"]))
+            shingles = self.shingles(words) if cluster_id is None else ()
+            if len(shingles) >= 3:
+                signature = self.signature(shingles)
+                band_keys = self.band_keys(signature)
+                cluster_id, _ = self.closest(signature, band_keys, self.bands, lambda cid: self.clusters[cid].signature)
+                if cluster_id is None:
+                    cluster_id, _ = self.closest(signature, band_keys, local_bands, local_signatures.get)
+                if cluster_id is None:
+                    cluster_id = -(len(local_signatures) + 1)
+                    local_signatures[cluster_id] = signature
+                    for band_key in band_keys:
+                        local_bands.setdefault(band_key, []).append(cluster_id)
+            cluster_ids.append(cluster_id)
+        return cluster_ids
+    
+    def _insert(self, key: tuple, item: Dict[str, Any], shingles: set, now: float) -> int:
+        self.counters["inserted"] += 1
+        member = {"source": item["source"], "id": item["id"], "title": item["title"], "url": item.get("url")}
+        # Too little text to compare reliably - keep it on its own
+        signature = self.signature(shingles) if len(shingles) >= 3 else None
+        band_keys = []
+        cluster = None
+        if signature is not None:
+            band_keys = self.band_keys(signature)
+            cluster_id, compared = self.closest(signature, band_keys, self.bands, lambda cid: self.clusters[cid].signature)
+            self.counters["comparisons"] += compared
+            if cluster_id is not None:
+                cluster = self.clusters[cluster_id]
+                self.counters["joined"] += 1
+        
+        if cluster is None:
+            cluster = StoryCluster(self._next_id, signature, now)
+            self._next_id += 1
+            self.clusters[cluster.id] = cluster
+        else:
+            cluster.last_seen = now
+            self.clusters.move_to_end(cluster.id)
+        # Members' bands point at the cluster too, so a story can match any of its versions
+        for band_key in band_keys:
+            bucket = self.bands.setdefault(band_key, [])
+            if cluster.id not in bucket:
+                bucket.append(cluster.id)
+                cluster.band_keys.append(band_key)
+        cluster.members.append(member)
+        cluster.sources[item["source"]] = cluster.sources.get(item["source"], 0) + 1
+        self.items[key] = cluster.id
+        return cluster.id
+    
+    def _evict(self, now: float):
+        cutoff = now - DEDUP_WINDOW_HOURS * 3600
+        while self.clusters:
+            cluster = next(iter(self.clusters.values()))
+            if cluster.last_seen >= cutoff and len(self.clusters) <= DEDUP_MAX_CLUSTERS:
+                break
+            self.clusters.popitem(last=False)
+            for band_key in cluster.band_keys:
+                bucket = self.bands[band_key]
+                bucket.remove(cluster.id)
+                if not bucket:
+                    del self.bands[band_key]
+            for member in cluster.members:
+                self.items.pop((member["source"], member["id"]), None)
+            self.counters["evicted"] += 1
+    
+    def stories(self, min_sources: int = 2, limit: int = 20) -> List[Dict[str, Any]]:
+        matching = [c for c in self.clusters.values() if len(c.sources) >= min_sources and len(c.members) > 1]
+        matching.sort(key=lambda c: (c.signal(), c.last_seen), reverse=True)
+        return [cluster.summary() for cluster in matching[:limit]]
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "clusters": len(self.clusters),
+            "items": len(self.items),
+            "band_buckets": len(self.bands),
+            "multi_source_clusters": sum(1 for c in self.clusters.values() if len(c.sources) > 1)
+        }
+
+near_duplicates = NearDuplicateIndex()
+
+def index_near_duplicates(source: str, params: Dict[str, Any], payload: Dict[str, Any]):
+    """Ingest hook: cluster every ingested item with its near-duplicates"""
+    near_duplicates.add(ingested_items(source, payload))
+
+INGEST_HOOKS.append(index_near_duplicates)
+
+def dedupe_source_payloads(payloads: Dict[str, Dict[str, Any]]) -> tuple:
+    """
+    Drop items whose story already appeared in an earlier payload (or earlier
+    in the same one, sources in DEDUP_SOURCE_ORDER); the kept item gets
+    duplicates/also_in. A later source's list can therefore shrink, even to
+    empty. Items are only looked up in near_duplicates (ingestion indexes
+    them), so reads never change the index. Payloads are copied, never
+    modified, since they may be shared snapshots.
+    Returns (payloads, items removed).
+    """
+    seen: Dict[int, tuple] = {}
+    kept_lists: Dict[str, List[Dict[str, Any]]] = {}
+    removed = 0
+    deduped = {}
+    order = sorted(payloads, key=lambda source: DEDUP_SOURCE_ORDER.index(source) if source in DEDUP_SOURCE_ORDER else len(DEDUP_SOURCE_ORDER))
+    # One lookup across all sources, so items not indexed yet still match each other
+    items = [item for source in order if isinstance(payloads[source], dict) for item in ingested_items(source, payloads[source])]
+    by_raw = {id(item["raw"]): cluster_id for item, cluster_id in zip(items, near_duplicates.match(items))}
+    for source in order:
+        payload = payloads[source]
+        list_key = INGESTED_ITEM_FIELDS.get(source, (None,))[0]
+        if list_key is None or not isinstance(payload, dict) or not payload.get(list_key):
+            deduped[source] = payload
+            continue
+        kept = kept_lists[source] = []
+        for raw in payload[list_key]:
+            cluster_id = by_raw.get(id(raw))
+            if cluster_id is None:
+                kept.append(raw)
+            elif cluster_id not in seen:
+                seen[cluster_id] = (source, len(kept))
+                kept.append(raw)
+            else:
+                removed += 1
+                first_source, position = seen[cluster_id]
+                first = kept_lists[first_source][position]
+                if "also_in" not in first:
+                    first = kept_lists[first_source][position] = {**first, "duplicates": 0, "also_in": []}
+                first["duplicates"] += 1
+                if source not in first["also_in"]:
+                    first["also_in"].append(source)
+        deduped[source] = {**payload, list_key: kept}
+    return deduped, removed
+
+def story_trends(limit: int = 5) -> List[Dict[str, Any]]:
+    """Stories carried by several sources, as ranker items (their signal is already 0-100)"""
+    return [{
+        "topic": story["title"][:80],
+        "score": story["signal"],
+        "trend_direction": "rising",
+        "source": "Cross-source story",
+        "source_icon": "🧩",
+        "story_sources": story["sources"],
+        "size": story["size"],
+        "url": story["url"]
+    } for story in near_duplicates.stories(min_sources=2, limit=limit)]
+
+# Trend search - every ingested item in a local SQLite FTS5 index (title and
+# text, with source, date and engagement columns), so what the hub already
+# fetched can be searched without calling upstream APIs. Writes go through a
+# single writer thread; reads use per-thread connections (WAL mode).
+TREND_SEARCH_DB = os.path.join(HUB_DATA_DIR, "trend_items.db")
+TREND_SEARCH_RETENTION_DAYS = int(os.getenv("TREND_SEARCH_RETENTION_DAYS", "90"))
+TREND_SEARCH_SORTS = {
+    "relevance": "relevance",
+    "recent": "COALESCE(items.published, items.ingested_at) DESC, relevance",
+    "engagement": "items.engagement DESC, relevance"
+}
+
+TREND_SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    url TEXT,
+    published REAL,
+    engagement REAL NOT NULL DEFAULT 0,
+    ingested_at REAL NOT NULL,
+    UNIQUE (source, item_id)
+);
+CREATE INDEX IF NOT EXISTS idx_items_source_published ON items(source, published);
+CREATE INDEX IF NOT EXISTS idx_items_ingested ON items(ingested_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title, body, content='items', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE OF title, body ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    INSERT INTO items_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+"""
+
+def parse_item_date(value: Any) -> Optional[float]:
+    """Epoch seconds from an epoch number, RFC 822 / ISO 8601 string or PubMed date ("2024 Jan 5")"""
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    parsed = parse_episode_date(str(value))
+    if parsed is None:
+        for fmt in ("%Y %b %d", "%Y %b", "%Y"):
+            try:
+                parsed = datetime.strptime(str(value), fmt).replace(tzinfo=timezone.utc)
+                break
+            except ValueError:
+                continue
+    return parsed.timestamp() if parsed else None
+
+def fts_query(text: str) -> str:
+    """User text as an FTS5 query: every word must match, the last one as a prefix"""
+    words = [word.replace('"', '') for word in tokenize_texts([text])[0]]
+    words = [word for word in words if word]
+    if not words:
+        return ""
+    return " ".join(f'"{word}"' for word in words[:-1]) + (" " if len(words) > 1 else "") + f'"{words[-1]}"*'
+
+class TrendSearchIndex:
+    def __init__(self, path: str):
+        self.path = path
+        self.available = False
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search-writer")
+        self.readers = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-reader")
+        self._local = threading.local()
+        self.counters = {"indexed": 0, "searches": 0, "pruned": 0}
+    
+    def _connection(self):
+        """This thread's connection"""
+        if getattr(self._local, "connection", None) is None:
+            import sqlite3
+            connection = sqlite3.connect(self.path, timeout=10)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.row_factory = sqlite3.Row
+            self._local.connection = connection
+        return self._local.connection
+    
+    async def _run(self, executor: ThreadPoolExecutor, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, func, *args)
+    
+    def _create(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._connection().executescript(TREND_SEARCH_SCHEMA)
+    
+    async def start(self):
+        try:
+            await self._run(self.writer, self._create)
+            self.available = True
+        except Exception as e:
+            logger.error(f"❌ Trend search index unavailable (SQLite FTS5 required): {str(e)}")
+    
+    def _write(self, rows: List[tuple]):
+        connection = self._connection()
+        with connection:
+            connection.executemany("""
+                INSERT INTO items (source, item_id, title, body, url, published, engagement, ingested_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, item_id) DO UPDATE SET
+                    title = excluded.title,
+                    body = excluded.body,
+                    url = excluded.url,
+                    published = COALESCE(excluded.published, items.published),
+                    engagement = excluded.engagement,
+                    ingested_at = excluded.ingested_at
+            """, rows)
+    
+    async def index(self, source: str, items: List[Dict[str, Any]]):
+        if not self.available or not items:
+            return
+        published, engagement = INGESTED_ITEM_METADATA[source]
+        now = time.time()
+        rows = [(
+            source, item["id"], item["title"], item["text"] or "", item.get("url"),
+            parse_item_date(published(item["raw"])), float(engagement(item["raw"]) or 0), now
+        ) for item in items]
+        await self._run(self.writer, self._write, rows)
+        self.counters["indexed"] += len(rows)
+    
+    def _search(self, query: str, sources: List[str], since: Optional[float], sort: str, limit: int):
+        clauses = ["items_fts MATCH ?"]
+        params: List[Any] = [query]
+        if sources:
+            clauses.append(f"items.source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        if since is not None:
+            clauses.append("COALESCE(items.published, items.ingested_at) >= ?")
+            params.append(since)
+        params.append(limit)
+        rows = self._connection().execute(f"""
+            SELECT items.source, items.item_id, items.title, items.url, items.published, items.engagement,
+                   snippet(items_fts, 1, '<b>', '</b>', '…', 16) AS snippet,
+                   bm25(items_fts, 3.0, 1.0) AS relevance
+            FROM items_fts JOIN items ON items.id = items_fts.rowid
+            WHERE {' AND '.join(clauses)}
+            ORDER BY {TREND_SEARCH_SORTS[sort]}
+            LIMIT ?
+        """, params).fetchall()
+        return [dict(row) for row in rows]
+    
+    async def search(self, query: str, sources: List[str], since: Optional[float], sort: str, limit: int):
+        self.counters["searches"] += 1
+        return await self._run(self.readers, self._search, query, sources, since, sort, limit)
+    
+    def _prune(self, cutoff: float) -> int:
+        connection = self._connection()
+        with connection:
+            return connection.execute("DELETE FROM items WHERE ingested_at < ?", (cutoff,)).rowcount
+    
+    async def prune(self):
+        """Drop items not seen by ingestion for TREND_SEARCH_RETENTION_DAYS"""
+        if not self.available:
+            return
+        removed = await self._run(self.writer, self._prune, time.time() - TREND_SEARCH_RETENTION_DAYS * 86400)
+        self.counters["pruned"] += removed
+        logger.info(f"🧹 Trend search index pruned {removed} items")
+    
+    def _count(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    
+    async def stats(self) -> Dict[str, Any]:
+        items = await self._run(self.readers, self._count) if self.available else 0
+        return {**self.counters, "available": self.available, "items": items}
+    
+    def close(self):
+        self.writer.shutdown(wait=True)
+        self.readers.shutdown(wait=False)
+
+trend_search = TrendSearchIndex(TREND_SEARCH_DB)
+
+async def index_trend_items(source: str, params: Dict[str, Any], payload: Dict[str, Any]):
+    """Ingest hook: add or refresh every ingested item in the search index"""
+    await trend_search.index(source, ingested_items(source, payload))
+
+INGEST_HOOKS.append(index_trend_items)
+
+
+# Google Trends - pytrends is synchronous, so it runs on a small worker pool
+# with one reused TrendReq session (cookies, connection) per worker thread
+GOOGLE_TRENDS_ANCHOR = os.getenv("GOOGLE_TRENDS_ANCHOR", "weight loss")
+GOOGLE_TRENDS_BATCH_SIZE = 5  # Google compares at most 5 terms per request
+GOOGLE_TRENDS_HISTORY_TIMEFRAME = "now 7-d"
+GOOGLE_TRENDS_TIMEFRAMES = {
+    "today": "now 1-d",
+    "week": "now 7-d",
+    "month": "today 1-m",
+    "year": "today 12-m"
+}
+
+pytrends_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pytrends")
+pytrends_local = threading.local()
+
+def get_trend_req():
+    """This worker thread's TrendReq session"""
+    if getattr(pytrends_local, "client", None) is None:
+        from pytrends.request import TrendReq
+        pytrends_local.client = TrendReq(hl='en-US', tz=300)  # US Eastern timezone
+    return pytrends_local.client
+
+def fetch_interest_batch(terms: List[str], tf: str):
+    """interest_over_time for up to 5 terms (runs on a pytrends worker)"""
+    pytrends = get_trend_req()
+    pytrends.build_payload(terms, cat=0, timeframe=tf, geo='US', gprop='')
+    return pytrends.interest_over_time().drop(columns=["isPartial"], errors="ignore")
+
+def fetch_anchored_interest(topics: List[str], tf: str) -> Dict[str, Any]:
+    """
+    Fetch interest for any number of topics in batches of five that each
+    include the anchor term. Google scales every batch to its own peak, so
+    each batch is rescaled to match the anchor's level in the first batch,
+    then the merged series are normalized back to a 0-100 range.
+    """
+    import pandas as pd
+    
+    anchor = GOOGLE_TRENDS_ANCHOR
+    others = [t for t in topics if t != anchor]
+    per_batch = GOOGLE_TRENDS_BATCH_SIZE - 1
+    frames = []
+    reference = None
+    
+    for i in range(0, len(others), per_batch):
+        df = fetch_interest_batch([anchor] + others[i:i + per_batch], tf)
+        if df.empty:
+            continue
+        anchor_level = df[anchor].mean()
+        if reference is None:
+            reference = anchor_level
+        elif anchor_level > 0:
+            df = df * (reference / anchor_level)
+        frames.append(df if not frames else df.drop(columns=[anchor]))
+    
+    if not frames:
+        return {"dates": [], "timestamps": [], "series": {}}
+    
+    merged = pd.concat(frames, axis=1).fillna(0)
+    peak = merged.max().max()
+    if peak > 0:
+        merged = merged * (100 / peak)
+    merged = merged.round().astype(int)
+    
+    return {
+        "dates": [d.strftime("%Y-%m-%d") for d in merged.index],
+        "timestamps": [d.timestamp() for d in merged.index],
+        "series": {
+            topic: merged[topic].tolist()
+            for topic in topics if topic in merged.columns
+        }
+    }
+
+def fetch_topic_interest(topic: str, tf: str) -> Dict[str, Any]:
+    """Interest and rising related queries for a single topic (runs on a pytrends worker)"""
+    df = fetch_interest_batch([topic], tf)
+    result = {"dates": [], "series": {}, "related": {}}
+    if not df.empty and topic in df.columns:
+        result["dates"] = [d.strftime("%Y-%m-%d") for d in df.index]
+        result["series"][topic] = [int(v) for v in df[topic].tolist()]
+    
+    try:
+        related_queries = get_trend_req().related_queries()
+        if topic in related_queries and related_queries[topic]['rising'] is not None:
+            rising = related_queries[topic]['rising'].head(5).to_dict('records')
+            result["related"] = {"rising_queries": rising}
+    except Exception:
+        pass
+    return result
+
+@cached(ttl=3600, stale_ttl=3600, cache_if=lambda r: bool(r["series"]))
+async def get_google_interest(tf: str, force_refresh: bool = False) -> Dict[str, Any]:
+    """Anchored interest series for every HEALTH_TOPICS entry, cached per timeframe"""
+    loop = asyncio.get_running_loop()
+    interest = await loop.run_in_executor(pytrends_executor, fetch_anchored_interest, HEALTH_TOPICS, tf)
+    
+    # The anchored hourly week window feeds the topic history (one consistent
+    # scale and resolution; re-fetched hours take the latest value). Recorded
+    # here so only freshly fetched frames are ingested, never cached ones.
+    if tf == GOOGLE_TRENDS_HISTORY_TIMEFRAME:
+        for topic_name, values in interest["series"].items():
+            topic_series.record(topic_name, "google", series_geo("google"), interest["timestamps"], values)
+    return interest
+
+@app.get("/api/trends/google")
+@snapshot_served("google", interval=900, calls=[{}, {"timeframe": "week"}])
+@cached(ttl=900, stale_ttl=900)
+async def get_google_trends(
+    topic: str = None,
+    timeframe: str = "today",
+    force_refresh: bool = False
+):
+    """
+    Get Google Trends data for health & wellness topics (US-focused)
+    
     timeframe options:
     - "today" = last 24 hours
     - "week" = last 7 days  
@@ -900,81 +3493,50 @@ async def get_google_trends(
     - "year" = last 12 months
     """
     try:
-        from pytrends.request import TrendReq
-        
-        # Initialize pytrends for US
-        pytrends = TrendReq(hl='en-US', tz=300)  # US Eastern timezone
-        
-        # Map timeframe to pytrends format
-        timeframe_map = {
-            "today": "now 1-d",
-            "week": "now 7-d",
-            "month": "today 1-m",
-            "year": "today 12-m"
-        }
-        tf = timeframe_map.get(timeframe, "now 7-d")
+        tf = GOOGLE_TRENDS_TIMEFRAMES.get(timeframe, "now 7-d")
         
         # If specific topic requested
         if topic:
-            topics_to_search = [topic]
+            loop = asyncio.get_running_loop()
+            interest = await loop.run_in_executor(pytrends_executor, fetch_topic_interest, topic, tf)
         else:
-            # Get top 5 health topics
-            topics_to_search = HEALTH_TOPICS[:5]
-        
-        # Build payload with US geo
-        pytrends.build_payload(
-            topics_to_search,
-            cat=0,
-            timeframe=tf,
-            geo='US',  # US-focused
-            gprop=''
-        )
+            # All tracked topics, comparable across batches via the anchor term
+            interest = await get_google_interest(tf, force_refresh=force_refresh)
         
-        # Get interest over time
-        interest_df = pytrends.interest_over_time()
+        # Recorded topic history (see get_google_interest) for the tracked topics
+        history = not topic and tf == GOOGLE_TRENDS_HISTORY_TIMEFRAME
         
         results = []
-        if not interest_df.empty:
-            for topic_name in topics_to_search:
-                if topic_name in interest_df.columns:
-                    values = interest_df[topic_name].tolist()
-                    dates = [d.strftime("%Y-%m-%d") for d in interest_df.index]
-                    
-                    # Calculate trend direction
-                    if len(values) >= 2:
-                        recent_avg = sum(values[-3:]) / 3 if len(values) >= 3 else values[-1]
-                        older_avg = sum(values[:3]) / 3 if len(values) >= 3 else values[0]
-                        trend = "rising" if recent_avg > older_avg else "falling" if recent_avg < older_avg else "stable"
-                        change_pct = round(((recent_avg - older_avg) / max(older_avg, 1)) * 100, 1)
-                    else:
-                        trend = "stable"
-                        change_pct = 0
-                    
-                    results.append({
-                        "topic": topic_name,
-                        "interest_score": int(values[-1]) if values else 0,
-                        "peak_score": max(values) if values else 0,
-                        "trend": trend,
-                        "change_percent": change_pct,
-                        "data_points": list(zip(dates, values))[-10:],  # Last 10 points
-                        "source": "Google Trends",
-                        "region": "US"
-                    })
+        dates = interest["dates"]
+        for topic_name, values in interest["series"].items():
+            # Trend direction: mean of the last three points against the first three
+            window = np.asarray(values, dtype=np.float32)
+            if len(window) >= 2:
+                edge = min(3, len(window) - 1)
+                recent_avg, older_avg = window[-edge:].mean(), window[:edge].mean()
+                trend = "rising" if recent_avg > older_avg else "falling" if recent_avg < older_avg else "stable"
+                change_pct = round(float((recent_avg - older_avg) / max(older_avg, 1) * 100), 1)
+            else:
+                trend = "stable"
+                change_pct = 0
+            
+            results.append({
+                "topic": topic_name,
+                "interest_score": int(values[-1]) if values else 0,
+                "peak_score": max(values) if values else 0,
+                "trend": trend,
+                "change_percent": change_pct,
+                "data_points": list(zip(dates, values))[-10:],  # Last 10 points
+                "history": topic_series.summary(topic_name, "google", series_geo("google")) if history else None,
+                "source": "Google Trends",
+                "region": "US"
+            })
         
-        # Also get related queries for insights
-        related = {}
-        if topic:
-            try:
-                related_queries = pytrends.related_queries()
-                if topic in related_queries and related_queries[topic]['rising'] is not None:
-                    rising = related_queries[topic]['rising'].head(5).to_dict('records')
-                    related = {"rising_queries": rising}
-            except:
-                pass
+        results.sort(key=lambda r: r["interest_score"], reverse=True)
         
         return {
             "trends": results,
-            "related": related,
+            "related": interest.get("related", {}),
             "timeframe": timeframe,
             "region": "US",
             "source": "Google Trends",
@@ -992,43 +3554,109 @@ async def get_google_trends(
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
+# YouTube Data API - the discovery-built service is created once per worker
+# thread (httplib2 isn't thread-safe) and requests run off the event loop
+YOUTUBE_STATS_TTL = int(os.getenv("YOUTUBE_STATS_TTL", "600"))
+YOUTUBE_MAX_IDS_PER_CALL = 50
+
+youtube_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="youtube")
+youtube_local = threading.local()
+
+def get_youtube_service():
+    """This worker thread's YouTube service object, built once"""
+    if getattr(youtube_local, "service", None) is None:
+        from googleapiclient.discovery import build
+        # The v3 discovery document ships with the client - no fetch needed
+        youtube_local.service = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY, cache_discovery=False)
+    return youtube_local.service
+
+async def youtube_call(make_request) -> Dict[str, Any]:
+    """Build and execute a YouTube API request on the YouTube worker pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(youtube_executor, lambda: make_request(get_youtube_service()).execute())
+
+async def youtube_search(query: str, max_results: int, published_after: str) -> List[Dict[str, Any]]:
+    """search().list, following nextPageToken until max_results items"""
+    items = []
+    page_token = None
+    while len(items) < max_results:
+        response = await youtube_call(lambda youtube: youtube.search().list(
+            q=query,
+            part='snippet',
+            type='video',
+            order='viewCount',  # Most viewed
+            regionCode='US',    # US-focused
+            relevanceLanguage='en',
+            publishedAfter=published_after,
+            maxResults=min(YOUTUBE_MAX_IDS_PER_CALL, max_results - len(items)),
+            videoCategoryId='26',  # How-to & Style (includes health/wellness)
+            pageToken=page_token
+        ))
+        items.extend(response.get('items', []))
+        page_token = response.get('nextPageToken')
+        if not page_token:
+            break
+    return items[:max_results]
+
+async def youtube_video_stats(video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Per-video statistics, served from cache where fresh and batched 50 IDs per call otherwise"""
+    stats_map = {}
+    missing = []
+    for video_id in video_ids:
+        entry = response_cache.get(("youtube_stats", video_id))
+        if entry is not None:
+            stats_map[video_id] = entry.value
+        else:
+            missing.append(video_id)
+    
+    batches = [missing[i:i + YOUTUBE_MAX_IDS_PER_CALL] for i in range(0, len(missing), YOUTUBE_MAX_IDS_PER_CALL)]
+    responses = await asyncio.gather(*(
+        youtube_call(lambda youtube, ids=batch: youtube.videos().list(
+            part='statistics,contentDetails',
+            id=','.join(ids)
+        ))
+        for batch in batches
+    ))
+    
+    for response in responses:
+        for item in response.get('items', []):
+            stats = {
+                'views': int(item['statistics'].get('viewCount', 0)),
+                'likes': int(item['statistics'].get('likeCount', 0)),
+                'comments': int(item['statistics'].get('commentCount', 0)),
+                'duration': item['contentDetails'].get('duration', '')
+            }
+            response_cache.set(("youtube_stats", item['id']), stats, ttl=YOUTUBE_STATS_TTL)
+            stats_map[item['id']] = stats
+    
+    return stats_map
+
 @app.get("/api/trends/youtube")
+@snapshot_served("youtube", interval=600, calls=[{}, {"max_results": 5}])
+@cached(ttl=600, stale_ttl=600)
 async def get_youtube_trends(
     topic: str = None,
-    max_results: int = 10
+    max_results: int = 10,
+    force_refresh: bool = False
 ):
     """
     Get trending YouTube videos in health & wellness category (US-focused)
     """
     try:
-        from googleapiclient.discovery import build
-        
-        api_key = YOUTUBE_API_KEY
-        if not api_key:
+        if not YOUTUBE_API_KEY:
             raise HTTPException(status_code=500, detail="YouTube API key not configured")
         
-        youtube = build('youtube', 'v3', developerKey=api_key)
-        
         # Search for health/wellness videos in US
         search_query = topic if topic else "health wellness longevity"
+        published_after = (datetime.now(timezone.utc) - timedelta(days=30)).strftime('%Y-%m-%dT%H:%M:%SZ')
         
         # Search for recent popular videos
-        search_response = youtube.search().list(
-            q=search_query,
-            part='snippet',
-            type='video',
-            order='viewCount',  # Most viewed
-            regionCode='US',    # US-focused
-            relevanceLanguage='en',
-            publishedAfter=(datetime.now(timezone.utc) - timedelta(days=30)).isoformat() + 'Z',
-            maxResults=max_results,
-            videoCategoryId='26'  # How-to & Style (includes health/wellness)
-        ).execute()
+        search_items = await youtube_search(search_query, max_results, published_after)
         
         videos = []
         video_ids = []
         
-        for item in search_response.get('items', []):
+        for item in search_items:
             video_ids.append(item['id']['videoId'])
             videos.append({
                 'id': item['id']['videoId'],
@@ -1041,19 +3669,7 @@ async def get_youtube_trends(
         
         # Get video statistics
         if video_ids:
-            stats_response = youtube.videos().list(
-                part='statistics,contentDetails',
-                id=','.join(video_ids)
-            ).execute()
-            
-            stats_map = {}
-            for item in stats_response.get('items', []):
-                stats_map[item['id']] = {
-                    'views': int(item['statistics'].get('viewCount', 0)),
-                    'likes': int(item['statistics'].get('likeCount', 0)),
-                    'comments': int(item['statistics'].get('commentCount', 0)),
-                    'duration': item['contentDetails'].get('duration', '')
-                }
+            stats_map = await youtube_video_stats(video_ids)
             
             # Merge stats with videos
             for video in videos:
@@ -1089,16 +3705,17 @@ async def get_youtube_trends(
         }
 
 @app.get("/api/trends/reddit")
+@snapshot_served("reddit", interval=300, calls=[{}, {"limit": 10}])
+@cached(ttl=300, stale_ttl=300)
 async def get_reddit_trends(
     subreddit: str = None,
-    limit: int = 20
+    limit: int = 20,
+    force_refresh: bool = False
 ):
     """
     Get trending discussions from health & wellness subreddits via RSS (no API key needed!)
     """
     try:
-        import feedparser
-        
         # Health & wellness subreddits to track
         health_subreddits = [
             "longevity",
@@ -1114,19 +3731,23 @@ async def get_reddit_trends(
         ]
         
         # If specific subreddit requested, use only that
-        subreddits_to_fetch = [subreddit] if subreddit else health_subreddits[:5]
+        subreddits_to_fetch = [subreddit] if subreddit else health_subreddits
         
         all_posts = []
         subreddit_stats = {}
         
-        for sub in subreddits_to_fetch:
+        # Fetch all RSS feeds concurrently
+        feeds = await feed_fetcher.fetch_many([
+            f"https://www.reddit.com/r/{sub}/hot.rss?limit={limit}" for sub in subreddits_to_fetch
+        ], limit=limit)
+        
+        for sub, entries in zip(subreddits_to_fetch, feeds):
             try:
-                # Fetch RSS feed
-                feed_url = f"https://www.reddit.com/r/{sub}/hot.rss?limit={limit}"
-                feed = feedparser.parse(feed_url)
+                if isinstance(entries, Exception):
+                    raise entries
                 
                 posts_from_sub = []
-                for entry in feed.entries[:limit]:
+                for entry in entries[:limit]:
                     # Extract post data
                     post = {
                         "id": entry.get("id", ""),
@@ -1155,31 +3776,13 @@ async def get_reddit_trends(
                 }
         
         # Extract trending keywords from titles
-        trending_keywords = {}
-        health_terms = [
-            "gut", "sleep", "hormone", "weight", "diet", "supplement", "vitamin",
-            "protein", "longevity", "aging", "skin", "hair", "mental", "anxiety",
-            "stress", "fitness", "workout", "fasting", "keto", "menopause",
-            "thyroid", "collagen", "magnesium", "zinc", "omega", "probiotic"
+        sorted_keywords = [
+            {"keyword": term, "count": count, "posts": examples}
+            for term, count, examples in KEYWORD_MATCHERS["reddit"].tally(
+                all_posts, lambda post: post["title"], lambda post: post["title"][:80], max_examples=3
+            )[:10]
         ]
         
-        for post in all_posts:
-            title_lower = post["title"].lower()
-            for term in health_terms:
-                if term in title_lower:
-                    if term not in trending_keywords:
-                        trending_keywords[term] = {"count": 0, "posts": []}
-                    trending_keywords[term]["count"] += 1
-                    if len(trending_keywords[term]["posts"]) < 3:
-                        trending_keywords[term]["posts"].append(post["title"][:80])
-        
-        # Sort keywords by count
-        sorted_keywords = sorted(
-            [{"keyword": k, **v} for k, v in trending_keywords.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:10]
-        
         return {
             "posts": all_posts,
             "total_posts": len(all_posts),
@@ -1191,14 +3794,6 @@ async def get_reddit_trends(
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
-    except ImportError:
-        logger.error("feedparser library not installed")
-        return {
-            "posts": [],
-            "error": "feedparser library not installed",
-            "message": "Reddit RSS temporarily unavailable",
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
     except Exception as e:
         logger.error(f"Reddit RSS error: {str(e)}")
         return {
@@ -1208,15 +3803,265 @@ async def get_reddit_trends(
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
+# PubMed - searches are stored on NCBI's history server (WebEnv/query_key) and
+# summaries/abstracts are pulled from it in batches, so a larger max_results
+# only fetches the missing tail. All E-utilities calls share one rate limiter.
+EUTILS_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+PUBMED_TTL = int(os.getenv("PUBMED_TTL", "1800"))
+PUBMED_BATCH_SIZE = int(os.getenv("PUBMED_BATCH_SIZE", "200"))
+PUBMED_MAX_RESULT_SETS = 64
+
+class AsyncTokenBucket:
+    """
+    Rate limiter shared by concurrent callers: acquire() waits until a token is
+    available. Waiters are served in arrival order.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.counters = {"acquired": 0, "waited": 0}
+    
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.counters["acquired"] += 1
+                    return
+                self.counters["waited"] += 1
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "rate_per_second": self.rate}
+
+ncbi_rate_limiter = AsyncTokenBucket(10 if NCBI_API_KEY else 3)
+
+class PubMedHistoryExpired(Exception):
+    """The WebEnv for a stored search is no longer available on NCBI's history server"""
+
+async def eutils_get(utility: str, params: Dict[str, Any]) -> httpx.Response:
+    """One rate-limited E-utilities request"""
+    params = {**params, "tool": "iaj-management-hub"}
+    if NCBI_API_KEY:
+        params["api_key"] = NCBI_API_KEY
+    if NCBI_EMAIL:
+        params["email"] = NCBI_EMAIL
+    
+    await ncbi_rate_limiter.acquire()
+    response = await http_clients.get("pubmed").get(f"{EUTILS_BASE}/{utility}.fcgi", params=params)
+    response.raise_for_status()
+    return response
+
+def pubmed_summary_article(pmid: str, article: Dict[str, Any]) -> Dict[str, Any]:
+    # Extract authors
+    authors = article.get("authors", [])
+    author_names = [a.get("name", "") for a in authors[:3]]
+    author_str = ", ".join(author_names)
+    if len(authors) > 3:
+        author_str += " et al."
+    
+    return {
+        "pmid": pmid,
+        "title": article.get("title", ""),
+        "authors": author_str,
+        "journal": article.get("fulljournalname", article.get("source", "")),
+        "pub_date": article.get("pubdate", ""),
+        "link": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+        "doi": article.get("elocationid", ""),
+        "source": "PubMed"
+    }
+
+def parse_pubmed_abstracts(content: bytes) -> Dict[str, str]:
+    """PMID -> abstract text from an efetch PubmedArticleSet (labelled sections kept)"""
+    from xml.etree import ElementTree
+    
+    root = ElementTree.fromstring(content)
+    records = [(article, "MedlineCitation/PMID", "MedlineCitation/Article/Abstract/AbstractText")
+               for article in root.iter("PubmedArticle")]
+    records += [(book, "BookDocument/PMID", "BookDocument/Abstract/AbstractText")
+                for book in root.iter("PubmedBookArticle")]
+    abstracts = {}
+    for article, pmid_path, abstract_path in records:
+        pmid = article.findtext(pmid_path)
+        sections = []
+        for section in article.findall(abstract_path):
+            text = "".join(section.itertext()).strip()
+            if text:
+                label = section.get("Label")
+                sections.append(f"{label}: {text}" if label else text)
+        if pmid:
+            abstracts[pmid] = " ".join(sections)
+    return abstracts
+
+class PubMedResultSet:
+    __slots__ = ("webenv", "query_key", "total_count", "articles", "abstracts", "created_at", "lock")
+    
+    def __init__(self):
+        self.webenv: Optional[str] = None
+        self.query_key: Optional[str] = None
+        self.total_count = 0
+        self.articles: List[Dict[str, Any]] = []
+        self.abstracts: Dict[str, str] = {}
+        self.created_at = 0.0
+        self.lock = asyncio.Lock()
+
+class PubMedPipeline:
+    """
+    Cached PubMed results per (term, days). The esearch result lives on the
+    history server; esummary (and efetch for abstracts) are requested in
+    batches of batch_size starting where the cached results end. Concurrent
+    callers for the same key wait on one lock, so the aggregate endpoint and
+    direct calls share upstream requests.
+    """
+    
+    def __init__(self, ttl: float, batch_size: int, max_result_sets: int):
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self.max_result_sets = max_result_sets
+        self._sets: "OrderedDict[tuple, PubMedResultSet]" = OrderedDict()
+        self.counters = {"esearch": 0, "esummary": 0, "efetch": 0, "hits": 0, "history_expired": 0}
+    
+    def _result_set(self, key: tuple) -> PubMedResultSet:
+        result_set = self._sets.get(key)
+        if result_set is None:
+            result_set = self._sets[key] = PubMedResultSet()
+            while len(self._sets) > self.max_result_sets:
+                self._sets.popitem(last=False)
+        self._sets.move_to_end(key)
+        return result_set
+    
+    async def _search(self, result_set: PubMedResultSet, term: str, days: int):
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        date_range = f"{start_date.strftime('%Y/%m/%d')}:{end_date.strftime('%Y/%m/%d')}[dp]"
+        
+        response = await eutils_get("esearch", {
+            "db": "pubmed",
+            "term": f"({term}) AND {date_range}",
+            "usehistory": "y",
+            "retmax": 0,
+            "sort": "relevance",
+            "retmode": "json"
+        })
+        self.counters["esearch"] += 1
+        search_data = response.json().get("esearchresult", {})
+        if "ERROR" in search_data:
+            raise RuntimeError(search_data["ERROR"])
+        
+        result_set.webenv = search_data.get("webenv")
+        result_set.query_key = search_data.get("querykey")
+        result_set.total_count = int(search_data.get("count", 0))
+        result_set.articles = []
+        result_set.abstracts = {}
+        result_set.created_at = time.time()
+    
+    def _history_params(self, result_set: PubMedResultSet, retstart: int, retmax: int) -> Dict[str, Any]:
+        return {
+            "db": "pubmed",
+            "WebEnv": result_set.webenv,
+            "query_key": result_set.query_key,
+            "retstart": retstart,
+            "retmax": retmax
+        }
+    
+    async def _extend_summaries(self, result_set: PubMedResultSet, wanted: int):
+        while len(result_set.articles) < wanted:
+            retstart = len(result_set.articles)
+            response = await eutils_get("esummary", {
+                **self._history_params(result_set, retstart, min(self.batch_size, wanted - retstart)),
+                "retmode": "json"
+            })
+            self.counters["esummary"] += 1
+            result = response.json().get("result")
+            if result is None:
+                raise PubMedHistoryExpired()
+            uids = result.get("uids", [])
+            if not uids:
+                break
+            result_set.articles.extend(
+                pubmed_summary_article(pmid, result[pmid]) for pmid in uids if pmid in result
+            )
+    
+    async def _extend_abstracts(self, result_set: PubMedResultSet, wanted: int):
+        # Abstracts are fetched for a prefix of the result list, in order
+        retstart = 0
+        for article in result_set.articles[:wanted]:
+            if article["pmid"] not in result_set.abstracts:
+                break
+            retstart += 1
+        while retstart < wanted:
+            count = min(self.batch_size, wanted - retstart)
+            response = await eutils_get("efetch", {
+                **self._history_params(result_set, retstart, count),
+                "rettype": "abstract",
+                "retmode": "xml"
+            })
+            self.counters["efetch"] += 1
+            if b"<PubmedArticleSet" not in response.content[:4096]:
+                raise PubMedHistoryExpired()
+            result_set.abstracts.update(await asyncio.to_thread(parse_pubmed_abstracts, response.content))
+            # Records efetch returned without an abstract (or not at all) are not asked for again
+            for article in result_set.articles[retstart:retstart + count]:
+                result_set.abstracts.setdefault(article["pmid"], "")
+            retstart += count
+    
+    async def get(self, term: str, days: int, max_results: int, abstracts: bool = False,
+                  force: bool = False) -> tuple:
+        """Returns (articles, total_count) for the first max_results matches; force re-runs the search"""
+        result_set = self._result_set((term, days))
+        async with result_set.lock:
+            if force or time.time() - result_set.created_at > self.ttl:
+                await self._search(result_set, term, days)
+            
+            wanted = min(max_results, result_set.total_count)
+            fetched = len(result_set.articles)
+            for attempt in range(2):
+                try:
+                    await self._extend_summaries(result_set, wanted)
+                    if abstracts:
+                        await self._extend_abstracts(result_set, wanted)
+                    break
+                except PubMedHistoryExpired:
+                    # WebEnv timed out on NCBI's side - run the search again once
+                    self.counters["history_expired"] += 1
+                    if attempt:
+                        raise RuntimeError("PubMed history server did not return results")
+                    await self._search(result_set, term, days)
+            if fetched >= wanted and not abstracts:
+                self.counters["hits"] += 1
+            
+            articles = result_set.articles[:max_results]
+            if abstracts:
+                articles = [
+                    {**article, "abstract": result_set.abstracts.get(article["pmid"], "")}
+                    for article in articles
+                ]
+            return articles, result_set.total_count
+    
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "result_sets": len(self._sets), "rate_limiter": ncbi_rate_limiter.stats()}
+
+pubmed_pipeline = PubMedPipeline(PUBMED_TTL, PUBMED_BATCH_SIZE, PUBMED_MAX_RESULT_SETS)
+
 @app.get("/api/trends/pubmed")
+@snapshot_served("pubmed", interval=1800, calls=[{}, {"days": 30, "max_results": 10}])
 async def get_pubmed_trends(
     topic: str = None,
     days: int = 30,
-    max_results: int = 20
+    max_results: int = 20,
+    abstracts: bool = False,
+    force_refresh: bool = False
 ):
     """
     Get recent health research publications from PubMed/NIH (free, no API key needed!)
-    Uses NCBI E-utilities API
+    Uses NCBI E-utilities API; results are cached per (topic, days)
     """
     try:
         # Health topics to search if none specified
@@ -1233,30 +4078,11 @@ async def get_pubmed_trends(
         
         search_term = topic if topic else "health wellness longevity"
         
-        # Calculate date range
-        from datetime import datetime, timedelta
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        date_range = f"{start_date.strftime('%Y/%m/%d')}:{end_date.strftime('%Y/%m/%d')}[dp]"
-        
-        # Step 1: Search for articles
-        search_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-        search_params = {
-            "db": "pubmed",
-            "term": f"({search_term}) AND {date_range}",
-            "retmax": max_results,
-            "sort": "relevance",
-            "retmode": "json"
-        }
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            search_response = await client.get(search_url, params=search_params)
-            search_data = search_response.json()
-        
-        id_list = search_data.get("esearchresult", {}).get("idlist", [])
-        total_count = int(search_data.get("esearchresult", {}).get("count", 0))
+        articles, total_count = await pubmed_pipeline.get(
+            search_term, days, max_results, abstracts=abstracts, force=force_refresh
+        )
         
-        if not id_list:
+        if not articles:
             return {
                 "articles": [],
                 "total_found": 0,
@@ -1266,70 +4092,14 @@ async def get_pubmed_trends(
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
         
-        # Step 2: Get article summaries
-        summary_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
-        summary_params = {
-            "db": "pubmed",
-            "id": ",".join(id_list),
-            "retmode": "json"
-        }
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            summary_response = await client.get(summary_url, params=summary_params)
-            summary_data = summary_response.json()
-        
-        articles = []
-        result = summary_data.get("result", {})
-        
-        for pmid in id_list:
-            if pmid in result:
-                article = result[pmid]
-                
-                # Extract authors
-                authors = article.get("authors", [])
-                author_names = [a.get("name", "") for a in authors[:3]]
-                author_str = ", ".join(author_names)
-                if len(authors) > 3:
-                    author_str += " et al."
-                
-                articles.append({
-                    "pmid": pmid,
-                    "title": article.get("title", ""),
-                    "authors": author_str,
-                    "journal": article.get("fulljournalname", article.get("source", "")),
-                    "pub_date": article.get("pubdate", ""),
-                    "link": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-                    "doi": article.get("elocationid", ""),
-                    "source": "PubMed"
-                })
-        
         # Extract trending research topics from titles
-        research_keywords = {}
-        research_terms = [
-            "microbiome", "gut", "longevity", "aging", "hormone", "menopause",
-            "fasting", "ketogenic", "sleep", "circadian", "stress", "anxiety",
-            "depression", "inflammation", "immune", "cancer", "cardiovascular",
-            "diabetes", "obesity", "weight", "exercise", "nutrition", "vitamin",
-            "supplement", "probiotic", "antioxidant", "collagen", "peptide"
+        trending_research = [
+            {"topic": term, "count": count, "articles": examples}
+            for term, count, examples in KEYWORD_MATCHERS["pubmed"].tally(
+                articles, lambda article: article["title"], lambda article: article["title"][:60], max_examples=2
+            )[:10]
         ]
         
-        for article in articles:
-            title_lower = article["title"].lower()
-            for term in research_terms:
-                if term in title_lower:
-                    if term not in research_keywords:
-                        research_keywords[term] = {"count": 0, "articles": []}
-                    research_keywords[term]["count"] += 1
-                    if len(research_keywords[term]["articles"]) < 2:
-                        research_keywords[term]["articles"].append(article["title"][:60])
-        
-        # Sort by count
-        trending_research = sorted(
-            [{"topic": k, **v} for k, v in research_keywords.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:10]
-        
         return {
             "articles": articles,
             "total_found": total_count,
@@ -1339,7 +4109,7 @@ async def get_pubmed_trends(
             "trending_research": trending_research,
             "source": "PubMed/NIH (NCBI E-utilities)",
             "region": "Global (US-based database)",
-            "note": "Free API - no key required",
+            "note": "Free API - no key required" if not NCBI_API_KEY else "NCBI API key in use (10 requests/second)",
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
@@ -1354,10 +4124,13 @@ async def get_pubmed_trends(
         }
 
 @app.get("/api/trends/news")
+@snapshot_served("news", interval=900, calls=[{}, {"max_results": 10}])
+@cached(ttl=900, stale_ttl=900)
 async def get_health_news(
     topic: str = None,
     days: int = 7,
-    max_results: int = 20
+    max_results: int = 20,
+    force_refresh: bool = False
 ):
     """
     Get health & wellness news from News API (newsapi.org)
@@ -1392,9 +4165,9 @@ async def get_health_news(
             "domains": "healthline.com,webmd.com,medicalnewstoday.com,health.com,everydayhealth.com,prevention.com,mindbodygreen.com,wellandgood.com"
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(news_url, params=params)
-            data = response.json()
+        client = http_clients.get("newsapi")
+        response = await client.get(news_url, params=params)
+        data = response.json()
         
         if data.get("status") != "ok":
             return {
@@ -1417,32 +4190,16 @@ async def get_health_news(
             })
         
         # Extract trending topics from headlines
-        news_keywords = {}
-        health_terms = [
-            "weight", "diet", "exercise", "sleep", "stress", "anxiety", "depression",
-            "heart", "cancer", "diabetes", "alzheimer", "longevity", "aging",
-            "vitamin", "supplement", "probiotic", "gut", "microbiome", "hormone",
-            "menopause", "fertility", "pregnancy", "skin", "hair", "mental health",
-            "wellness", "fitness", "nutrition", "protein", "fasting", "keto", "vegan"
+        trending_news_topics = [
+            {"topic": term, "count": count, "headlines": examples}
+            for term, count, examples in KEYWORD_MATCHERS["news"].tally(
+                articles,
+                lambda article: article["title"] + " " + (article["description"] or ""),
+                lambda article: article["title"][:60],
+                max_examples=2
+            )[:10]
         ]
         
-        for article in articles:
-            title_lower = (article["title"] + " " + (article["description"] or "")).lower()
-            for term in health_terms:
-                if term in title_lower:
-                    if term not in news_keywords:
-                        news_keywords[term] = {"count": 0, "headlines": []}
-                    news_keywords[term]["count"] += 1
-                    if len(news_keywords[term]["headlines"]) < 2:
-                        news_keywords[term]["headlines"].append(article["title"][:60])
-        
-        # Sort by count
-        trending_news_topics = sorted(
-            [{"topic": k, **v} for k, v in news_keywords.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:10]
-        
         return {
             "articles": articles,
             "total_results": data.get("totalResults", 0),
@@ -1465,18 +4222,133 @@ async def get_health_news(
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
+# Podcasts - iTunes searches are cached per term; the optional recency stage
+# scores shows by how often they have published episodes lately. Episode
+# velocity is cached per feed, and feeds not scored yet are fetched in the
+# background (via feed_fetcher, so with conditional GETs) while the request
+# only waits up to a latency budget for them.
+PODCAST_RECENCY_BUDGET_SECONDS = float(os.getenv("PODCAST_RECENCY_BUDGET_SECONDS", "3"))
+PODCAST_VELOCITY_TTL = int(os.getenv("PODCAST_VELOCITY_TTL", "21600"))
+PODCAST_EPISODES_SCANNED = 50
+PODCAST_RECENCY_WINDOW_DAYS = 30
+podcast_feed_tasks: Dict[str, asyncio.Task] = {}
+
+@cached(ttl=3600, stale_ttl=3600, namespace="itunes_search")
+async def search_itunes_podcasts(term: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
+    params = {
+        "term": term,
+        "media": "podcast",
+        "country": "US",
+        "limit": 10
+    }
+    
+    response = await http_clients.get("itunes").get("https://itunes.apple.com/search", params=params)
+    response.raise_for_status()
+    data = response.json()
+    
+    return [
+        {
+            "id": item.get("collectionId"),
+            "name": item.get("collectionName", ""),
+            "artist": item.get("artistName", ""),
+            "artwork": item.get("artworkUrl600", item.get("artworkUrl100", "")),
+            "genre": item.get("primaryGenreName", ""),
+            "track_count": item.get("trackCount", 0),
+            "feed_url": item.get("feedUrl", ""),
+            "link": item.get("collectionViewUrl", ""),
+            "rating": item.get("averageUserRating", 0),
+            "rating_count": item.get("userRatingCount", 0)
+        }
+        for item in data.get("results", [])
+        if item.get("collectionId")
+    ]
+
+def parse_episode_date(value: str) -> Optional[datetime]:
+    """RSS pubDate (RFC 822) or ISO 8601"""
+    from email.utils import parsedate_to_datetime
+    
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def episode_velocity(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Episodes published in the recency window, and how recently the last one came out"""
+    now = datetime.now(timezone.utc)
+    dates = [d for d in (parse_episode_date(entry.get("published", "")) for entry in entries) if d]
+    if not dates:
+        return {"episodes_last_30_days": 0, "episodes_per_week": 0.0, "last_episode": None,
+                "days_since_last_episode": None, "score": 0.0}
+    
+    last = max(dates)
+    recent = sum(1 for d in dates if (now - d).days < PODCAST_RECENCY_WINDOW_DAYS)
+    per_week = recent / (PODCAST_RECENCY_WINDOW_DAYS / 7)
+    days_since = max((now - last).total_seconds() / 86400, 0)
+    return {
+        "episodes_last_30_days": recent,
+        "episodes_per_week": round(per_week, 2),
+        "last_episode": last.isoformat(),
+        "days_since_last_episode": round(days_since, 1),
+        # Publishing rate, discounted by a week of silence at a time
+        "score": round(per_week / (1 + days_since / 7), 3)
+    }
+
+async def score_podcast_feed(feed_url: str) -> Dict[str, Any]:
+    try:
+        entries = await feed_fetcher.fetch(feed_url, limit=PODCAST_EPISODES_SCANNED)
+        velocity = episode_velocity(entries)
+        response_cache.set(("podcast_velocity", feed_url), velocity, PODCAST_VELOCITY_TTL)
+    except Exception as e:
+        logger.warning(f"Podcast feed error for {feed_url}: {str(e)}")
+        velocity = {"error": str(e)}
+        # Don't retry a broken feed on every request
+        response_cache.set(("podcast_velocity", feed_url), velocity, PODCAST_VELOCITY_TTL / 4)
+    return velocity
+
+async def podcast_velocities(feed_urls: List[str], budget: float) -> Dict[str, Dict[str, Any]]:
+    """
+    Velocity per feed URL for the feeds that are cached or can be fetched
+    within `budget` seconds; the rest keep loading in the background.
+    """
+    velocities = {}
+    waiting = []
+    for url in feed_urls:
+        entry = response_cache.get(("podcast_velocity", url))
+        if entry is not None:
+            velocities[url] = entry.value
+            continue
+        task = podcast_feed_tasks.get(url)
+        if task is None:
+            task = podcast_feed_tasks[url] = asyncio.create_task(score_podcast_feed(url))
+            task.add_done_callback(lambda _, url=url: podcast_feed_tasks.pop(url, None))
+        waiting.append(task)
+    
+    if waiting:
+        await asyncio.wait(waiting, timeout=budget)
+        for url in feed_urls:
+            if url not in velocities:
+                entry = response_cache.get(("podcast_velocity", url))
+                if entry is not None:
+                    velocities[url] = entry.value
+    return velocities
+
 @app.get("/api/trends/podcasts")
+@snapshot_served("podcasts", interval=3600, calls=[{}])
 async def get_podcast_trends(
     category: str = "health",
-    limit: int = 20
+    limit: int = 20,
+    score_recency: bool = False,
+    force_refresh: bool = False
 ):
     """
     Get trending health & wellness podcasts from Apple Podcasts (iTunes API - free, no key!)
+    With score_recency=true, shows are ranked by recent episode velocity
     """
     try:
-        # iTunes Search API - completely free, no key needed
-        search_url = "https://itunes.apple.com/search"
-        
         # Health-related search terms
         health_terms = [
             "health wellness",
@@ -1489,62 +4361,61 @@ async def get_podcast_trends(
         all_podcasts = []
         seen_ids = set()
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for term in health_terms[:3]:  # Limit to avoid rate limiting
-                params = {
-                    "term": term,
-                    "media": "podcast",
-                    "country": "US",
-                    "limit": 10
-                }
-                
-                response = await client.get(search_url, params=params)
-                data = response.json()
-                
-                for item in data.get("results", []):
-                    podcast_id = item.get("collectionId")
-                    if podcast_id and podcast_id not in seen_ids:
-                        seen_ids.add(podcast_id)
-                        all_podcasts.append({
-                            "id": podcast_id,
-                            "name": item.get("collectionName", ""),
-                            "artist": item.get("artistName", ""),
-                            "artwork": item.get("artworkUrl600", item.get("artworkUrl100", "")),
-                            "genre": item.get("primaryGenreName", ""),
-                            "track_count": item.get("trackCount", 0),
-                            "feed_url": item.get("feedUrl", ""),
-                            "link": item.get("collectionViewUrl", ""),
-                            "rating": item.get("averageUserRating", 0),
-                            "rating_count": item.get("userRatingCount", 0)
-                        })
+        # Search every term concurrently (each term is cached on its own)
+        results = await asyncio.gather(
+            *(search_itunes_podcasts(term, force_refresh=force_refresh) for term in health_terms), return_exceptions=True
+        )
+        
+        failed_terms = []
+        for term, podcasts in zip(health_terms, results):
+            if isinstance(podcasts, Exception):
+                logger.error(f"Podcast search error for '{term}': {str(podcasts)}")
+                failed_terms.append(term)
+                continue
+            for podcast in podcasts:
+                if podcast["id"] not in seen_ids:
+                    seen_ids.add(podcast["id"])
+                    all_podcasts.append(dict(podcast))
+        
+        if len(failed_terms) == len(health_terms):
+            raise results[0]
         
         # Sort by rating count (popularity)
         all_podcasts.sort(key=lambda x: x.get("rating_count", 0), reverse=True)
         
+        recency_stats = None
+        if score_recency:
+            candidates = all_podcasts[:limit]
+            velocities = await podcast_velocities(
+                [p["feed_url"] for p in candidates if p["feed_url"]], PODCAST_RECENCY_BUDGET_SECONDS
+            )
+            for podcast in candidates:
+                velocity = velocities.get(podcast["feed_url"])
+                if velocity is None or "error" in velocity:
+                    podcast["recency"] = {"status": "pending" if velocity is None else "unavailable"}
+                else:
+                    podcast["recency"] = velocity
+            
+            # Scored shows first by velocity, then the rest by popularity
+            all_podcasts[:limit] = sorted(
+                candidates,
+                key=lambda p: (p["recency"].get("score") is not None, p["recency"].get("score", 0)),
+                reverse=True
+            )
+            recency_stats = {
+                "scored": sum(1 for p in candidates if "score" in p["recency"]),
+                "pending": sum(1 for p in candidates if p["recency"].get("status") == "pending"),
+                "budget_seconds": PODCAST_RECENCY_BUDGET_SECONDS
+            }
+        
         # Extract trending topics from podcast names
-        podcast_topics = {}
-        topic_terms = [
-            "health", "wellness", "longevity", "biohacking", "fitness", "nutrition",
-            "mental", "sleep", "gut", "hormone", "menopause", "meditation", "mindful",
-            "diet", "weight", "aging", "brain", "stress", "anxiety", "energy"
+        trending_topics = [
+            {"topic": term, "count": count, "podcasts": examples}
+            for term, count, examples in KEYWORD_MATCHERS["podcasts"].tally(
+                all_podcasts, lambda podcast: podcast["name"], lambda podcast: podcast["name"][:40], max_examples=2
+            )[:10]
         ]
         
-        for podcast in all_podcasts:
-            name_lower = podcast["name"].lower()
-            for term in topic_terms:
-                if term in name_lower:
-                    if term not in podcast_topics:
-                        podcast_topics[term] = {"count": 0, "podcasts": []}
-                    podcast_topics[term]["count"] += 1
-                    if len(podcast_topics[term]["podcasts"]) < 2:
-                        podcast_topics[term]["podcasts"].append(podcast["name"][:40])
-        
-        trending_topics = sorted(
-            [{"topic": k, **v} for k, v in podcast_topics.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:10]
-        
         return {
             "podcasts": all_podcasts[:limit],
             "total": len(all_podcasts),
@@ -1552,6 +4423,8 @@ async def get_podcast_trends(
             "source": "Apple Podcasts (iTunes API)",
             "region": "US",
             "note": "Free API - no key required",
+            "failed_terms": failed_terms,
+            "recency": recency_stats,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
@@ -1564,104 +4437,260 @@ async def get_podcast_trends(
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
-@app.get("/api/trends/scholar")
-async def get_scholar_trends(
-    topic: str = None,
-    max_results: int = 15
-):
+# Google Scholar - scholarly fetches each results page with a blocking request,
+# so searches run on one dedicated worker thread (serialized to avoid rate
+# limiting). Each search keeps its live generator, so asking for more results
+# than are cached only fetches the next page. A search that runs past
+# SCHOLAR_TIMEOUT keeps the articles it already has; a page request still in
+# flight holds the thread until SCHOLAR_REQUEST_TIMEOUT ends it.
+SCHOLAR_TTL = int(os.getenv("SCHOLAR_TTL", "3600"))
+SCHOLAR_TIMEOUT = float(os.getenv("SCHOLAR_TIMEOUT", "60"))
+SCHOLAR_REQUEST_TIMEOUT = int(os.getenv("SCHOLAR_REQUEST_TIMEOUT", "15"))
+SCHOLAR_MAX_QUERIES = int(os.getenv("SCHOLAR_MAX_QUERIES", "64"))
+scholar_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scholar")
+
+class ScholarSearch:
+    __slots__ = ("term", "articles", "target", "exhausted", "timed_out", "error", "completed_at", "task", "results")
+    
+    def __init__(self, term: str):
+        self.term = term
+        self.articles: List[Dict[str, Any]] = []
+        self.target = 0
+        self.exhausted = False
+        self.timed_out = False
+        self.error: Optional[Exception] = None
+        self.completed_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self.results = None  # scholarly generator, only touched on the scholar thread
+    
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+def scholar_article(pub: Dict[str, Any]) -> Dict[str, Any]:
+    bib = pub.get("bib", {})
+    return {
+        "title": bib.get("title", ""),
+        "authors": ", ".join(bib.get("author", [])[:3]) + ("..." if len(bib.get("author", [])) > 3 else ""),
+        "year": bib.get("pub_year", ""),
+        "venue": bib.get("venue", ""),
+        "abstract": bib.get("abstract", "")[:300] + "..." if bib.get("abstract") else "",
+        "citations": pub.get("num_citations", 0),
+        "url": pub.get("pub_url", ""),
+        "source": "Google Scholar"
+    }
+
+def extend_scholar_search(search: ScholarSearch, target: int, deadline: float):
     """
-    Get trending academic research from Google Scholar (free, no API key!)
-    Uses scholarly library for broader academic research beyond just medical
+    Pull results from the search's generator until it holds `target` (runs on
+    the scholar thread). Stops at the deadline or once the search is marked
+    timed out; the list is swapped for a snapshot then, so a page that finishes
+    late never changes the results being served.
     """
-    try:
-        # Note: scholarly can be slow and may get rate limited
-        # We'll use a simpler approach with search queries
-        
-        search_term = topic if topic else "health wellness longevity"
-        
-        # Use scholarly library
+    from scholarly import scholarly
+    
+    if search.results is None:
+        scholarly.set_timeout(SCHOLAR_REQUEST_TIMEOUT)
+        search.results = scholarly.search_pubs(search.term)
+    articles = search.articles
+    while len(articles) < target:
+        if search.timed_out or time.monotonic() > deadline:
+            search.timed_out = True
+            return
         try:
-            from scholarly import scholarly
-            
-            # Search for publications
-            search_query = scholarly.search_pubs(search_term)
-            
-            articles = []
-            for i, pub in enumerate(search_query):
-                if i >= max_results:
-                    break
-                    
-                bib = pub.get("bib", {})
-                articles.append({
-                    "title": bib.get("title", ""),
-                    "authors": ", ".join(bib.get("author", [])[:3]) + ("..." if len(bib.get("author", [])) > 3 else ""),
-                    "year": bib.get("pub_year", ""),
-                    "venue": bib.get("venue", ""),
-                    "abstract": bib.get("abstract", "")[:300] + "..." if bib.get("abstract") else "",
-                    "citations": pub.get("num_citations", 0),
-                    "url": pub.get("pub_url", ""),
-                    "source": "Google Scholar"
-                })
-            
-            # Extract research topics
-            research_topics = {}
-            topic_terms = [
-                "longevity", "aging", "health", "wellness", "nutrition", "exercise",
-                "sleep", "stress", "mental", "cognitive", "gut", "microbiome",
-                "inflammation", "immune", "hormone", "metabolism", "diet", "fasting"
-            ]
-            
-            for article in articles:
-                text = (article["title"] + " " + article.get("abstract", "")).lower()
-                for term in topic_terms:
-                    if term in text:
-                        if term not in research_topics:
-                            research_topics[term] = {"count": 0, "papers": []}
-                        research_topics[term]["count"] += 1
-                        if len(research_topics[term]["papers"]) < 2:
-                            research_topics[term]["papers"].append(article["title"][:50])
-            
-            trending_research = sorted(
-                [{"topic": k, **v} for k, v in research_topics.items()],
-                key=lambda x: x["count"],
-                reverse=True
-            )[:10]
-            
-            return {
-                "articles": articles,
-                "total": len(articles),
-                "search_term": search_term,
-                "trending_topics": trending_research,
-                "source": "Google Scholar",
-                "note": "Broader academic research - free, no API key",
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
-            
-        except ImportError:
-            return {
-                "articles": [],
-                "error": "scholarly library not installed",
-                "message": "Google Scholar temporarily unavailable",
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
-        
-    except Exception as e:
-        logger.error(f"Google Scholar error: {str(e)}")
+            pub = next(search.results)
+        except StopIteration:
+            search.exhausted = True
+            return
+        articles.append(scholar_article(pub))
+
+class ScholarWorker:
+    """
+    Per-query Scholar result cache. request() answers from the articles already
+    fetched when there are enough of them, otherwise it starts (or extends) the
+    search in the background and reports it as pending. Results expire after
+    ttl; a failed search is reported once and then forgotten so it can retry.
+    A search that times out is served with the articles it has until it
+    expires; asking it for more results does not resume it before then.
+    """
+    
+    def __init__(self, ttl: float, timeout: float, max_queries: int):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_queries = max_queries
+        self._searches: "OrderedDict[str, ScholarSearch]" = OrderedDict()
+        self.counters = {"hits": 0, "pending": 0, "searches": 0, "errors": 0, "timeouts": 0}
+    
+    def request(self, term: str, max_results: int) -> tuple:
+        """Returns (search, state, previous_articles) with state ready/pending/error"""
+        search = self._searches.get(term)
+        previous: List[Dict[str, Any]] = []
+        if search is not None and not search.running():
+            if search.error is not None:
+                del self._searches[term]
+                self.counters["errors"] += 1
+                return search, "error", []
+            if search.completed_at is not None and time.time() - search.completed_at > self.ttl:
+                previous = search.articles
+                search = None
+        
+        if search is None:
+            search = ScholarSearch(term)
+            self._searches[term] = search
+            self.counters["searches"] += 1
+            self._evict()
+        self._searches.move_to_end(term)
+        
+        if search.completed_at is not None and (len(search.articles) >= max_results or search.exhausted or search.timed_out):
+            self.counters["hits"] += 1
+            return search, "ready", []
+        
+        self.counters["pending"] += 1
+        search.target = max(search.target, max_results)
+        if not search.running():
+            search.task = asyncio.create_task(self._run(search))
+        return search, "pending", previous
+    
+    async def _run(self, search: ScholarSearch):
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + self.timeout
+        try:
+            # Loop in case a larger max_results arrived while a page was loading
+            while not search.exhausted and not search.timed_out and len(search.articles) < search.target:
+                try:
+                    await asyncio.wait_for(
+                        loop.run_in_executor(scholar_executor, extend_scholar_search, search, search.target, deadline),
+                        max(deadline - time.monotonic(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    # The blocked page request stays on the scholar thread (later searches
+                    # queue behind it, keeping Scholar access serialized); freeze the results
+                    search.timed_out = True
+                    search.articles = list(search.articles)
+            if search.timed_out:
+                self.counters["timeouts"] += 1
+                if not search.articles:
+                    raise TimeoutError(f"Google Scholar search timed out after {self.timeout:g}s")
+                logger.warning(f"⚠️ Google Scholar timed out for '{search.term}' - keeping {len(search.articles)} results")
+            search.completed_at = time.time()
+            logger.info(f"📚 Google Scholar: {len(search.articles)} results cached for '{search.term}'")
+        except Exception as e:
+            logger.error(f"Google Scholar error: {str(e)}")
+            search.error = e
+    
+    def _evict(self):
+        for term in list(self._searches):
+            if len(self._searches) <= self.max_queries:
+                return
+            if not self._searches[term].running():
+                del self._searches[term]
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "queries_cached": len(self._searches),
+            "running": sum(1 for search in self._searches.values() if search.running())
+        }
+
+scholar_worker = ScholarWorker(SCHOLAR_TTL, SCHOLAR_TIMEOUT, SCHOLAR_MAX_QUERIES)
+
+def scholar_poll_token(search_term: str, max_results: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([search_term, max_results]).encode()).decode().rstrip("=")
+
+def scholar_response(search_term: str, max_results: int) -> Dict[str, Any]:
+    search, state, previous = scholar_worker.request(search_term, max_results)
+    
+    if state == "error":
+        return {
+            "articles": [],
+            "error": str(search.error),
+            "search_term": search_term,
+            "message": "Google Scholar temporarily unavailable",
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    if state == "pending":
+        token = scholar_poll_token(search_term, max_results)
+        articles = (search.articles or previous)[:max_results]
+        return {
+            "articles": articles,
+            "total": len(articles),
+            "search_term": search_term,
+            "status": "pending",
+            "poll_token": token,
+            "poll_url": f"/api/trends/scholar/poll/{token}",
+            "message": "Fetching from Google Scholar in the background - poll for the full results",
+            "source": "Google Scholar",
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    articles = search.articles[:max_results]
+    
+    # Extract research topics
+    trending_research = [
+        {"topic": term, "count": count, "papers": examples}
+        for term, count, examples in KEYWORD_MATCHERS["scholar"].tally(
+            articles,
+            lambda article: article["title"] + " " + article.get("abstract", ""),
+            lambda article: article["title"][:50],
+            max_examples=2
+        )[:10]
+    ]
+    
+    return {
+        "articles": articles,
+        "total": len(articles),
+        "search_term": search_term,
+        "trending_topics": trending_research,
+        "status": "ready",
+        "partial": search.timed_out,
+        "source": "Google Scholar",
+        "note": "Broader academic research - free, no API key",
+        "cached": True,
+        "cache_age_seconds": int(time.time() - search.completed_at),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+@app.get("/api/trends/scholar")
+async def get_scholar_trends(
+    topic: str = None,
+    max_results: int = 15
+):
+    """
+    Get trending academic research from Google Scholar (free, no API key!)
+    Uses scholarly library for broader academic research beyond just medical
+    Returns status "pending" with a poll_token while results are being fetched
+    """
+    search_term = topic if topic else "health wellness longevity"
+    
+    if importlib.util.find_spec("scholarly") is None:
         return {
             "articles": [],
-            "error": str(e),
+            "error": "scholarly library not installed",
             "message": "Google Scholar temporarily unavailable",
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
+    
+    return scholar_response(search_term, max_results)
+
+@app.get("/api/trends/scholar/poll/{token}")
+async def poll_scholar_trends(token: str):
+    """Poll a pending Google Scholar search"""
+    try:
+        search_term, max_results = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        max_results = int(max_results)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid poll token")
+    
+    return scholar_response(search_term, max_results)
 
 @app.get("/api/trends/newsletters")
-async def get_newsletter_trends(limit: int = 20):
+@snapshot_served("newsletters", interval=1800, calls=[{}])
+@cached(ttl=1800, stale_ttl=1800)
+async def get_newsletter_trends(limit: int = 20, force_refresh: bool = False):
     """
     Get trending health content from Substack and Medium via RSS feeds (free, no API key!)
     """
     try:
-        import feedparser
-        
         # Popular health/wellness Substack and Medium RSS feeds
         newsletter_feeds = [
             # Substack health newsletters
@@ -1679,12 +4708,16 @@ async def get_newsletter_trends(limit: int = 20):
         all_articles = []
         source_stats = {}
         
-        for feed_info in newsletter_feeds:
+        # Fetch all RSS feeds concurrently
+        feeds = await feed_fetcher.fetch_many([feed_info["url"] for feed_info in newsletter_feeds], limit=5)
+        
+        for feed_info, entries in zip(newsletter_feeds, feeds):
             try:
-                feed = feedparser.parse(feed_info["url"])
+                if isinstance(entries, Exception):
+                    raise entries
                 posts_from_feed = []
                 
-                for entry in feed.entries[:5]:  # Limit per feed
+                for entry in entries[:5]:  # Limit per feed
                     article = {
                         "title": entry.get("title", ""),
                         "author": entry.get("author", feed_info["name"]),
@@ -1712,29 +4745,13 @@ async def get_newsletter_trends(limit: int = 20):
                 }
         
         # Extract trending topics from titles
-        newsletter_topics = {}
-        topic_terms = [
-            "health", "wellness", "longevity", "sleep", "stress", "anxiety",
-            "nutrition", "diet", "fasting", "exercise", "fitness", "weight",
-            "mental", "brain", "gut", "hormone", "aging", "energy", "meditation"
+        trending_topics = [
+            {"topic": term, "count": count, "articles": examples}
+            for term, count, examples in KEYWORD_MATCHERS["newsletters"].tally(
+                all_articles, lambda article: article["title"], lambda article: article["title"][:50], max_examples=2
+            )[:10]
         ]
         
-        for article in all_articles:
-            title_lower = article["title"].lower()
-            for term in topic_terms:
-                if term in title_lower:
-                    if term not in newsletter_topics:
-                        newsletter_topics[term] = {"count": 0, "articles": []}
-                    newsletter_topics[term]["count"] += 1
-                    if len(newsletter_topics[term]["articles"]) < 2:
-                        newsletter_topics[term]["articles"].append(article["title"][:50])
-        
-        trending_topics = sorted(
-            [{"topic": k, **v} for k, v in newsletter_topics.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:10]
-        
         return {
             "articles": all_articles[:limit],
             "total": len(all_articles),
@@ -1745,13 +4762,6 @@ async def get_newsletter_trends(limit: int = 20):
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
-    except ImportError:
-        return {
-            "articles": [],
-            "error": "feedparser library not installed",
-            "message": "Newsletter feeds temporarily unavailable",
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
     except Exception as e:
         logger.error(f"Newsletter feeds error: {str(e)}")
         return {
@@ -1762,6 +4772,8 @@ async def get_newsletter_trends(limit: int = 20):
         }
 
 @app.get("/api/trends/tiktok")
+@snapshot_served("tiktok", interval=3600, calls=[{}, {"count": 30}])
+@cached(ttl=3600, namespace="tiktok_trending", annotate=True)  # avoid rate limiting
 async def get_tiktok_trends(
     count: int = 20,
     force_refresh: bool = False
@@ -1772,25 +4784,9 @@ async def get_tiktok_trends(
     Warning: May break when TikTok updates their API
     """
     try:
-        from TikTokApi import TikTokApi
-        
-        # Cache for 1 hour to avoid rate limiting
-        cache_key = "tiktok_trending"
-        if not force_refresh and cache_key in CACHE:
-            cached = CACHE[cache_key]
-            if cached.get("data") and cached.get("timestamp"):
-                age = time.time() - cached["timestamp"]
-                if age < 3600:  # 1 hour
-                    logger.info(f"Returning cached TikTok data (age: {int(age)}s)")
-                    return {
-                        **cached["data"],
-                        "cached": True,
-                        "cache_age_seconds": int(age)
-                    }
-        
         logger.info(f"Fetching {count} trending TikTok videos")
         
-        async with TikTokApi() as api:
+        async with tiktok_sessions.session() as api:
             trending_videos = []
             hashtag_counts = {}
             
@@ -1852,18 +4848,12 @@ async def get_tiktok_trends(
             )[:20]
             
             # Filter for health & wellness related content
-            health_keywords = [
-                "health", "wellness", "fitness", "nutrition", "gut", "sleep", 
-                "hormone", "menopause", "weight", "diet", "mental", "anxiety", 
-                "stress", "longevity", "aging", "beauty", "skin", "hair"
+            health_matcher = KEYWORD_MATCHERS["tiktok_health"]
+            health_videos = [
+                video for video in trending_videos
+                if health_matcher.matches(video.get("description", "") + " " + " ".join(video.get("hashtags", [])))
             ]
             
-            health_videos = []
-            for video in trending_videos:
-                text = (video.get("description", "") + " ".join(video.get("hashtags", []))).lower()
-                if any(keyword in text for keyword in health_keywords):
-                    health_videos.append(video)
-            
             result = {
                 "videos": trending_videos,
                 "total_videos": len(trending_videos),
@@ -1878,13 +4868,6 @@ async def get_tiktok_trends(
                 "cached": False
             }
             
-            # Cache the result
-            CACHE[cache_key] = {
-                "data": result,
-                "timestamp": time.time(),
-                "ttl": 3600
-            }
-            
             logger.info(f"Successfully fetched {len(trending_videos)} TikTok videos ({len(health_videos)} health-related)")
             
             return result
@@ -1918,11 +4901,9 @@ async def get_tiktok_health():
     Your monitoring system should hit this regularly to detect when the API breaks
     """
     try:
-        from TikTokApi import TikTokApi
-        
         logger.info("Running TikTok API health check")
         
-        async with TikTokApi() as api:
+        async with tiktok_sessions.session() as api:
             video_count = 0
             async for video in api.trending.videos(count=1):
                 video_count += 1
@@ -1930,10 +4911,9 @@ async def get_tiktok_health():
             
             if video_count > 0:
                 # Check cache age
-                cache_key = "tiktok_trending"
-                cache_age = None
-                if cache_key in CACHE and CACHE[cache_key].get("timestamp"):
-                    cache_age = int(time.time() - CACHE[cache_key]["timestamp"])
+                cache_age = response_cache.newest_age("tiktok_trending")
+                if cache_age is not None:
+                    cache_age = int(cache_age)
                 
                 return {
                     "status": "healthy",
@@ -1973,21 +4953,33 @@ async def get_tiktok_health():
             ]
         }
 
-@app.get("/api/trends/tiktok/search")
-async def search_tiktok(
-    query: str,
-    count: int = 20
-):
-    """
-    Search TikTok videos by keyword
-    Useful for finding health/wellness content
-    """
+# TikTok search results are cached per (normalized query, count); a watchlist
+# of producer search terms is refreshed in the background to stay warm
+TIKTOK_SEARCH_TTL = int(os.getenv("TIKTOK_SEARCH_TTL", "1800"))
+TIKTOK_WATCHLIST_REFRESH_SECONDS = int(os.getenv("TIKTOK_WATCHLIST_REFRESH_SECONDS", "1200"))
+TIKTOK_WATCHLIST_COUNT = int(os.getenv("TIKTOK_WATCHLIST_COUNT", "20"))
+
+def normalize_search_query(query: str) -> str:
+    """'  #Gut   Health ' and 'gut health' share one cache entry"""
+    return " ".join(query.replace("#", " ").lower().split())
+
+TIKTOK_SEARCH_WATCHLIST = list(dict.fromkeys(
+    normalize_search_query(term)
+    for term in os.getenv(
+        "TIKTOK_SEARCH_WATCHLIST",
+        "gut health,sleep,menopause,longevity,weight loss,anxiety,skincare,supplements"
+    ).split(",")
+    if normalize_search_query(term)
+))
+TIKTOK_WATCHLIST_STATE: Dict[str, Dict[str, Any]] = {}
+
+@cached(ttl=TIKTOK_SEARCH_TTL, stale_ttl=TIKTOK_SEARCH_TTL, namespace="tiktok_search", annotate=True)
+async def fetch_tiktok_search(query: str, count: int, force_refresh: bool = False):
+    """Live TikTok search for an already-normalized query"""
     try:
-        from TikTokApi import TikTokApi
-        
         logger.info(f"Searching TikTok for: {query}")
         
-        async with TikTokApi() as api:
+        async with tiktok_sessions.session() as api:
             videos = []
             
             async for video in api.search.videos(query, count=count):
@@ -2043,12 +5035,70 @@ async def search_tiktok(
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
+@app.get("/api/trends/tiktok/search")
+async def search_tiktok(
+    query: str,
+    count: int = 20,
+    force_refresh: bool = False
+):
+    """
+    Search TikTok videos by keyword
+    Useful for finding health/wellness content
+    """
+    normalized = normalize_search_query(query)
+    if not normalized:
+        return {
+            "videos": [],
+            "error": "Empty search query",
+            "query": query,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    return await fetch_tiktok_search(normalized, count, force_refresh=force_refresh)
+
+async def refresh_tiktok_watchlist():
+    """Re-run each watchlist search one at a time so producers always hit a warm cache"""
+    if importlib.util.find_spec("TikTokApi") is None:
+        return
+    
+    for term in TIKTOK_SEARCH_WATCHLIST:
+        started = time.perf_counter()
+        result = await fetch_tiktok_search(term, TIKTOK_WATCHLIST_COUNT, force_refresh=True)
+        TIKTOK_WATCHLIST_STATE[term] = {
+            "last_refresh": datetime.now(timezone.utc).isoformat(),
+            "videos": result.get("total", 0),
+            "error": result.get("error"),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000)
+        }
+    logger.info(f"🎵 TikTok search watchlist refreshed ({len(TIKTOK_SEARCH_WATCHLIST)} queries)")
+
+@app.get("/api/trends/tiktok/search/watchlist")
+async def get_tiktok_search_watchlist():
+    """Watchlist queries kept warm in the search cache, with their cache age"""
+    terms = []
+    for term in TIKTOK_SEARCH_WATCHLIST:
+        entry = response_cache.get(
+            cache_key("tiktok_search", {"query": term, "count": TIKTOK_WATCHLIST_COUNT}), allow_stale=True
+        )
+        terms.append({
+            "query": term,
+            "cached": entry is not None,
+            "cache_age_seconds": int(time.time() - entry.stored_at) if entry is not None else None,
+            **TIKTOK_WATCHLIST_STATE.get(term, {})
+        })
+    
+    return {
+        "watchlist": terms,
+        "count": TIKTOK_WATCHLIST_COUNT,
+        "refresh_interval_seconds": TIKTOK_WATCHLIST_REFRESH_SECONDS,
+        "cache_ttl_seconds": TIKTOK_SEARCH_TTL,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
 @app.post("/api/trends/tiktok/cache/clear")
 async def clear_tiktok_cache():
     """Clear TikTok cache (admin endpoint)"""
-    cache_key = "tiktok_trending"
-    if cache_key in CACHE:
-        del CACHE[cache_key]
+    response_cache.invalidate("tiktok_trending")
+    response_cache.invalidate("tiktok_search")
     
     return {
         "success": True,
@@ -2056,124 +5106,406 @@ async def clear_tiktok_cache():
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
+# Aggregate fan-out - each source turns its endpoint payload into trend items
+# carrying a raw signal (interest, views, mentions); all sources are fetched
+# concurrently and the scoring engine below ranks them on a common scale
+AGGREGATE_DEADLINE_SECONDS = float(os.getenv("AGGREGATE_DEADLINE_SECONDS", "25"))
+AGGREGATE_TOP_K = int(os.getenv("AGGREGATE_TOP_K", "25"))
+TREND_BASELINE_ALPHA = float(os.getenv("TREND_BASELINE_ALPHA", "0.2"))
+TREND_SCORE_HALF_LIFE_HOURS = float(os.getenv("TREND_SCORE_HALF_LIFE_HOURS", "12"))
+
+def normalize_google_trends(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{
+        "topic": trend['topic'],
+        "signal": trend['interest_score'],
+        "trend_direction": trend['trend'],
+        "change_percent": trend['change_percent']
+    } for trend in results.get('trends', [])]
+
+def normalize_youtube_trends(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{
+        "topic": video.get('title', '')[:50],
+        "signal": video.get('views', 0),
+        "views": video.get('views', 0)
+    } for video in results.get('videos', [])]
+
+def normalize_reddit_trends(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{
+        "topic": kw['keyword'].title(),
+        "signal": kw['count'],
+        "mentions": kw['count']
+    } for kw in results.get('trending_keywords', [])]
+
+def normalize_pubmed_trends(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{
+        "topic": research['topic'].title(),
+        "signal": research['count'],
+        "publications": research['count']
+    } for research in results.get('trending_research', [])]
+
+def normalize_news_trends(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{
+        "topic": news_topic['topic'].title(),
+        "signal": news_topic['count'],
+        "articles": news_topic['count']
+    } for news_topic in results.get('trending_topics', [])]
+
+def normalize_tiktok_trends(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{
+        "topic": f"#{hashtag['hashtag']}",
+        "signal": hashtag['count'],
+        "video_count": hashtag['count'],
+        "views": hashtag.get('total_views', 0)
+    } for hashtag in results.get('trending_hashtags', [])]
+
+def trend_topic_key(topic: str) -> str:
+    """Merge key: "#GutHealth", "gut health" and "Gut-Health" all map to "guthealth" """
+    key = "".join(ch for ch in topic.lower() if ch.isalnum())
+    return key[:-1] if len(key) > 3 and key.endswith("s") else key
+
+class SourceBaseline:
+    """EWMA mean/variance of log(1 + signal) for one source's items"""
+    __slots__ = ("mean", "var", "batches", "last_batch")
+    
+    def __init__(self):
+        self.mean = 0.0
+        self.var = 0.0
+        self.batches = 0
+        self.last_batch = None
+    
+    def update(self, batch_id: Any, logs: np.ndarray):
+        """Fold in one fetched payload (identified by batch_id, so re-served snapshots count once)"""
+        if batch_id == self.last_batch or not len(logs):
+            return
+        self.last_batch = batch_id
+        batch_mean, batch_var = float(logs.mean()), float(logs.var())
+        if not self.batches:
+            self.mean, self.var = batch_mean, batch_var
+        else:
+            delta = batch_mean - self.mean
+            self.mean += TREND_BASELINE_ALPHA * delta
+            self.var = (1 - TREND_BASELINE_ALPHA) * (self.var + TREND_BASELINE_ALPHA * delta * delta) \
+                + TREND_BASELINE_ALPHA * batch_var
+        self.batches += 1
+
+class TrendScorer:
+    """
+    Puts every source on a 0-100 scale: an item's signal is compared with its
+    source's rolling baseline (z-score of log signal, squashed with a logistic)
+    and decayed by the age of the data it came from.
+    """
+    
+    def __init__(self):
+        self.baselines: Dict[str, SourceBaseline] = {}
+    
+    def score(self, source: str, result: Dict[str, Any], items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not items:
+            return []
+        config = AGGREGATE_SOURCES[source]
+        logs = np.log1p(np.maximum(np.array([item["signal"] for item in items], dtype=np.float64), 0))
+        baseline = self.baselines.setdefault(source, SourceBaseline())
+        baseline.update(result.get("snapshot_version") or result.get("timestamp"), logs)
+        
+        z = (logs - baseline.mean) / np.sqrt(baseline.var + 0.25)
+        age_hours = (result.get("snapshot_age_seconds") or 0) / 3600
+        scores = 100 / (1 + np.exp(-z)) * 0.5 ** (age_hours / TREND_SCORE_HALF_LIFE_HOURS)
+        
+        scored = []
+        for item, item_z, item_score in zip(items, z.tolist(), scores.tolist()):
+            extras = {k: v for k, v in item.items() if k not in ("topic", "signal")}
+            scored.append({
+                "topic": item["topic"],
+                "score": round(item_score, 1),
+                "z_score": round(item_z, 2),
+                "trend_direction": extras.pop("trend_direction", None) or self.direction(source, item["topic"], item_z),
+                "source": config["item_source"],
+                "source_icon": config["icon"],
+                **extras
+            })
+        return scored
+    
+    @staticmethod
+    def direction(source: str, topic: str, z: float) -> str:
+        """From the topic's recorded day-over-day change when there is one, else from its baseline z-score"""
+        series = topic_series.get(topic, source, series_geo(source)) if source in TOPIC_COUNT_FIELDS else None
+        change = series_change(*series.view(), 86400) if series is not None else None
+        if change is not None:
+            return "rising" if change > 10 else "falling" if change < -10 else "stable"
+        return "rising" if z >= 1 else "stable"
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            source: {"mean_log_signal": round(b.mean, 3), "std_log_signal": round(b.var ** 0.5, 3), "batches": b.batches}
+            for source, b in self.baselines.items()
+        }
+
+trend_scorer = TrendScorer()
+
+class TrendRanker:
+    """
+    Merges scored items by topic across sources and keeps the k best in a
+    min-heap as each source's results arrive. A topic's merged score only
+    grows as sources are added (1 - prod(1 - score/100)), so an evicted topic
+    can only come back by beating the current minimum - each item costs
+    O(log k) whatever the number of sources and topics.
+    """
+    
+    def __init__(self, k: int):
+        self.k = k
+        self.topics: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[tuple] = []
+        self._members: Dict[str, float] = {}
+    
+    def add(self, items: List[Dict[str, Any]]):
+        for item in items:
+            key = trend_topic_key(item["topic"])
+            if not key:
+                continue
+            merged = self.topics.get(key)
+            if merged is None:
+                merged = self.topics[key] = {"best": item, "signals": {}}
+            elif item["score"] > merged["best"]["score"]:
+                merged["best"] = item
+            previous = merged["signals"].get(item["source"])
+            # Same topic twice from one source - keep its stronger item
+            if previous is not None and previous["score"] >= item["score"]:
+                continue
+            merged["signals"][item["source"]] = item
+            # Recomputed from the (few) sources rather than divided back out, so a
+            # source scoring 100 can be replaced without a near-zero division
+            miss = 1.0
+            for signal in merged["signals"].values():
+                miss *= 1 - min(max(signal["score"], 0), 100) / 100
+            self._offer(key, round(100 * (1 - miss), 1))
+    
+    def _offer(self, key: str, score: float):
+        heap = self._heap
+        if key in self._members:
+            # Already ranked - the older heap entry goes stale and is skipped later
+            self._members[key] = score
+            heapq.heappush(heap, (score, key))
+            if len(heap) > 2 * self.k + 16:
+                self._heap = [(s, k) for k, s in self._members.items()]
+                heapq.heapify(self._heap)
+            return
+        while heap and self._members.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        if len(self._members) < self.k:
+            heapq.heappush(heap, (score, key))
+            self._members[key] = score
+        elif score > heap[0][0]:
+            _, evicted = heapq.heapreplace(heap, (score, key))
+            del self._members[evicted]
+            self._members[key] = score
+    
+    def top(self) -> List[Dict[str, Any]]:
+        ranked = []
+        for key, score in sorted(self._members.items(), key=lambda kv: kv[1], reverse=True):
+            merged = self.topics[key]
+            best = merged["best"]
+            ranked.append({
+                "topic": best["topic"],
+                "score": score,
+                "trend_direction": best["trend_direction"],
+                "source": best["source"],
+                "source_icon": best["source_icon"],
+                "sources": list(merged["signals"]),
+                "signals": {
+                    source: {k: v for k, v in item.items() if k not in ("topic", "source", "source_icon")}
+                    for source, item in merged["signals"].items()
+                }
+            })
+        return ranked
+
+AGGREGATE_SOURCES = {
+    "google": {
+        "label": "Google Trends",
+        "response_key": "google_trends",
+        "timeout": 15.0,
+        "fetch": lambda timeframe, force: get_google_trends(timeframe=timeframe, force_refresh=force),
+        "normalize": normalize_google_trends,
+        "item_source": "Google Trends",
+        "icon": "📊"
+    },
+    "youtube": {
+        "label": "YouTube Data API",
+        "response_key": "youtube_trends",
+        "timeout": 10.0,
+        "fetch": lambda timeframe, force: get_youtube_trends(max_results=5, force_refresh=force),
+        "normalize": normalize_youtube_trends,
+        "item_source": "YouTube",
+        "icon": "🎬"
+    },
+    "reddit": {
+        "label": "Reddit RSS",
+        "response_key": "reddit_trends",
+        "timeout": 10.0,
+        "fetch": lambda timeframe, force: get_reddit_trends(limit=10, force_refresh=force),
+        "normalize": normalize_reddit_trends,
+        "item_source": "Reddit",
+        "icon": "🔴"
+    },
+    "pubmed": {
+        "label": "PubMed/NIH",
+        "response_key": "pubmed_trends",
+        "timeout": 10.0,
+        "fetch": lambda timeframe, force: get_pubmed_trends(days=30, max_results=10, force_refresh=force),
+        "normalize": normalize_pubmed_trends,
+        "item_source": "PubMed",
+        "icon": "🔬"
+    },
+    "news": {
+        "label": "News API",
+        "response_key": "news_trends",
+        "timeout": 10.0,
+        "fetch": lambda timeframe, force: get_health_news(days=7, max_results=10, force_refresh=force),
+        "normalize": normalize_news_trends,
+        "item_source": "Health News",
+        "icon": "📰"
+    },
+    "tiktok": {
+        "label": "TikTok (Free)",
+        "response_key": "tiktok_trends",
+        "timeout": 20.0,
+        "fetch": lambda timeframe, force: get_tiktok_trends(count=30, force_refresh=force),
+        "normalize": normalize_tiktok_trends,
+        "item_source": "TikTok",
+        "icon": "🎵"
+    },
+}
+
+# Source fetches that outlived their timeout keep running so their result
+# lands in the cache for the next request
+background_source_tasks: set = set()
+
+async def fetch_aggregate_source(name: str, timeframe: str, force: bool = False) -> Dict[str, Any]:
+    """Fetch one source within its own timeout and report how it went"""
+    source = AGGREGATE_SOURCES[name]
+    started = time.perf_counter()
+    task = asyncio.ensure_future(source["fetch"](timeframe, force))
+    
+    try:
+        result = await asyncio.wait_for(asyncio.shield(task), timeout=source["timeout"])
+        status = "error" if result.get("error") else "ok"
+        error = result.get("error")
+    except asyncio.TimeoutError:
+        background_source_tasks.add(task)
+        task.add_done_callback(background_source_tasks.discard)
+        result, status, error = None, "timeout", f"No response within {source['timeout']:g}s"
+    except asyncio.CancelledError:
+        background_source_tasks.add(task)
+        task.add_done_callback(background_source_tasks.discard)
+        raise
+    except Exception as e:
+        result, status, error = None, "error", str(e)
+    
+    if result is None:
+        result = {
+            "error": error,
+            "message": f"{source['label']} unavailable for this aggregate",
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    return {
+        "name": name,
+        "result": result,
+        "status": status,
+        "error": error,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "snapshot_age_seconds": result.get("snapshot_age_seconds")
+    }
+
+def deadline_exceeded_source(name: str, started: float) -> Dict[str, Any]:
+    """Outcome for a source still running when the aggregate deadline hit"""
+    return {
+        "name": name,
+        "result": {
+            "error": "deadline exceeded",
+            "message": f"{AGGREGATE_SOURCES[name]['label']} did not finish within {AGGREGATE_DEADLINE_SECONDS:g}s",
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        },
+        "status": "deadline",
+        "error": "deadline exceeded",
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "snapshot_age_seconds": None
+    }
+
+def source_status_entry(fetched: Dict[str, Any]) -> Dict[str, Any]:
+    entry = {"status": fetched["status"], "elapsed_ms": fetched["elapsed_ms"]}
+    if fetched["snapshot_age_seconds"] is not None:
+        entry["snapshot_age_seconds"] = fetched["snapshot_age_seconds"]
+    if fetched["error"]:
+        entry["error"] = fetched["error"]
+    return entry
+
+def scored_source_trends(fetched: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """A finished source's items on the common 0-100 scale (nothing for failed sources)"""
+    if fetched["status"] != "ok":
+        return []
+    name = fetched["name"]
+    return trend_scorer.score(name, fetched["result"], AGGREGATE_SOURCES[name]["normalize"](fetched["result"]))
+
+def oldest_snapshot_age(source_status: Dict[str, Dict[str, Any]]) -> Optional[int]:
+    ages = [info["snapshot_age_seconds"] for info in source_status.values() if "snapshot_age_seconds" in info]
+    return max(ages) if ages else None
+
 @app.get("/api/trends/aggregate")
-async def get_aggregate_trends(timeframe: str = "week"):
+async def get_aggregate_trends(timeframe: str = "week", force_refresh: bool = False):
     """
     Get aggregated trends from ALL sources - US focused
+    Sources are fetched concurrently; anything that misses its own timeout or
+    the overall deadline is reported as partial instead of holding the page.
+    Ingested sources answer from their latest snapshot unless force_refresh=true;
+    snapshot_age_seconds is the age of the oldest snapshot used
+    A story carried by several sources is listed once, under the first source
+    in DEDUP_SOURCE_ORDER, so per-source lists here can be shorter than (or
+    empty where) the per-source endpoints return items
     """
     try:
-        # Get Google Trends for top health topics
-        google_results = await get_google_trends(timeframe=timeframe)
-        
-        # Get YouTube trending for health
-        youtube_results = await get_youtube_trends(max_results=5)
-        
-        # Get Reddit trending
-        reddit_results = await get_reddit_trends(limit=10)
-        
-        # Extract trending topics from YouTube titles
-        youtube_topics = []
-        for video in youtube_results.get('videos', []):
-            youtube_topics.append({
-                "topic": video.get('title', '')[:50],
-                "views": video.get('views', 0),
-                "source": "YouTube",
-                "engagement": video.get('engagement_rate', 0)
-            })
-        
-        # Combine and rank
-        all_trends = []
-        
-        # Add Google Trends
-        for trend in google_results.get('trends', []):
-            all_trends.append({
-                "topic": trend['topic'],
-                "score": trend['interest_score'],
-                "trend_direction": trend['trend'],
-                "change_percent": trend['change_percent'],
-                "source": "Google Trends",
-                "source_icon": "📊"
-            })
-        
-        # Add top YouTube topics
-        for yt in youtube_topics[:3]:
-            all_trends.append({
-                "topic": yt['topic'],
-                "score": min(100, int(yt['views'] / 10000)),  # Normalize to 0-100
-                "trend_direction": "rising",
-                "views": yt['views'],
-                "source": "YouTube",
-                "source_icon": "🎬"
-            })
-        
-        # Add Reddit trending keywords
-        for kw in reddit_results.get('trending_keywords', [])[:3]:
-            all_trends.append({
-                "topic": kw['keyword'].title(),
-                "score": min(100, kw['count'] * 20),
-                "trend_direction": "rising",
-                "mentions": kw['count'],
-                "source": "Reddit",
-                "source_icon": "🔴"
-            })
-        
-        # Get PubMed trending research
-        pubmed_results = await get_pubmed_trends(days=30, max_results=10)
-        
-        # Add PubMed trending research topics
-        for research in pubmed_results.get('trending_research', [])[:3]:
-            all_trends.append({
-                "topic": research['topic'].title(),
-                "score": min(100, research['count'] * 25),
-                "trend_direction": "rising",
-                "publications": research['count'],
-                "source": "PubMed",
-                "source_icon": "🔬"
-            })
+        started = time.perf_counter()
+        tasks = {
+            name: asyncio.create_task(fetch_aggregate_source(name, timeframe, force_refresh))
+            for name in AGGREGATE_SOURCES
+        }
+        done, pending = await asyncio.wait(tasks.values(), timeout=AGGREGATE_DEADLINE_SECONDS)
+        for task in pending:
+            task.cancel()
         
-        # Get News trending topics
-        news_results = await get_health_news(days=7, max_results=10)
-        
-        # Add News trending topics
-        for news_topic in news_results.get('trending_topics', [])[:3]:
-            all_trends.append({
-                "topic": news_topic['topic'].title(),
-                "score": min(100, news_topic['count'] * 20),
-                "trend_direction": "rising",
-                "articles": news_topic['count'],
-                "source": "Health News",
-                "source_icon": "📰"
-            })
+        ranker = TrendRanker(AGGREGATE_TOP_K)
+        payloads = {}
+        source_status = {}
         
-        # Get TikTok trending hashtags (health-focused)
-        try:
-            tiktok_results = await get_tiktok_trends(count=30, force_refresh=False)
+        for name, task in tasks.items():
+            if task in done and not task.cancelled():
+                fetched = task.result()
+            else:
+                fetched = deadline_exceeded_source(name, started)
             
-            # Add top health/wellness TikTok trends
-            for hashtag in tiktok_results.get('trending_hashtags', [])[:3]:
-                all_trends.append({
-                    "topic": f"#{hashtag['hashtag']}",
-                    "score": min(100, hashtag['count'] * 10),
-                    "trend_direction": "viral",
-                    "video_count": hashtag['count'],
-                    "views": hashtag.get('total_views', 0),
-                    "source": "TikTok",
-                    "source_icon": "🎵"
-                })
-        except Exception as e:
-            logger.warning(f"TikTok trends unavailable in aggregate: {str(e)}")
+            payloads[name] = fetched["result"]
+            source_status[name] = source_status_entry(fetched)
+            ranker.add(scored_source_trends(fetched))
+        ranker.add(story_trends())
+        
+        partial_sources = [name for name, info in source_status.items() if info["status"] != "ok"]
+        tiktok_results = payloads.pop("tiktok")
+        # The same story from several sources is listed once, with duplicates/also_in
+        payloads, duplicates_removed = dedupe_source_payloads(payloads)
+        response = {AGGREGATE_SOURCES[name]["response_key"]: payload for name, payload in payloads.items()}
         
         return {
-            "trends": all_trends,
-            "google_trends": google_results,
-            "youtube_trends": youtube_results,
-            "reddit_trends": reddit_results,
-            "pubmed_trends": pubmed_results,
-            "news_trends": news_results,
-            "tiktok_health": tiktok_results.get('health_video_count', 0) if 'tiktok_results' in locals() else 0,
+            "trends": ranker.top(),
+            "topics_ranked": len(ranker.topics),
+            "duplicates_removed": duplicates_removed,
+            **response,
+            "tiktok_health": tiktok_results.get('health_video_count', 0),
             "timeframe": timeframe,
             "region": "US",
-            "sources": ["Google Trends", "YouTube Data API", "Reddit RSS", "PubMed/NIH", "News API", "TikTok (Free)"],
+            "sources": [source["label"] for source in AGGREGATE_SOURCES.values()],
+            "partial": bool(partial_sources),
+            "partial_sources": partial_sources,
+            "source_status": source_status,
+            "snapshot_age_seconds": oldest_snapshot_age(source_status),
+            "total_ms": round((time.perf_counter() - started) * 1000, 1),
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
@@ -2181,6 +5513,90 @@ async def get_aggregate_trends(timeframe: str = "week"):
         logger.error(f"Aggregate trends error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def stream_aggregate_events(timeframe: str, force: bool = False):
+    """Yield (event, payload) as each source completes (with the ranking so far), then the final ranking"""
+    started = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + AGGREGATE_DEADLINE_SECONDS
+    tasks = {
+        asyncio.create_task(fetch_aggregate_source(name, timeframe, force)): name
+        for name in AGGREGATE_SOURCES
+    }
+    pending = set(tasks)
+    ranker = TrendRanker(AGGREGATE_TOP_K)
+    source_status = {}
+    
+    def source_event(fetched: Dict[str, Any]) -> Dict[str, Any]:
+        name = fetched["name"]
+        trends = scored_source_trends(fetched)
+        ranker.add(trends)
+        source_status[name] = source_status_entry(fetched)
+        return {
+            "source": name,
+            "label": AGGREGATE_SOURCES[name]["label"],
+            **source_status[name],
+            "trends": trends,
+            # Running ranking so far, cheap to send with every source
+            "top": [{"topic": t["topic"], "score": t["score"]} for t in ranker.top()[:10]]
+        }
+    
+    try:
+        while pending:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield "source", source_event(task.result())
+        
+        for task in pending:
+            task.cancel()
+            yield "source", source_event(deadline_exceeded_source(tasks[task], started))
+        
+        ranker.add(story_trends())
+        partial_sources = [name for name, info in source_status.items() if info["status"] != "ok"]
+        yield "merged", {
+            "trends": ranker.top(),
+            "topics_ranked": len(ranker.topics),
+            "timeframe": timeframe,
+            "region": "US",
+            "partial": bool(partial_sources),
+            "partial_sources": partial_sources,
+            "source_status": source_status,
+            "snapshot_age_seconds": oldest_snapshot_age(source_status),
+            "total_ms": round((time.perf_counter() - started) * 1000, 1),
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    finally:
+        # Client went away mid-stream - stop waiting on the remaining sources
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+@app.get("/api/trends/aggregate/stream")
+async def stream_aggregate_trends(timeframe: str = "week", format: str = "sse", force_refresh: bool = False):
+    """
+    Streaming variant of /api/trends/aggregate
+    Emits a "source" event with each source's normalized trends as soon as it
+    completes, followed by a final "merged" event with the ranked list.
+    format: "sse" (text/event-stream) or "ndjson" (one JSON object per line)
+    """
+    if format not in ("sse", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'sse' or 'ndjson'")
+    
+    async def body():
+        async for event, payload in stream_aggregate_events(timeframe, force_refresh):
+            if format == "sse":
+                yield f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+            else:
+                yield json.dumps({"event": event, **payload}, default=str) + "\n"
+    
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream" if format == "sse" else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/api/trends/topics")
 async def get_tracked_topics():
     """Get list of health & wellness topics being tracked"""
@@ -2199,6 +5615,195 @@ async def get_tracked_topics():
         "region": "US"
     }
 
+@app.get("/api/trends/snapshots")
+async def get_trend_snapshots():
+    """Ingestion cadence, snapshot version/age and last refresh error per source"""
+    return {
+        "enabled": TREND_INGESTION_ENABLED,
+        "sources": trend_snapshots.status(),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+@app.get("/api/trends/history")
+async def get_topic_history(
+    topic: str = None,
+    source: str = "google",
+    geo: str = None,
+    days: int = 30,
+    resolution: str = "raw",
+    window: int = 24
+):
+    """
+    Stored history for one topic from one source, with change, peak and a
+    trailing moving average over `window` points. Without a topic, lists the
+    series available. resolution: raw, hour, day or week
+    """
+    if resolution not in TOPIC_SERIES_RESOLUTIONS:
+        raise HTTPException(status_code=400, detail=f"resolution must be one of {', '.join(TOPIC_SERIES_RESOLUTIONS)}")
+    
+    if not topic:
+        return {
+            "series": [
+                {"topic": key[0], "source": key[1], "geo": key[2], "points": series.size}
+                for key, series in topic_series.series.items()
+                if key[1] == source and (geo is None or key[2] == geo)
+            ],
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    geo = geo or series_geo(source)
+    series = topic_series.get(topic, source, geo)
+    if series is None:
+        return {"topic": topic, "source": source, "geo": geo, "points": [], "error": "No history recorded for this topic"}
+    
+    timestamps, values = series.range(start=time.time() - days * 86400)
+    timestamps, values = bucket_means(timestamps, values, TOPIC_SERIES_RESOLUTIONS[resolution])
+    averages = moving_average(values, max(1, window))
+    return {
+        "topic": topic,
+        "source": source,
+        "geo": geo,
+        "days": days,
+        "resolution": resolution,
+        "points": [
+            {
+                "t": datetime.fromtimestamp(t, tz=timezone.utc).isoformat(),
+                "value": round(v, 2),
+                "moving_average": round(a, 2)
+            }
+            for t, v, a in zip(timestamps.tolist(), values.tolist(), averages.tolist())
+        ],
+        "summary": series_summary(timestamps, values),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+@app.get("/api/trends/search")
+async def search_trend_items(q: str, source: str = None, days: int = None, sort: str = "relevance", limit: int = 20):
+    """
+    Search everything ingested so far (posts, articles, papers, videos,
+    podcasts) without calling upstream APIs. Every word must match; the last
+    one also matches as a prefix.
+    source: comma-separated (e.g. "reddit,news"); sort: relevance, recent or engagement
+    """
+    if sort not in TREND_SEARCH_SORTS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(TREND_SEARCH_SORTS)}")
+    if not trend_search.available:
+        return {"results": [], "error": "Search index unavailable", "timestamp": datetime.now(timezone.utc).isoformat()}
+    query = fts_query(q)
+    if not query:
+        return {"results": [], "error": "Query is empty", "timestamp": datetime.now(timezone.utc).isoformat()}
+    
+    started = time.perf_counter()
+    sources = [name.strip() for name in source.split(",") if name.strip()] if source else []
+    since = time.time() - days * 86400 if days else None
+    rows = await trend_search.search(query, sources, since, sort, max(1, min(limit, 100)))
+    for row in rows:
+        row["published"] = datetime.fromtimestamp(row["published"], tz=timezone.utc).isoformat() if row["published"] else None
+        row["relevance"] = round(-row["relevance"], 3)
+    return {
+        "query": q,
+        "results": rows,
+        "count": len(rows),
+        "sort": sort,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+@app.get("/api/trends/stories")
+async def get_trend_stories(min_sources: int = 2, limit: int = 20):
+    """
+    Near-duplicate clusters of ingested items: the same story across news,
+    Reddit, PubMed, newsletters, TikTok and YouTube, ranked by cross-source signal
+    """
+    return {
+        "stories": near_duplicates.stories(min_sources=min_sources, limit=limit),
+        "window_hours": DEDUP_WINDOW_HOURS,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+@app.get("/api/trends/emerging")
+async def get_emerging_terms(limit: int = 20, min_count: int = 3, include_known: bool = False):
+    """
+    Phrases (1-3 words) gaining fastest across ingested Reddit, news, PubMed,
+    newsletter and TikTok titles, including ones outside the keyword lists.
+    velocity = hourly rate over the recent hours vs the rest of the window
+    """
+    return {
+        "terms": emerging_terms.top(limit=limit, min_count=min_count, include_known=include_known),
+        "window_hours": EMERGING_WINDOW_HOURS,
+        "recent_hours": EMERGING_RECENT_HOURS,
+        "sources": EMERGING_SOURCES,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+@app.get("/api/trends/watchlist")
+async def get_trend_watchlist():
+    """Topics each producer is watching for spikes"""
+    return {"producers": trend_watchlist.producers, "timestamp": datetime.now(timezone.utc).isoformat()}
+
+@app.post("/api/trends/watchlist")
+async def set_trend_watchlist(request: Dict[str, Any]):
+    """
+    Register (or replace) a producer's watched topics
+    Body: {"producer": "storygrid", "topics": ["gut health", "creatine"]}
+    Spikes on these topics, from any source, are logged to workflow_events
+    """
+    producer = (request.get("producer") or "").strip()
+    topics = request.get("topics")
+    if not producer or not isinstance(topics, list):
+        raise HTTPException(status_code=400, detail="producer and a list of topics are required")
+    trend_watchlist.set(producer, [str(topic) for topic in topics])
+    await trend_watchlist.save()
+    return {
+        "producer": producer,
+        "topics": trend_watchlist.producers[producer],
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+@app.delete("/api/trends/watchlist/{producer}")
+async def delete_trend_watchlist(producer: str):
+    """Stop watching topics for a producer"""
+    if not trend_watchlist.remove(producer):
+        raise HTTPException(status_code=404, detail="Producer has no watchlist")
+    await trend_watchlist.save()
+    return {"message": f"Watchlist for {producer} removed", "timestamp": datetime.now(timezone.utc).isoformat()}
+
+@app.get("/api/trends/spikes")
+async def get_trend_spikes(producer: str = None, source: str = None, hours: int = 24):
+    """
+    Spikes flagged in the last `hours` (optionally one source, or one
+    producer's watched topics). With a producer, also returns the current
+    z-score of every series matching its watchlist.
+    """
+    await evaluate_spikes()
+    if producer is not None and producer not in trend_watchlist.producers:
+        raise HTTPException(status_code=404, detail="Producer has no watchlist")
+    
+    since = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
+    spikes = [
+        spike for spike in reversed(spike_detector.recent)
+        if spike["detected_at"] >= since
+        and (source is None or spike["source"] == source)
+        and (producer is None or producer in trend_watchlist.watchers(spike["topic"]))
+    ]
+    response = {"spikes": spikes, "count": len(spikes), "hours": hours}
+    
+    if producer is not None:
+        watched = trend_watchlist._keys[producer]
+        slots = [slot for slot, key in enumerate(spike_detector.keys) if trend_topic_key(key[0]) in watched]
+        response["watching"] = [
+            {
+                "topic": spike_detector.keys[slot][0],
+                "source": spike_detector.keys[slot][1],
+                "z_score": round(float(spike_detector.last_z[slot]), 2),
+                "baseline": round(float(spike_detector.mean[slot]), 2),
+                "points": int(spike_detector.count[slot])
+            }
+            for slot in slots
+        ]
+    response["timestamp"] = datetime.now(timezone.utc).isoformat()
+    return response
+
 @app.get("/api/trends/status")
 async def get_trends_source_status():
     """
@@ -2534,40 +6139,40 @@ Be specific, actionable, and focus on what Susan should do next."""
             try:
                 logger.info("Using OpenAI GPT-4o-mini for trend summary")
                 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        "https://api.openai.com/v1/chat/completions",
-                        headers={
-                            "Content-Type": "application/json",
-                            "Authorization": f"Bearer {openai_key}"
-                        },
-                        json={
-                            "model": "gpt-4o-mini",
-                            "messages": [{
-                                "role": "system",
-                                "content": "You are a health & wellness trend analyst helping content creator Susan. Provide concise, actionable insights."
-                            }, {
-                                "role": "user",
-                                "content": f"Analyze this health/wellness trend and provide a brief summary (3-4 sentences): {context}"
-                            }],
-                            "max_tokens": 250,
-                            "temperature": 0.7
-                        },
-                        timeout=30.0
-                    )
+                client = http_clients.get("openai")
+                response = await client.post(
+                    "https://api.openai.com/v1/chat/completions",
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {openai_key}"
+                    },
+                    json={
+                        "model": "gpt-4o-mini",
+                        "messages": [{
+                            "role": "system",
+                            "content": "You are a health & wellness trend analyst helping content creator Susan. Provide concise, actionable insights."
+                        }, {
+                            "role": "user",
+                            "content": f"Analyze this health/wellness trend and provide a brief summary (3-4 sentences): {context}"
+                        }],
+                        "max_tokens": 250,
+                        "temperature": 0.7
+                    },
+                    timeout=30.0
+                )
+                
+                if response.status_code == 200:
+                    data = response.json()
+                    summary = data['choices'][0]['message']['content']
+                    
+                    return {
+                        "summary": summary,
+                        "model": "gpt-4o-mini",
+                        "timestamp": datetime.now(timezone.utc).isoformat()
+                    }
+                else:
+                    raise HTTPException(status_code=response.status_code, detail="OpenAI API error")
                     
-                    if response.status_code == 200:
-                        data = response.json()
-                        summary = data['choices'][0]['message']['content']
-                        
-                        return {
-                            "summary": summary,
-                            "model": "gpt-4o-mini",
-                            "timestamp": datetime.now(timezone.utc).isoformat()
-                        }
-                    else:
-                        raise HTTPException(status_code=response.status_code, detail="OpenAI API error")
-                        
             except Exception as e:
                 logger.error(f"OpenAI API error: {e}")
                 raise HTTPException(status_code=500, detail=f"OpenAI error: {str(e)}")